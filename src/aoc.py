@@ -3,50 +3,397 @@ Main module for Advent of Code 2024
 """
 
 import argparse
+import contextlib
+import glob
+import json
 import os
+import sys
+import time
 from typing import Callable
 
+import instrument
+import render_config
+from generators import synthetic_input_path
+from profiling import PROFILE_MODES, profile
+from runner import (
+    REPORT_FORMATS,
+    RunResult,
+    format_import_profile,
+    format_report,
+    format_stats_report,
+    format_table,
+    get_solver,
+    input_path,
+    iter_many,
+    parse_range,
+    profile_imports,
+    run_both,
+    run_limited,
+    run_many,
+    run_part,
+    split_stored,
+    store_results,
+)
+from server import SOCKET_PATH, serve
+from store import CHANGED, AnswerStore
+from watch import watch
+
 
 def run_day(day_index: int, part: int) -> Callable:
     """'
     Programmatically run the challenge for the given day and part.
     """
-
-    # check that the module exists
-    if not os.path.exists(f"src/day_{day_index}.py"):
-        raise ValueError(f"Day {day_index} module not found.")
-
-    module = __import__(f"day_{day_index}")
-    if part == 1:
-        return module.part_1
-    elif part == 2:
-        return module.part_2
-    else:
-        raise ValueError("Invalid part selected.")
+    return get_solver(day_index, part)
 
 
 if __name__ == "__main__":
     argsparse = argparse.ArgumentParser()
-    argsparse.add_argument(
-        "--day", type=int, help="The day of the challenge to run.", required=True
-    )
+    argsparse.add_argument("--day", type=int, help="The day of the challenge to run.")
     argsparse.add_argument(
         "--test",
         help="Run the test cases for the challenge.",
         action="store_true",
     )
     argsparse.add_argument(
-        "--part", type=int, help="The part of the challenge to run.", required=True
+        "--part",
+        choices=["1", "2", "both"],
+        help="The part of the challenge to run, both parts share one parsed input.",
+    )
+    argsparse.add_argument(
+        "--all", help="Run every day and part of the challenge.", action="store_true"
+    )
+    argsparse.add_argument(
+        "--days", type=str, help="The days to run, for example 1-25 or 1,3,5."
+    )
+    argsparse.add_argument(
+        "--parts", type=str, default="1,2", help="The parts to run, for example 1,2."
+    )
+    argsparse.add_argument(
+        "--inputs",
+        type=str,
+        help=(
+            "Run --day on every input file matching this glob, for example "
+            "'inputs/**/day_6_*.txt', and print one JSON line per result."
+        ),
+    )
+    argsparse.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="The number of worker processes used by --all, --days, --inputs and --serve.",
+    )
+    argsparse.add_argument(
+        "--scale",
+        type=int,
+        help="Run on a synthetic input of the given scale instead of the puzzle input.",
+    )
+    argsparse.add_argument(
+        "--seed", type=int, default=0, help="The seed of the synthetic input."
+    )
+    argsparse.add_argument(
+        "--import-profile",
+        help="Report the import time of the modules of the selected days.",
+        action="store_true",
+    )
+    argsparse.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        help="Profile the CPU time or the memory allocations of --day and --part.",
+    )
+    argsparse.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="The number of functions or allocation sites reported by --profile.",
+    )
+    argsparse.add_argument(
+        "--profile-output",
+        type=str,
+        help="Dump the cProfile stats or the tracemalloc snapshot to this path.",
+    )
+
+    argsparse.add_argument(
+        "--render",
+        choices=render_config.RENDER_MODES,
+        help="Draw the grids of the solvers on the terminal or write them as images.",
+    )
+    argsparse.add_argument(
+        "--render-dir",
+        type=str,
+        default=render_config.RENDER_DIR,
+        help="The directory of the images written by --render png.",
+    )
+    argsparse.add_argument(
+        "--report",
+        choices=REPORT_FORMATS,
+        help="Print one JSON or CSV record per day and part with the time of each phase.",
+    )
+    argsparse.add_argument(
+        "--stats",
+        help="Print the hot-path counters and timers recorded by the solvers.",
+        action="store_true",
+    )
+
+    argsparse.add_argument(
+        "--timeout",
+        type=float,
+        help="Stop each solver after this many seconds and report it as TIMEOUT.",
+    )
+    argsparse.add_argument(
+        "--max-rss",
+        type=int,
+        help="Stop each solver above this memory usage in MB and report it as OOM.",
+    )
+    argsparse.add_argument(
+        "--max-memory",
+        type=str,
+        help=(
+            "Memory budget of the solvers with an external-memory mode, for "
+            "example 512M. Larger inputs are streamed through temporary files."
+        ),
+    )
+    argsparse.add_argument(
+        "--use-cache",
+        help="Answer from the answer store when the input and solver are unchanged.",
+        action="store_true",
+    )
+    argsparse.add_argument(
+        "--verify",
+        help="Recompute the answers and compare them with the answer store.",
+        action="store_true",
+    )
+    argsparse.add_argument(
+        "--watch",
+        help="Solve --day again each time its input file changes.",
+        action="store_true",
+    )
+    argsparse.add_argument(
+        "--serve",
+        help="Start a daemon answering solve requests sent by src/client.py.",
+        action="store_true",
+    )
+    argsparse.add_argument(
+        "--socket",
+        type=str,
+        default=SOCKET_PATH,
+        help="The Unix socket the daemon listens on.",
     )
 
     args = argsparse.parse_args()
-    day = args.day
-    part = args.part
     test = args.test
+    max_rss = args.max_rss * 1024**2 if args.max_rss else None
+    limited = args.timeout is not None or max_rss is not None
+
+    if args.render:
+        render_config.configure(args.render, args.render_dir)
+
+    if args.max_memory:
+        # external pulls in numpy, which the other runs may not need
+        from external import MAX_MEMORY_ENV, parse_size
+
+        try:
+            parse_size(args.max_memory)
+        except ValueError as exception:
+            argsparse.error(str(exception))
+        # read by the solvers, including the ones of the worker processes
+        os.environ[MAX_MEMORY_ENV] = args.max_memory
+
+    def get_input_path(day: int) -> str:
+        if args.scale is not None:
+            return synthetic_input_path(day, args.scale, args.seed)
+        return input_path(day, test)
+
+    def run_tasks(
+        tasks: list[tuple[int, int, str]],
+        run: Callable[[list[tuple[int, int, str]]], list[RunResult]],
+    ) -> list[RunResult]:
+        """
+        Answer the tasks from the answer store with --use-cache and run the others,
+        then record their answers with --use-cache or --verify.
+        """
+        with contextlib.ExitStack() as stack:
+            store = None
+            if args.use_cache or args.verify:
+                store = stack.enter_context(AnswerStore())
+
+            results: list[RunResult] = []
+            pending = tasks
+            if store is not None and not args.verify:
+                results, pending = split_stored(tasks, store)
+            if pending:
+                results += run(pending)
+            results.sort(key=lambda result: (result.day, result.part))
+
+            if store is not None:
+                store_results(results, store, verify=args.verify)
+
+        return results
+
+    if args.serve:
+        serve(args.socket, jobs=args.jobs)
+
+    elif args.import_profile:
+        if args.day is not None:
+            days = [args.day]
+        else:
+            days = parse_range(args.days) if args.days else list(range(1, 26))
+
+        print(format_import_profile({day: profile_imports(day) for day in days}))
+
+    elif args.watch:
+        if args.day is None:
+            argsparse.error("--day is required with --watch.")
+
+        if args.part == "both":
+            parts = [1, 2]
+        else:
+            parts = [int(args.part)] if args.part else parse_range(args.parts)
+
+        watch(args.day, parts, get_input_path(args.day), stats=args.stats)
+
+    elif args.inputs:
+        if args.day is None:
+            argsparse.error("--day is required with --inputs.")
+
+        file_paths = sorted(glob.glob(args.inputs, recursive=True))
+        if not file_paths:
+            argsparse.error(f"No input file matches {args.inputs}")
+
+        if args.part == "both":
+            parts = [1, 2]
+        else:
+            parts = [int(args.part)] if args.part else parse_range(args.parts)
+
+        tasks = [(args.day, part, path) for path in file_paths for part in parts]
+        for result in iter_many(tasks, args.jobs, args.timeout, max_rss):
+            print(json.dumps(result.to_dict()), flush=True)
+
+    elif args.all or args.days:
+        days = parse_range(args.days) if args.days else list(range(1, 26))
+        parts = parse_range(args.parts)
+
+        tasks = [(day, part, get_input_path(day)) for day in days for part in parts]
+        for _, _, file_path in tasks:
+            if not os.path.exists(file_path):
+                raise ValueError(f"File not found: {file_path}")
+
+        start = time.perf_counter()
+        results = run_tasks(
+            tasks, lambda pending: run_many(pending, args.jobs, args.timeout, max_rss)
+        )
+
+        if args.report:
+            print(format_report(results, args.report))
+        else:
+            print(format_table(results))
+            print(f"\nTotal wall time: {time.perf_counter() - start:.3f}s")
+            if args.stats:
+                print(f"\n{format_stats_report(results)}")
+        if any(result.status == CHANGED for result in results):
+            sys.exit(1)
+
+    else:
+        if args.day is None or args.part is None:
+            argsparse.error("--day and --part are required without --all or --days.")
+
+        day = args.day
+        file_path = get_input_path(day)
+
+        if not os.path.exists(file_path):
+            raise ValueError(f"File not found: {file_path}")
+
+        if args.part == "both":
+            if args.profile:
+                argsparse.error("--profile requires --part 1 or --part 2.")
+
+            def run_parts(pending: list[tuple[int, int, str]]) -> list[RunResult]:
+                if limited:
+                    # the limited runs each get their own process and parse
+                    return run_many(pending, 2, args.timeout, max_rss)
+                _, results = run_both(day, file_path)
+                pending_parts = {part for _, part, _ in pending}
+                return [result for result in results if result.part in pending_parts]
+
+            start = time.perf_counter()
+            results = run_tasks([(day, 1, file_path), (day, 2, file_path)], run_parts)
+
+            if args.report:
+                print(format_report(results, args.report))
+            else:
+                print(format_table(results))
+                parse_time = max(
+                    (result.phases or {}).get("parse", 0.0) for result in results
+                )
+                print(f"\nParse time: {parse_time:.3f}s")
+                print(f"Total wall time: {time.perf_counter() - start:.3f}s")
+                if args.stats:
+                    print(f"\n{format_stats_report(results)}")
+            if any(result.status == CHANGED for result in results):
+                sys.exit(1)
+
+        elif args.profile:
+            part = int(args.part)
+            answer, report = profile(
+                args.profile,
+                run_day(day, part),
+                file_path,
+                top=args.top,
+                output=args.profile_output,
+            )
+            print(report)
+            if args.profile_output:
+                print(f"Profile written to {args.profile_output}\n")
+            print(answer)
+
+        elif args.report:
+            part = int(args.part)
+
+            def run_single(pending: list[tuple[int, int, str]]) -> list[RunResult]:
+                if limited:
+                    return [run_limited(*pending[0], args.timeout, max_rss)]
+                return [run_part(*pending[0])]
+
+            results = run_tasks([(day, part, file_path)], run_single)
+            print(format_report(results, args.report))
+            if any(result.status == CHANGED for result in results):
+                sys.exit(1)
+
+        else:
+            part = int(args.part)
+            store = AnswerStore() if args.use_cache or args.verify else None
+            stored = None
+            if store is not None and not args.verify:
+                stored = store.get(day, part, file_path)
+
+            instrument.reset()
+            stats = None
+            if stored is not None:
+                answer, _ = stored
+            elif limited:
+                result = run_limited(day, part, file_path, args.timeout, max_rss)
+                if result.error:
+                    sys.exit(f"{result.status or 'ERROR'}: {result.error}")
+                answer, runtime = result.answer, result.wall_time
+                stats = result.stats
+            else:
+                start = time.perf_counter()
+                answer = run_day(day, part)(file_path)
+                runtime = time.perf_counter() - start
+                if args.render:
+                    import render
 
-    file_path = f"inputs/day_{day}_input" + ("_test" if test else "") + ".txt"
+                    render.flush()
+            print(answer)
 
-    if not os.path.exists(file_path):
-        raise ValueError(f"File not found: {file_path}")
+            if args.stats:
+                # the counters of a limited run were recorded in its child process
+                print(instrument.format_stats(stats or instrument.get_stats()))
 
-    print(run_day(day, part)(file_path))
+            if store is not None:
+                if stored is None and answer is not None:
+                    status = store.put(day, part, file_path, str(answer), runtime)
+                    if args.verify:
+                        print(f"Verify: {status}")
+                    if status == CHANGED:
+                        sys.exit(1)
+                store.close()
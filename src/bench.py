@@ -0,0 +1,520 @@
+"""
+Benchmark suite for the daily solvers.
+
+Run it with `python -m src.bench` from the root of the repository. Each solver is
+run several times in a fresh process on the real and test inputs; the min, median
+and p95 wall times and the peak RSS are written to a JSON report.
+
+With `--scale N`, the solvers are also run on the synthetic inputs of
+`src/generators.py` to measure how they scale.
+
+With `--kernels N`, the graph search kernels of `src/search.py` are also timed on
+an N x N maze.
+
+With `--long-reports N`, the safety checks of day 2 are also timed on reports of N
+levels, with the speedup of the Problem Dampener over the previous quadratic one.
+
+With `--compare baseline.json`, the run fails when the median time of a solver is
+slower than the baseline by more than `--max-slowdown` percent.
+
+The answers are recorded in the answer store of `src/store.py`, and the run fails
+when an answer differs from the one stored last for the same input.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import pathlib
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+
+import day_2
+import search
+from generators import generate_day_16, synthetic_input_path
+from grid import Grid
+from runner import get_solver, input_path, parse_range
+from store import CHANGED, AnswerStore
+
+INPUT_KINDS = ["real", "test", "synthetic"]
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    """
+    Return the nearest-rank percentile of the values.
+
+    >>> percentile([1.0, 2.0, 3.0, 4.0], 0.95)
+    4.0
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(ratio * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _benchmark_case(day: int, part: int, file_path: str, repeat: int) -> dict:
+    """
+    Run a solver `repeat` times and return its timings, or the error it raised.
+    This function runs in a fresh child process so the peak RSS only accounts for
+    this solver.
+    """
+
+    timings, answer = [], None
+
+    try:
+        solver = get_solver(day, part)
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                answer = solver(file_path)
+                timings.append(time.perf_counter() - start)
+    except Exception as exception:
+        return {"error": f"{type(exception).__name__}: {exception}"}
+
+    # ru_maxrss is expressed in kilobytes on Linux and in bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+
+    return {
+        "answer": str(answer),
+        "timings": timings,
+        "peak_rss_kb": peak_rss,
+    }
+
+
+def benchmark(
+    day: int,
+    part: int,
+    kind: str,
+    repeat: int,
+    scale: int = 0,
+    seed: int = 0,
+    store: Optional[AnswerStore] = None,
+) -> dict | None:
+    """
+    Benchmark a single solver on the real, test or synthetic input.
+    Returns None when the input file is missing. The answer is recorded in the
+    store, if any, and checked against the answer stored last for this input.
+    A solver that raises gives a result with its error and without timings.
+    """
+
+    if kind == "synthetic":
+        file_path = synthetic_input_path(day, scale, seed)
+    else:
+        file_path = input_path(day, test=kind == "test")
+    if not os.path.exists(file_path):
+        return None
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        future = executor.submit(_benchmark_case, day, part, file_path, repeat)
+        try:
+            case = future.result()
+        except Exception as exception:
+            # the child process died, for example killed by the OOM killer
+            case = {"error": f"{type(exception).__name__}: {exception}"}
+
+    result: dict[str, Any] = {
+        "day": day,
+        "part": part,
+        "input": kind,
+        "scale": scale if kind == "synthetic" else None,
+        "repeat": repeat,
+    }
+    if "error" in case:
+        result["error"] = case["error"]
+        return result
+
+    timings = case["timings"]
+    result |= {
+        "answer": case["answer"],
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "p95": percentile(timings, 0.95),
+        "peak_rss_kb": case["peak_rss_kb"],
+    }
+    if store is not None:
+        result["answer_status"] = store.put(
+            day, part, file_path, case["answer"], result["median"]
+        )
+
+    return result
+
+
+def _maze_kernels(grid: Grid) -> dict[str, Callable[[], Any]]:
+    """
+    Return the search kernels to time on a maze, each wrapped in a function
+    without arguments. The weighted kernels run on the states of day 16 made of a
+    cell and a direction, where turning costs 1000.
+    """
+
+    data, offsets, wall = grid.data, grid.offsets, ord("#")
+    n_cells = len(data)
+    start, end = grid.find("S")[0], grid.find("E")[0]
+    end_row, end_col = grid.coords(end)
+
+    def neighbours(cell: int) -> list[int]:
+        return [cell + offset for offset in offsets if data[cell + offset] != wall]
+
+    def edges_01(cell: int) -> list[tuple[int, int]]:
+        return [(neighbour, neighbour & 1) for neighbour in neighbours(cell)]
+
+    def unit_edges(cell: int) -> list[tuple[int, int]]:
+        return [(neighbour, 1) for neighbour in neighbours(cell)]
+
+    def reindeer_edges(state: int) -> list[tuple[int, int]]:
+        cell, direction = divmod(state, 4)
+        moves = [(cell * 4 + (direction + 1) % 4, 1000)]
+        moves.append((cell * 4 + (direction - 1) % 4, 1000))
+        if data[cell + offsets[direction]] != wall:
+            moves.append(((cell + offsets[direction]) * 4 + direction, 1))
+        return moves
+
+    def manhattan(cell: int) -> int:
+        row, col = grid.coords(cell)
+        return abs(row - end_row) + abs(col - end_col)
+
+    return {
+        "bfs": lambda: search.bfs(n_cells, [start], neighbours),
+        "bfs_01": lambda: search.bfs_01(n_cells, [start], edges_01),
+        "dijkstra": lambda: search.dijkstra(
+            4 * n_cells, [4 * start + 1], reindeer_edges
+        ),
+        "dijkstra_all_predecessors": lambda: search.dijkstra_all_predecessors(
+            4 * n_cells, [4 * start + 1], reindeer_edges
+        ),
+        "astar": lambda: search.astar(n_cells, start, end, unit_edges, manhattan),
+    }
+
+
+def benchmark_kernels(size: int, repeat: int, seed: int = 0) -> list[dict]:
+    """
+    Time the search kernels on a `size` x `size` maze with loops.
+    """
+
+    grid = Grid.from_str(generate_day_16(size, seed), border=ord("#"))
+
+    results = []
+    for name, kernel in _maze_kernels(grid).items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            kernel()
+            timings.append(time.perf_counter() - start)
+
+        results.append(
+            {
+                "kernel": name,
+                "size": size,
+                "repeat": repeat,
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "p95": percentile(timings, 0.95),
+            }
+        )
+
+    return results
+
+
+def _long_reports(levels: int, seed: int = 0) -> dict[str, list[int]]:
+    """
+    Return increasing reports of the given number of levels: a safe one, one made
+    safe by removing a level near its end, and one with two unsafe levels.
+    """
+
+    rng = random.Random(seed)
+    safe = [0]
+    for _ in range(levels - 1):
+        safe.append(safe[-1] + rng.randint(1, 3))
+
+    dampened, unsafe = safe.copy(), safe.copy()
+    dampened[-3] += 10
+    unsafe[levels // 2] += 10
+    unsafe[-3] += 10
+    return {"safe": safe, "dampened": dampened, "unsafe": unsafe}
+
+
+def _is_safe_with_dampener_reference(report: list[int]) -> bool:
+    """
+    Previous Problem Dampener of day 2, which checks a copy of the report without
+    each level in turn, in quadratic time. Kept to measure the linear one against.
+    """
+
+    return day_2.is_safe(report) or any(
+        day_2.is_safe(report[:i] + report[i + 1 :]) for i in range(len(report))
+    )
+
+
+def benchmark_reports(levels: int, repeat: int, seed: int = 0) -> list[dict]:
+    """
+    Time the safety checks of day 2 on long reports, see `_long_reports`, and the
+    previous Problem Dampener as a reference for the speedup of the current one.
+    """
+
+    checks: dict[str, Callable[[list[int]], bool]] = {
+        "is_safe": day_2.is_safe,
+        "is_safe_with_dampener": day_2.is_safe_with_dampener,
+        "is_safe_with_dampener_reference": _is_safe_with_dampener_reference,
+    }
+
+    results = []
+    for name, report in _long_reports(levels, seed).items():
+        medians = {}
+        for check_name, check in checks.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                check(report)
+                timings.append(time.perf_counter() - start)
+
+            medians[check_name] = statistics.median(timings)
+            results.append(
+                {
+                    "kernel": f"{check_name}[{name}]",
+                    "size": levels,
+                    "repeat": repeat,
+                    "min": min(timings),
+                    "median": medians[check_name],
+                    "p95": percentile(timings, 0.95),
+                }
+            )
+
+        # the entry of the current dampener is the second to last one
+        reference = medians["is_safe_with_dampener_reference"]
+        current = medians["is_safe_with_dampener"]
+        results[-2]["speedup"] = reference / current if current > 0 else math.inf
+
+    return results
+
+
+def compare(report: dict, baseline: dict, max_slowdown: float) -> list[str]:
+    """
+    Compare the median times of a report against a baseline.
+    Returns a message for every solver that is slower than allowed.
+    """
+
+    def key_of(result: dict) -> tuple:
+        if "kernel" in result:
+            return ("kernel", result["kernel"], result["size"])
+        return (result["day"], result["part"], result["input"], result.get("scale"))
+
+    def name_of(result: dict) -> str:
+        if "kernel" in result and result["kernel"].startswith("is_safe"):
+            return f"Kernel {result['kernel']} ({result['size']} levels)"
+        if "kernel" in result:
+            return f"Kernel {result['kernel']} ({result['size']}x{result['size']})"
+        return f"Day {result['day']} part {result['part']} ({result['input']})"
+
+    def entries(report: dict) -> list[dict]:
+        results = report["results"] + report.get("kernels", [])
+        return [result for result in results if "error" not in result]
+
+    reference = {key_of(result): result for result in entries(baseline)}
+
+    regressions = []
+    for result in entries(report):
+        key = key_of(result)
+        if key not in reference:
+            continue
+
+        before, after = reference[key]["median"], result["median"]
+        slowdown = 100 * (after - before) / before if before > 0 else 0.0
+        if slowdown > max_slowdown:
+            regressions.append(
+                f"{name_of(result)}: {before:.4f}s -> {after:.4f}s ({slowdown:+.1f}%)"
+            )
+
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    if report["results"]:
+        lines.append(
+            f"{'Day':>3} {'Part':>4} {'Input':<9} {'Scale':>8} {'Min (s)':>9} "
+            f"{'Median (s)':>10} {'p95 (s)':>9} {'RSS (MB)':>9}"
+        )
+    for result in report["results"]:
+        if "error" in result:
+            lines.append(
+                f"{result['day']:>3} {result['part']:>4} {result['input']:<9} "
+                f"{result.get('scale') or '':>8} {result['error']}"
+            )
+            continue
+        lines.append(
+            f"{result['day']:>3} {result['part']:>4} {result['input']:<9} "
+            f"{result.get('scale') or '':>8} "
+            f"{result['min']:>9.4f} {result['median']:>10.4f} {result['p95']:>9.4f} "
+            f"{result['peak_rss_kb'] / 1024:>9.1f}"
+        )
+    if report.get("kernels"):
+        if lines:
+            lines.append("")
+        lines.append(
+            f"{'Kernel':<42} {'Size':>6} {'Min (s)':>9} {'Median (s)':>10} "
+            f"{'p95 (s)':>9} {'Speedup':>8}"
+        )
+        for result in report["kernels"]:
+            speedup = f"{result['speedup']:.1f}x" if "speedup" in result else ""
+            lines.append(
+                f"{result['kernel']:<42} {result['size']:>6} {result['min']:>9.4f} "
+                f"{result['median']:>10.4f} {result['p95']:>9.4f} {speedup:>8}"
+            )
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argsparse = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    argsparse.add_argument(
+        "--days",
+        type=str,
+        help="The days to benchmark, all of them unless --kernels or --long-reports is given.",
+    )
+    argsparse.add_argument(
+        "--parts", type=str, default="1,2", help="The parts to benchmark."
+    )
+    argsparse.add_argument(
+        "--inputs",
+        type=str,
+        default="real,test",
+        help="The inputs to benchmark: real, test, synthetic or a combination.",
+    )
+    argsparse.add_argument(
+        "--scale",
+        type=int,
+        help="The scale of the synthetic inputs, which adds them to --inputs.",
+    )
+    argsparse.add_argument(
+        "--seed", type=int, default=0, help="The seed of the synthetic inputs."
+    )
+    argsparse.add_argument(
+        "--kernels",
+        type=int,
+        help="Time the graph search kernels on a maze of the given side.",
+    )
+    argsparse.add_argument(
+        "--long-reports",
+        type=int,
+        help="Time the safety checks of day 2 on reports of the given length.",
+    )
+    argsparse.add_argument(
+        "--repeat", type=int, default=5, help="The number of runs of each solver."
+    )
+    argsparse.add_argument(
+        "--output",
+        type=str,
+        default="bench_report.json",
+        help="The path of the JSON report.",
+    )
+    argsparse.add_argument(
+        "--compare", type=str, help="The path of a baseline JSON report."
+    )
+    argsparse.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=10.0,
+        help="The allowed slowdown against the baseline, in percent.",
+    )
+    args = argsparse.parse_args(argv)
+
+    kinds = [kind.strip() for kind in args.inputs.split(",")]
+    for kind in kinds:
+        if kind not in INPUT_KINDS:
+            argsparse.error(f"Invalid input kind: {kind}")
+    if args.scale is not None and "synthetic" not in kinds:
+        kinds.append("synthetic")
+    if "synthetic" in kinds and args.scale is None:
+        argsparse.error("--scale is required to benchmark synthetic inputs.")
+
+    if args.days is None:
+        args.days = "" if args.kernels or args.long_reports else "1-25"
+
+    results = []
+    with AnswerStore() as store:
+        for day in parse_range(args.days):
+            for part in parse_range(args.parts):
+                for kind in kinds:
+                    result = benchmark(
+                        day,
+                        part,
+                        kind,
+                        args.repeat,
+                        scale=args.scale or 0,
+                        seed=args.seed,
+                        store=store,
+                    )
+                    if result is not None:
+                        results.append(result)
+
+    report: dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.kernels or args.long_reports:
+        report["kernels"] = []
+    if args.kernels:
+        report["kernels"] += benchmark_kernels(args.kernels, args.repeat, args.seed)
+    if args.long_reports:
+        report["kernels"] += benchmark_reports(
+            args.long_reports, args.repeat, args.seed
+        )
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    print(format_report(report))
+    print(f"\nReport written to {args.output}")
+
+    exit_code = 0
+
+    changed = [result for result in results if result.get("answer_status") == CHANGED]
+    if changed:
+        print("\nAnswers that differ from the answer store:")
+        for result in changed:
+            print(
+                f"Day {result['day']} part {result['part']} ({result['input']}): "
+                f"{result['answer']}"
+            )
+        exit_code = 1
+
+    failed = [result for result in results if "error" in result]
+    if failed:
+        print("\nSolvers that raised an error:")
+        for result in failed:
+            print(
+                f"Day {result['day']} part {result['part']} ({result['input']}): "
+                f"{result['error']}"
+            )
+        exit_code = 1
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            baseline = json.load(file)
+
+        regressions = compare(report, baseline, args.max_slowdown)
+        if regressions:
+            print(f"\nSlower than {args.compare} by more than {args.max_slowdown}%:")
+            print("\n".join(regressions))
+            exit_code = 1
+        else:
+            print(f"\nNo regression against {args.compare}.")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
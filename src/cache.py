@@ -0,0 +1,117 @@
+"""
+On-disk cache of parsed inputs.
+
+Decorate a parser with `@cached_parse(version=1)` to store the structure it returns
+in `.aoc_cache/parsed/`. The cache key is made of the SHA-256 of the content of the
+input file, the name and version of the parser and its other arguments, so that both
+parts of a day and repeated benchmark runs only parse a given input once.
+
+Bump the version of a parser whenever the structure it returns changes. Set
+`AOC_PARSE_CACHE=0` to bypass the cache. The cached parsers are timed as the parse
+phase of the solver, see `instrument.phase`.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from typing import Any, Callable
+
+from instrument import phase
+
+PARSE_CACHE_DIR = ".aoc_cache/parsed"
+
+
+def parse_cache_enabled() -> bool:
+    return os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Return the SHA-256 of the content of a file.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_path(parser: Callable, version: int, file_path: str, extra: dict) -> str:
+    key = hashlib.sha256(
+        "|".join(
+            [
+                file_digest(file_path),
+                parser.__module__,
+                parser.__qualname__,
+                str(version),
+                repr(sorted(extra.items())),
+            ]
+        ).encode()
+    ).hexdigest()
+    return os.path.join(PARSE_CACHE_DIR, f"{key}.pickle")
+
+
+def _load(cache_path: str) -> tuple[bool, Any]:
+    try:
+        with open(cache_path, "rb") as file:
+            return True, pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return False, None
+
+
+def _store(cache_path: str, value: Any) -> None:
+    """
+    Write the pickle to a temporary file first so that concurrent runs never read
+    a partial file.
+    """
+    os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(dir=PARSE_CACHE_DIR)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        os.unlink(temporary_path)
+
+
+def cached_parse(version: int = 1) -> Callable[[Callable], Callable]:
+    """
+    Cache the result of a parser taking a `file_path` argument.
+    The parser must return a picklable value. Put `@classmethod` above this
+    decorator for alternative constructors.
+    """
+
+    def decorator(parser: Callable) -> Callable:
+        signature = inspect.signature(parser)
+
+        @functools.wraps(parser)
+        @phase("parse")
+        def wrapper(*args, **kwargs):
+            if not parse_cache_enabled():
+                return parser(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            extra = {
+                name: value
+                for name, value in bound.arguments.items()
+                if name not in ("cls", "self", "file_path")
+            }
+
+            cache_path = _cache_path(
+                parser, version, bound.arguments["file_path"], extra
+            )
+            found, value = _load(cache_path)
+            if found:
+                return value
+
+            value = parser(*args, **kwargs)
+            _store(cache_path, value)
+            return value
+
+        return wrapper
+
+    return decorator
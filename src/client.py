@@ -0,0 +1,92 @@
+"""
+Thin client of the solver daemon started with `python src/aoc.py --serve`.
+
+It accepts the same options as `aoc.py` to select the days, parts and inputs, and
+sends them to the daemon instead of importing and running the solvers.
+"""
+
+import argparse
+import os
+import sys
+
+from runner import RunResult, format_table, input_path, parse_range
+from server import SOCKET_PATH, request, shutdown
+
+if __name__ == "__main__":
+    argsparse = argparse.ArgumentParser()
+    argsparse.add_argument("--day", type=int, help="The day of the challenge to run.")
+    argsparse.add_argument(
+        "--test",
+        help="Run the test cases for the challenge.",
+        action="store_true",
+    )
+    argsparse.add_argument("--part", type=int, help="The part of the challenge to run.")
+    argsparse.add_argument(
+        "--all", help="Run every day and part of the challenge.", action="store_true"
+    )
+    argsparse.add_argument(
+        "--days", type=str, help="The days to run, for example 1-25 or 1,3,5."
+    )
+    argsparse.add_argument(
+        "--parts", type=str, default="1,2", help="The parts to run, for example 1,2."
+    )
+    argsparse.add_argument(
+        "--scale",
+        type=int,
+        help="Run on a synthetic input of the given scale instead of the puzzle input.",
+    )
+    argsparse.add_argument(
+        "--seed", type=int, default=0, help="The seed of the synthetic input."
+    )
+    argsparse.add_argument(
+        "--socket", type=str, default=SOCKET_PATH, help="The socket of the daemon."
+    )
+    argsparse.add_argument("--stop", help="Stop the daemon.", action="store_true")
+
+    args = argsparse.parse_args()
+
+    def get_input_path(day: int) -> str:
+        if args.scale is not None:
+            from generators import synthetic_input_path
+
+            return synthetic_input_path(day, args.scale, args.seed)
+        return input_path(day, args.test)
+
+    if args.stop:
+        shutdown(args.socket)
+
+    elif args.all or args.days:
+        days = parse_range(args.days) if args.days else list(range(1, 26))
+        parts = parse_range(args.parts)
+
+        tasks = [(day, part, get_input_path(day)) for day in days for part in parts]
+        for _, _, file_path in tasks:
+            if not os.path.exists(file_path):
+                raise ValueError(f"File not found: {file_path}")
+
+        # the error responses of the server carry neither the task nor its timings
+        results = [
+            RunResult(
+                day,
+                part,
+                response.get("answer"),
+                wall_time=response.get("wall_time", 0.0),
+                cpu_time=response.get("cpu_time", 0.0),
+                error=response.get("error"),
+            )
+            for (day, part, _), response in zip(tasks, request(tasks, args.socket))
+        ]
+        print(format_table(results))
+
+    else:
+        if args.day is None or args.part is None:
+            argsparse.error("--day and --part are required without --all or --days.")
+
+        file_path = get_input_path(args.day)
+        if not os.path.exists(file_path):
+            raise ValueError(f"File not found: {file_path}")
+
+        (response,) = request([(args.day, args.part, file_path)], args.socket)
+        if response.get("error"):
+            sys.exit(response["error"])
+        print(response["answer"])
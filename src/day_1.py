@@ -68,46 +68,210 @@ So, for these example lists, the similarity score at the end of this process is
 Once again consider your left and right lists. What is their similarity score?
 """
 
+import contextlib
+import itertools
 import os.path
+import tempfile
+from collections import Counter
+from typing import Iterable, Iterator, Optional
 
+import numpy as np
 
-def read_input(file_path: str) -> tuple[list, list]:
+from external import (
+    exceeds_memory,
+    iter_records,
+    max_memory,
+    merge_runs,
+    write_sorted_runs,
+)
+from instrument import phase
+from parsing import read_records
+
+
+@phase("parse")
+def read_input(file_path: str) -> tuple[np.ndarray, np.ndarray]:
     """
-    Read the input file and return the two lists of integers.
+    Read the input file and return the two lists of integers, sorted.
     Each line contains two integers separated by white spaces.
 
-    The first list is the left list and the second list is the right list.
+    The first list is the left list and the second list is the right list. The lists
+    are int64 arrays, or object arrays of Python integers when an ID does not fit.
     """
 
     assert os.path.exists(file_path), f"File not found: {file_path}"
-    with open(file_path, "r") as file:
-        left_list, right_list = [], []
-        for line in file:
-            left, right = line.strip().split()
-            left_list.append(int(left))
-            right_list.append(int(right))
+    pairs = read_records(file_path, 2)
 
-    return sorted(left_list), sorted(right_list)
+    return np.sort(pairs[:, 0]), np.sort(pairs[:, 1])
 
 
-def compute_distance(list_1: list[int], list_2: list[int]) -> int:
+def compute_distance(list_1: np.ndarray, list_2: np.ndarray) -> int:
     """
-    Compute the total distance between the two lists.
+    Compute the total distance between the two sorted lists.
     The distance is the sum of the absolute difference between each pair of numbers.
     """
-    return sum(abs(a - b) for a, b in zip(list_1, list_2))
+    return int(np.abs(list_1 - list_2).sum())
+
+
+def compute_similarity(left_list: np.ndarray, right_list: np.ndarray) -> int:
+    """
+    Compute the similarity score: the sum of each number of the left list times the
+    number of times it appears in the right list.
+
+    The distinct numbers of the right list are counted once, then each number of the
+    left list is looked up among them with a binary search, in O(n log n).
+    """
+
+    values, counts = np.unique(right_list, return_counts=True)
+    if len(values) == 0:
+        return 0
+
+    indices = np.searchsorted(values, left_list)
+    # the numbers above the largest value of the right list are not found either
+    indices[indices == len(values)] = 0
+    found = values[indices] == left_list
+
+    return int((left_list[found] * counts[indices[found]]).sum())
+
+
+@contextlib.contextmanager
+def stream_sorted_lists(
+    file_path: str, budget: int
+) -> Iterator[tuple[Iterator[int], Iterator[int]]]:
+    """
+    Stream the two lists in sorted order within the memory budget, for inputs that
+    do not fit in memory. The input is read in chunks sorted to temporary run
+    files, which are merged back while the lists are consumed.
+    """
+    with tempfile.TemporaryDirectory(prefix="aoc_day_1_") as directory:
+        with phase("parse"):
+            chunks = iter_records(file_path, 2, budget)
+            left_runs, right_runs = write_sorted_runs(chunks, 2, directory)
+        # both lists are merged at the same time, so each gets half of the budget
+        yield merge_runs(left_runs, budget // 2), merge_runs(right_runs, budget // 2)
+
+
+def stream_distance(left_list: Iterator[int], right_list: Iterator[int]) -> int:
+    """
+    Compute the total distance between the two sorted streams.
+    """
+    return sum(abs(a - b) for a, b in zip(left_list, right_list))
+
+
+def _count_values(values: Iterator[int]) -> Iterator[tuple[int, int]]:
+    for value, group in itertools.groupby(values):
+        yield value, sum(1 for _ in group)
+
+
+def stream_similarity(left_list: Iterator[int], right_list: Iterator[int]) -> int:
+    """
+    Compute the similarity score of the two sorted streams in a single pass, by
+    joining the number of occurrences of each value in both lists.
+    """
+
+    similarity_score = 0
+    right_counts = _count_values(right_list)
+    right_value, right_count = next(right_counts, (None, 0))
+
+    for value, count in _count_values(left_list):
+        while right_value is not None and right_value < value:
+            right_value, right_count = next(right_counts, (None, 0))
+        if right_value == value:
+            similarity_score += value * count * right_count
+
+    return similarity_score
+
+
+class SimilarityIndex:
+    """
+    Running similarity score and total distance of two lists receiving new pairs.
+
+    >>> index = SimilarityIndex()
+    >>> index.extend([(3, 4), (4, 3), (2, 5), (1, 3), (3, 9)])
+    >>> index.append(3, 3)
+    >>> index.similarity, index.distance
+    (31, 11)
+
+    The number of occurrences of each number is kept for both lists. An appended
+    pair updates the similarity score in O(1): the left number matches the
+    occurrences already in the right list and the right number the ones in the left
+    list.
+
+    The distance does not update in place, as a new pair can shift the pairing of
+    every number between them in the sorted lists. It is computed when queried from
+    the occurrences alone, in O(k log k) for k distinct numbers, and kept until the
+    next append. Between two consecutive distinct numbers, the sorted lists pair the
+    extra numbers of one list counted up to there with numbers of the other list
+    beyond the gap, so the distance is the sum over the gaps of their width times the
+    difference of the counts.
+    """
+
+    left: Counter[int]
+    right: Counter[int]
+    similarity: int
+    _distance: Optional[int]
+
+    def __init__(self) -> None:
+        self.left = Counter()
+        self.right = Counter()
+        self.similarity = 0
+        self._distance = 0
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "SimilarityIndex":
+        index = cls()
+        for counts, values in zip((index.left, index.right), read_input(file_path)):
+            numbers, occurrences = np.unique(values, return_counts=True)
+            counts.update(dict(zip(numbers.tolist(), occurrences.tolist())))
+
+        index.similarity = sum(
+            number * count * index.right[number] for number, count in index.left.items()
+        )
+        index._distance = None
+        return index
+
+    def __len__(self) -> int:
+        return self.left.total()
+
+    def append(self, left: int, right: int) -> None:
+        self.similarity += left * self.right[left]
+        self.left[left] += 1
+        # the right number also matches the left number appended above
+        self.similarity += right * self.left[right]
+        self.right[right] += 1
+        self._distance = None
+
+    def extend(self, pairs: Iterable[tuple[int, int]]) -> None:
+        for left, right in pairs:
+            self.append(left, right)
+
+    @property
+    def distance(self) -> int:
+        if self._distance is None:
+            numbers = sorted(self.left.keys() | self.right.keys())
+            # difference of the counts of both lists up to each number
+            differences = np.cumsum(
+                [self.left[number] - self.right[number] for number in numbers]
+            )
+            gaps = np.diff(np.array(numbers, dtype=object))
+            self._distance = int(np.abs(differences[:-1]) @ gaps) if len(gaps) else 0
+        return self._distance
 
 
 def part_1(file_path: str) -> int:
+    budget = max_memory()
+    if budget is not None and exceeds_memory(file_path):
+        with stream_sorted_lists(file_path, budget) as (left_stream, right_stream):
+            return stream_distance(left_stream, right_stream)
+
     left_list, right_list = read_input(file_path)
     return compute_distance(left_list, right_list)
 
 
 def part_2(file_path: str) -> int:
-    left_list, right_list = read_input(file_path)
-    similarity_score = 0
-
-    for number in left_list:
-        similarity_score += right_list.count(number) * number
+    budget = max_memory()
+    if budget is not None and exceeds_memory(file_path):
+        with stream_sorted_lists(file_path, budget) as (left_stream, right_stream):
+            return stream_similarity(left_stream, right_stream)
 
-    return similarity_score
+    left_list, right_list = read_input(file_path)
+    return compute_similarity(left_list, right_list)
@@ -114,118 +114,88 @@ Considering its trailheads in reading order, they have ratings of 20, 24, 10, 4,
 You're not sure how, but the reindeer seems to have crafted some tiny flags out of toothpicks and bits of paper and is using them to mark trailheads on your topographic map. What is the sum of the ratings of all trailheads?
 """
 
+from collections import deque
+
+import render
+from grid import Grid
+
 # Path: src/day_10.py
 # --- Part One ---
 
 
-def breadth_first_search(grid: list[list[str]], start: tuple[int, int]) -> int:
+def breadth_first_search(grid: Grid, start: int) -> int:
     """
-    Perform a breadth-first search on the grid starting from the given position.
+    Perform a breadth-first search on the grid starting from the given cell and
+    return the number of distinct trail ends that can be reached.
     """
-    visited = set()
-    queue = [start]
-    # store the positions of the trail ends
-    trail_ends = set()
+    data, offsets = grid.data, grid.offsets
+    visited = {start}
+    queue = deque([start])
+    # count the trail ends
+    trail_ends = 0
 
     while queue:
-        x, y = queue.pop(0)
-        value_start = grid[x][y]
-        visited.add((x, y))
-
-        if grid[x][y] == "9":
-            trail_ends.add((x, y))
+        cell = queue.popleft()
+        looking_for = data[cell] + 1
 
-        looking_for = str(int(value_start) + 1)
+        if data[cell] == ord("9"):
+            trail_ends += 1
+            continue
 
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_x, new_y = x + dx, y + dy
+        # the border of the grid never holds a digit, no bounds checks needed
+        for offset in offsets:
+            new_cell = cell + offset
+            if data[new_cell] == looking_for and new_cell not in visited:
+                visited.add(new_cell)
+                queue.append(new_cell)
 
-            if new_x < 0 or new_y < 0:
-                continue
-            if new_x >= len(grid) or new_y >= len(grid[0]):
-                continue
+    return trail_ends
 
-            if (
-                0 <= new_x < len(grid)
-                and 0 <= new_y < len(grid[0])
-                and (new_x, new_y) not in visited
-                and grid[new_x][new_y] == looking_for
-            ):
-                queue.append((new_x, new_y))
 
-    return len(trail_ends)
-
-
-def breadth_first_search_w_repetitions(
-    grid: list[list[str]], start: tuple[int, int]
-) -> int:
+def breadth_first_search_w_repetitions(grid: Grid, start: int) -> int:
     """
-    Find all the possible trails starting from the given position and ending at 9.
+    Find all the possible trails starting from the given cell and ending at 9.
+    The heights increase by one at each step, so the search goes level by level and
+    counts the number of trails reaching each cell instead of storing the trails.
     """
+    data, offsets = grid.data, grid.offsets
+    # number of trails from the start reaching each cell of the current level
+    level = {start: 1}
 
-    visited = list()
-    queue = [start]
-    # store the positions of the trail ends
-    trail_ends = list()
-
-    while queue:
-        x, y = queue.pop(0)
-        value_start = grid[x][y]
-        visited.append((x, y))
-
-        if grid[x][y] == "9":
-            trail_ends.append((x, y))
-
-        looking_for = str(int(value_start) + 1)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_x, new_y = x + dx, y + dy
-
-            if new_x < 0 or new_y < 0:
-                continue
-            if new_x >= len(grid) or new_y >= len(grid[0]):
-                continue
-
-            if (
-                0 <= new_x < len(grid)
-                and 0 <= new_y < len(grid[0])
-                and (new_x, new_y) not in visited
-                and grid[new_x][new_y] == looking_for
-            ):
-                queue.append((new_x, new_y))
+    for height in range(data[start] + 1, ord("9") + 1):
+        next_level: dict[int, int] = {}
+        for cell, n_trails in level.items():
+            for offset in offsets:
+                new_cell = cell + offset
+                if data[new_cell] == height:
+                    next_level[new_cell] = next_level.get(new_cell, 0) + n_trails
+        level = next_level
 
-    return len(trail_ends)
+    return sum(level.values())
 
 
 class TopographicMap:
-    grid: list[list[str]]
+    grid: Grid
 
-    def __init__(self, grid: list[list[str]]) -> None:
+    def __init__(self, grid: Grid) -> None:
         self.grid = grid
 
     def plot_map(self) -> None:
-        for row in self.grid:
-            print("".join(map(str, row)))
-        print("\n")
+        if render.enabled():
+            render.snapshot("day_10", str(self.grid).splitlines())
 
-    def find_zeroes(self) -> list[tuple[int, int]]:
+    def find_zeroes(self) -> list[int]:
         """
-        Find the positions of all the zeroes in the grid.
+        Find the cells of all the zeroes in the grid.
         """
-        return [
-            (x, y)
-            for x, row in enumerate(self.grid)
-            for y, val in enumerate(row)
-            if val == "0"
-        ]
+        return self.grid.find("0")
 
 
 def part_1(file_path: str) -> int:
     """
     Read the input file and return the solution.
     """
-    with open(file_path, "r") as file:
-        grid = [[char for char in line.strip()] for line in file]
+    grid = Grid.from_file(file_path)
 
     topographic_map = TopographicMap(grid=grid)
 
@@ -244,8 +214,7 @@ def part_2(file_path: str) -> int:
     Read the input file and return the solution.
     """
 
-    with open(file_path, "r") as file:
-        grid = [[char for char in line.strip()] for line in file]
+    grid = Grid.from_file(file_path)
 
     topographic_map = TopographicMap(grid=grid)
 
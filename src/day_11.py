@@ -56,6 +56,8 @@ Consider the arrangement of stones in front of you. How many stones will you hav
 # Path: src/day_11.py
 # --- Part One ---
 
+from instrument import phase
+
 
 def stone_blink(stone_value: int) -> dict[int, int]:
     if stone_value == 0:
@@ -76,6 +78,7 @@ def print_stones(stones: dict[int, int]) -> None:
     print(", ".join([f"{stone} (t={total})" for stone, total in stones.items()]))
 
 
+@phase("parse")
 def load_input(file_path: str) -> dict[int, int]:
     with open(file_path, "r") as file:
         # the file contains a single line with space-separated integers
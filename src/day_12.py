@@ -136,175 +136,124 @@ What is the new total price of fencing all regions on your map?
 # Path: src/day_12.py
 # --- Part One ---
 
-import os
-from typing import Optional
+import render
+from grid import Grid as BaseGrid
 
 
-class Style:
-    RED = "\033[31m"  # Red
-    GREEN = "\033[32m"  # Green
-    YELLOW = "\033[33m"  # Yellow
-    BLUE = "\033[34m"  # Blue
-    PURPLE = "\033[35m"  # Purple
-    CYAN = "\033[36m"  # Cyan
-    WHITE = "\033[37m"  # White
-
-    RESET = "\033[0m"
-
-    @classmethod
-    def get_style(cls, index: int) -> str:
-        return [
-            cls.RED,
-            cls.GREEN,
-            cls.YELLOW,
-            cls.BLUE,
-            cls.PURPLE,
-            cls.CYAN,
-            cls.WHITE,
-        ][index % 7]
-
-
-class Grid:
-    grid: list[list[str]]  # firs dimension is y, second dimension is x
-
-    def __init__(self, grid: list[list[str]]):
-        self.grid = grid
-
-    @classmethod
-    def from_file(cls, file_path: str):
-        with open(file_path, "r") as file_handle:
-            return cls([list(line.strip()) for line in file_handle.readlines()])
-
-    def __str__(self):
-        return "\n".join(["".join(row) for row in self.grid])
-
-    def get(self, x: int, y: int) -> Optional[str]:
-        if x < 0 or x >= len(self.grid[0]) or y < 0 or y >= len(self.grid):
-            return None
-        return self.grid[y][x]
-
-    def get_height(self) -> int:
-        return len(self.grid)
-
-    def get_width(self) -> int:
-        return len(self.grid[0])
+class Grid(BaseGrid):
+    """
+    Garden plots stored in a padded bytearray, see `grid.Grid`.
+    The border never matches a plant so the neighbours need no bounds checks.
+    """
 
-    def n_fence_at(self, x: int, y: int) -> int:
+    def n_fence_at(self, cell: int) -> int:
         """
-        Given a coordinate (x, y) return the number of fences around it.
+        Given a cell return the number of fences around it.
         """
-        starting_value = self.get(x, y)
-
-        directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+        data = self.data
+        starting_value = data[cell]
 
         n_fence = 0
-        for dx, dy in directions:
-            if self.get(x + dx, y + dy) != starting_value:
+        for offset in self.offsets:
+            if data[cell + offset] != starting_value:
                 n_fence += 1
 
         return n_fence
 
-    def n_angle_fence_at(self, x: int, y: int) -> tuple[int, int]:
+    def n_angle_fence_at(self, cell: int) -> tuple[int, int]:
         """
-        Given a coordinate (x, y) return the number of fences around it.
+        Given a cell return the number of fences around it and the number of
+        fences it shares with its up or left neighbor.
         """
-        starting_value = self.get(x, y)
+        data, up = self.data, self.stride
+        starting_value = data[cell]
 
         perimeter, shared_borders = 0, 0
 
         # up
-        if self.get(x, y - 1) != starting_value:
+        if data[cell - up] != starting_value:
             perimeter += 1
             # left neighbor
             if (
-                self.get(x - 1, y) == starting_value
-                and self.get(x - 1, y - 1) != starting_value
+                data[cell - 1] == starting_value
+                and data[cell - 1 - up] != starting_value
             ):
                 shared_borders += 1
         # down
-        if self.get(x, y + 1) != starting_value:
+        if data[cell + up] != starting_value:
             perimeter += 1
             # left neighbor
             if (
-                self.get(x - 1, y) == starting_value
-                and self.get(x - 1, y + 1) != starting_value
+                data[cell - 1] == starting_value
+                and data[cell - 1 + up] != starting_value
             ):
                 shared_borders += 1
         # left
-        if self.get(x - 1, y) != starting_value:
+        if data[cell - 1] != starting_value:
             perimeter += 1
             # up neighbor
             if (
-                self.get(x, y - 1) == starting_value
-                and self.get(x - 1, y - 1) != starting_value
+                data[cell - up] == starting_value
+                and data[cell - 1 - up] != starting_value
             ):
                 shared_borders += 1
         # right
-        if self.get(x + 1, y) != starting_value:
+        if data[cell + 1] != starting_value:
             perimeter += 1
             # up neighbor
             if (
-                self.get(x, y - 1) == starting_value
-                and self.get(x + 1, y - 1) != starting_value
+                data[cell - up] == starting_value
+                and data[cell + 1 - up] != starting_value
             ):
                 shared_borders += 1
 
         return perimeter, shared_borders
 
-    def _search(self) -> list[list[tuple[int, int]]]:
+    def _search(self) -> list[list[int]]:
         """
         Search for regions in the grid.
         """
 
+        data, offsets = self.data, self.offsets
         regions = []
-        visited = set()
-
-        def dfs(x: int, y: int) -> list[tuple[int, int]]:
-            if (x, y) in visited:
-                return []
-
-            visited.add((x, y))
-
-            region = [(x, y)]
-
-            for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if (
-                    nx >= 0
-                    and nx < self.get_width()
-                    and ny >= 0
-                    and ny < self.get_height()
-                    and self.grid[ny][nx] == self.grid[y][x]
-                ):
-                    region += dfs(nx, ny)
-
-            return region
-
-        for y in range(self.get_height()):
-            for x in range(self.get_width()):
-                if (x, y) not in visited:
-                    region = dfs(x, y)
-                    if region:
-                        regions.append(region)
+        visited = bytearray(len(data))
+
+        for start in self.cells():
+            if visited[start]:
+                continue
+
+            # flood fill the region with an explicit stack
+            visited[start] = 1
+            region, stack = [], [start]
+            while stack:
+                cell = stack.pop()
+                region.append(cell)
+                for offset in offsets:
+                    new_cell = cell + offset
+                    if not visited[new_cell] and data[new_cell] == data[start]:
+                        visited[new_cell] = 1
+                        stack.append(new_cell)
+
+            regions.append(region)
 
         return regions
 
-    def _plot_regions(self, regions: list[list[tuple[int, int]]]) -> None:
+    def _plot_regions(self, regions: list[list[int]]) -> None:
         """
         Plot the regions on the grid. Each regions is plotted using a different letter and color.
         """
 
-        os.system("")
+        if not render.enabled():
+            return
 
-        colored_grid = [["." for _ in row] for row in self.grid]
+        labels = [[-1] * self.width for _ in range(self.height)]
 
         for i, region in enumerate(regions):
-            color = Style.get_style(i)
-
-            for x, y in region:
-                colored_grid[y][x] = color + self.grid[y][x] + Style.RESET
+            for cell in region:
+                y, x = self.coords(cell)
+                labels[y][x] = i
 
-        print("\n".join(["".join(row) for row in colored_grid]))
+        render.snapshot("day_12", str(self).splitlines(), labels)
 
     def get_fence_costs(self) -> int:
         regions = self._search()
@@ -314,8 +263,8 @@ class Grid:
         for region in regions:
             area = len(region)
             perimeter = 0
-            for x, y in region:
-                perimeter += self.n_fence_at(x, y)
+            for cell in region:
+                perimeter += self.n_fence_at(cell)
 
             fence_costs += area * perimeter
 
@@ -328,8 +277,8 @@ class Grid:
         total_cost = 0
         for region in regions:
             total_perimeter, total_shared_borders = 0, 0
-            for x, y in region:
-                perimeter, shared_borders = self.n_angle_fence_at(x, y)
+            for cell in region:
+                perimeter, shared_borders = self.n_angle_fence_at(cell)
                 total_perimeter += perimeter
                 total_shared_borders += shared_borders
 
@@ -338,11 +287,6 @@ class Grid:
         return total_cost
 
 
-def read_input(file_path: str) -> list[list[str]]:
-    with open(file_path, "r") as file_handle:
-        return [list(line.strip()) for line in file_handle.readlines()]
-
-
 def part_1(file_path: str) -> int:
     """
     Read the input file and return the solution.
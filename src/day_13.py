@@ -79,6 +79,9 @@ from typing import Optional
 import numpy as np
 from loguru import logger
 
+from instrument import phase
+from parsing import read_records
+
 # Path: src/day_13.py
 # --- Part One ---
 
@@ -122,6 +125,17 @@ class Clamp:
         button_b_x, button_b_y = parse_line(strings[1])
         prize_x, prize_y = parse_line(strings[2])
 
+        return cls.from_record(
+            [button_a_x, button_a_y, button_b_x, button_b_y, prize_x, prize_y]
+        )
+
+    @classmethod
+    def from_record(cls, record: list[int]):
+        """
+        Build the clamp from the six integers of a machine, in the order of the input.
+        """
+        button_a_x, button_a_y, button_b_x, button_b_y, prize_x, prize_y = record
+
         movements = np.array([[button_a_x, button_b_x], [button_a_y, button_b_y]])
         prize = np.array([prize_x, prize_y]).reshape(-1, 1)
 
@@ -178,16 +192,24 @@ class Clamp:
         return cost
 
 
+@phase("parse")
+def read_clamps(file_path: str) -> list[Clamp]:
+    """
+    Read the input file and return the clamps, each machine holds six integers.
+    """
+    return [
+        Clamp.from_record(record)
+        for record in read_records(file_path, 6, signed=False).tolist()
+    ]
+
+
 def part_1(file_path: str) -> int:
     """
     Read the input file and return the solution.
     """
 
-    with open(file_path) as file:
-        lines = file.read().splitlines()
-
     # Parse the input file
-    clamps = [Clamp.from_string(lines[i : i + 3]) for i in range(0, len(lines), 4)]
+    clamps = read_clamps(file_path)
 
     # Get the cost of each prize
     costs = [clamp.get_cost() for clamp in clamps]
@@ -205,11 +227,8 @@ def part_2(file_path: str) -> int:
 
     EXTRA = 10000000000000
 
-    with open(file_path) as file:
-        lines = file.read().splitlines()
-
     # Parse the input file
-    clamps = [Clamp.from_string(lines[i : i + 3]) for i in range(0, len(lines), 4)]
+    clamps = read_clamps(file_path)
 
     # Add the extra to the prize
     for clamp in clamps:
@@ -123,11 +123,12 @@ What is the fewest number of seconds that must elapse for the robots to display
 # Path: src/day_14.py
 # --- Part One ---
 
-import re
-
-import matplotlib.pyplot as plt
 from loguru import logger
 
+import render
+from instrument import phase
+from parsing import read_records
+
 
 class Robot:
     def __init__(
@@ -157,10 +158,16 @@ class Robot:
     def __repr__(self):
         return f"Robot({self.x}, {self.y}, {self.dx}, {self.dy})"
 
-    @classmethod
-    def from_line(cls, line: str, grid_width: int, grid_height: int):
-        x, y, dx, dy = map(int, re.findall(r"-?\d+", line))
-        return cls(x, y, dx, dy, grid_width, grid_height)
+
+@phase("parse")
+def read_robots(file_path: str, grid_width: int, grid_height: int) -> list[Robot]:
+    """
+    Read the input file and return the robots, each line holds four integers.
+    """
+    return [
+        Robot(x, y, dx, dy, grid_width, grid_height)
+        for x, y, dx, dy in read_records(file_path, 4).tolist()
+    ]
 
 
 def count_robots(robots: list[Robot], grid_width: int, grid_height: int):
@@ -193,6 +200,9 @@ def count_robots(robots: list[Robot], grid_width: int, grid_height: int):
 
 
 def plot_robots(robots: list[Robot], grid_width: int, grid_height: int):
+    if not render.enabled():
+        return
+
     grid = [["." for _ in range(grid_width)] for _ in range(grid_height)]
 
     for robot in robots:
@@ -202,9 +212,7 @@ def plot_robots(robots: list[Robot], grid_width: int, grid_height: int):
             grid_val = int(grid[robot.y][robot.x]) + 1
             grid[robot.y][robot.x] = str(grid_val)
 
-    for row in grid:
-        print("".join(row))
-    print()
+    render.snapshot("day_14", ["".join(row) for row in grid])
 
 
 def get_robots_standard_deviation(robots: list[Robot]) -> float:
@@ -232,15 +240,12 @@ def part_1(file_path: str) -> int:
     Read the input file and return the solution.
     """
 
-    with open(file_path) as file:
-        lines = file.readlines()
-
     grid_width, grid_height = 101, 103
 
     if "test" in file_path:
         grid_width, grid_height = 11, 7
 
-    robots = [Robot.from_line(line, grid_width, grid_height) for line in lines]
+    robots = read_robots(file_path, grid_width, grid_height)
 
     plot_robots(robots, grid_width, grid_height)
 
@@ -261,15 +266,12 @@ def part_2(file_path: str) -> None:
     Read the input file and return the solution.
     """
 
-    with open(file_path) as file:
-        lines = file.readlines()
-
     grid_width, grid_height = 101, 103
 
     if "test" in file_path:
         grid_width, grid_height = 11, 7
 
-    robots = [Robot.from_line(line, grid_width, grid_height) for line in lines]
+    robots = read_robots(file_path, grid_width, grid_height)
 
     data_points = []
 
@@ -284,13 +286,8 @@ def part_2(file_path: str) -> None:
             logger.info(f"Found the solution at time {i+1}")
             break
 
-    # plot the standard deviation
+    # plot the robots and the standard deviation
     plot_robots(robots, grid_width, grid_height)
-
-    fig, ax = plt.subplots()
-    ax.set_xlim(0, len(data_points) * 1.05)
-    ax.set_ylim(0, max(data_points) * 1.05)
-    plt.plot(data_points)
-    plt.show()
+    render.series("day_14_stddev", data_points)
 
     return None
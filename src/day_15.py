@@ -409,6 +409,9 @@ from typing import Optional
 
 from loguru import logger
 
+from cache import cached_parse
+from instrument import TRACE, count
+
 
 class MoveStatus(Enum):
     BLOCKED_BY_WALL = "BLOCKED_BY_WALL"
@@ -528,6 +531,12 @@ class Warehouse:
     robot: Robot
     walls: list[Wall]
     movements: Movements
+    # row stride of the cell ids, with a one-cell border like grid.Grid so that the
+    # cells around the warehouse do not alias cells of the neighbouring rows
+    stride: int
+    # cell ids to the wall or box covering them
+    wall_cells: dict[int, Wall]
+    box_cells: dict[int, Box]
 
     def __init__(
         self,
@@ -545,6 +554,29 @@ class Warehouse:
         self.walls = walls
         self.movements = movements
 
+        self.stride = width + 2
+        self.wall_cells = {
+            self._cell(wall.position.x, wall.position.y): wall for wall in walls
+        }
+        self.box_cells = {}
+        for box in boxes:
+            self._index_box(box)
+
+    def _cell(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def _box_cells(self, box: Box) -> range:
+        cell = self._cell(box.position.x, box.position.y)
+        return range(cell, cell + box.width)
+
+    def _index_box(self, box: Box):
+        for cell in self._box_cells(box):
+            self.box_cells[cell] = box
+
+    def _unindex_box(self, box: Box):
+        for cell in self._box_cells(box):
+            del self.box_cells[cell]
+
     def plot(self):
         warehouse = [["." for _ in range(self.width)] for _ in range(self.height)]
         for box in self.boxes:
@@ -567,18 +599,10 @@ class Warehouse:
         return True
 
     def get_wall_at(self, x: int, y: int) -> Optional[Wall]:
-        for wall in self.walls:
-            if wall.position.x == x and wall.position.y == y:
-                return wall
-        return None
+        return self.wall_cells.get(self._cell(x, y))
 
     def get_box_at(self, x: int, y: int) -> Optional[Box]:
-        for box in self.boxes:
-            if (
-                box.position.x == x or box.position.x + (box.width - 1) == x
-            ) and box.position.y == y:
-                return box
-        return None
+        return self.box_cells.get(self._cell(x, y))
 
     def get_boxes_to_move(self, movement: str) -> tuple[list[Box], MoveStatus]:
         dx, dy = Movements.get_dx_dy(movement)
@@ -588,9 +612,10 @@ class Warehouse:
 
         boxes_to_move: list[list[Box]] = []
 
-        logger.debug(
-            f"Robot position: {self.robot.position.x}, {self.robot.position.y}"
-        )
+        if TRACE:
+            logger.debug(
+                f"Robot position: {self.robot.position.x}, {self.robot.position.y}"
+            )
 
         while not valid_move:
             positions: list[Position] = []
@@ -622,7 +647,8 @@ class Warehouse:
                         if next_position not in positions:
                             positions.append(next_position)
 
-            logger.debug(f"Looking at positions: {positions}")
+            if TRACE:
+                logger.debug(f"Looking at positions: {positions}")
 
             boxes_to_move.append([])
 
@@ -630,16 +656,20 @@ class Warehouse:
                 new_box = self.get_box_at(position.x, position.y)
                 if new_box:
                     if new_box not in boxes:
-                        logger.debug(f"Found box at {position.x}, {position.y}")
+                        if TRACE:
+                            logger.debug(f"Found box at {position.x}, {position.y}")
                         boxes_to_move[-1].append(new_box)
                 elif self.get_wall_at(position.x, position.y):
-                    logger.debug(f"Wall at {position.x}, {position.y}")
+                    if TRACE:
+                        logger.debug(f"Wall at {position.x}, {position.y}")
                     return [], MoveStatus.BLOCKED_BY_WALL
 
-            logger.debug(f"Boxes to move: {boxes_to_move}")
+            if TRACE:
+                logger.debug(f"Boxes to move: {boxes_to_move}")
 
             if len(boxes_to_move[-1]) == 0:
-                logger.debug(f"No boxes found at {positions}")
+                if TRACE:
+                    logger.debug(f"No boxes found at {positions}")
                 valid_move = True
 
             increment += 1
@@ -654,27 +684,31 @@ class Warehouse:
 
     def move_boxes(self, boxes_to_move: list[Box], movement: str):
         dx, dy = Movements.get_dx_dy(movement)
-        moved_boxes = []
-        for box in self.boxes:
-            if box in boxes_to_move:
-                new_x, new_y = box.position.x + dx, box.position.y + dy
-                logger.debug(f"Moving box {box} to {new_x}, {new_y}")
-                box.position.x = new_x
-                box.position.y = new_y
-                moved_boxes.append(box)
-            else:
-                moved_boxes.append(box)
+        count("boxes pushed", len(boxes_to_move))
+
+        # remove all the boxes from the index first as they may overlap their
+        # former positions once moved
+        for box in boxes_to_move:
+            self._unindex_box(box)
 
-        self.boxes = moved_boxes
+        for box in boxes_to_move:
+            new_x, new_y = box.position.x + dx, box.position.y + dy
+            if TRACE:
+                logger.debug(f"Moving box {box} to {new_x}, {new_y}")
+            box.position.x = new_x
+            box.position.y = new_y
+            self._index_box(box)
 
     def move_robot(self, movement: str):
         dx, dy = Movements.get_dx_dy(movement)
         new_x, new_y = self.robot.position.x + dx, self.robot.position.y + dy
         self.robot.position.x = new_x
         self.robot.position.y = new_y
-        logger.debug(f"Moving robot to {new_x}, {new_y}")
+        if TRACE:
+            logger.debug(f"Moving robot to {new_x}, {new_y}")
 
     @classmethod
+    @cached_parse(version=3)
     def from_input_file(cls, file_path: str, part_number: int):
         boxes = []
         robot = None
@@ -716,16 +750,19 @@ class Warehouse:
         return cls(width, height, boxes, robot, walls, movements)
 
     def run_simulation(self):
+        count("robot moves", len(self.movements.sequence))
         while self.movements.sequence:
             move = self.movements.sequence.pop(0)
-            logger.debug(f"Move: {move}")
+            if TRACE:
+                logger.debug(f"Move: {move}")
             recursively_push(self, move)
 
 
 def recursively_push(warehouse: Warehouse, move: str):
     boxes_to_push, moving_status = warehouse.get_boxes_to_move(move)
     if moving_status == MoveStatus.MOVING_WITH_BOX:
-        logger.debug(f"Found {len(boxes_to_push)} boxes to push {boxes_to_push}")
+        if TRACE:
+            logger.debug(f"Found {len(boxes_to_push)} boxes to push {boxes_to_push}")
         warehouse.move_boxes(boxes_to_push, move)
     if moving_status != MoveStatus.BLOCKED_BY_WALL:
         warehouse.move_robot(move)
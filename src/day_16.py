@@ -130,64 +130,65 @@ Analyze your map further. How many tiles are part of at least one of the best pa
 
 """
 
-import networkx as nx
+from typing import Callable
+
+from cache import cached_parse
+from grid import Grid
+from search import dijkstra, dijkstra_all_predecessors, optimal_states
 
 # Path: src/day_16.py
 # --- Part One ---
 DIRECTIONS = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+N_DIRECTIONS = len(DIRECTIONS)
+WALL = ord("#")
 
 
-def read_input(
-    file_path: str,
-) -> tuple[nx.Graph, tuple[int, int, int], tuple[int, int, int]]:
-    with open(file_path, "r") as f:
-        data = f.read().splitlines()
-        G = nx.DiGraph()
-
-        start: tuple[int, int, int] | None = None
-        end: tuple[int, int, int] | None = None
-
-        # Find all the valid nodes
-        for i, row in enumerate(data):
-            for j, cell in enumerate(row):
-                if cell != "#":
-                    for dir in range(4):
-                        # A node is defined by its position and direction
-                        G.add_node((i, j, dir))
-                if cell == "S":
-                    start = (i, j, 3)
-                if cell == "E":
-                    end = (i, j, 3)
-
-        # Add the edges
-        for x_n, y_n, dir_n in list(G.nodes):
-            dx, dy = DIRECTIONS[dir_n]
-            m, n = x_n + dx, y_n + dy
-            # connect the nodes
-            if (m, n, dir_n) in G.nodes:
-                G.add_edge((x_n, y_n, dir_n), (m, n, dir_n), weight=1)
-            for i in range(4):
-                G.add_edge((x_n, y_n, dir_n), (x_n, y_n, i), weight=1000)
-
-        # Ensure start and end are not None
-        assert start is not None, "Start node is None"
-        assert end is not None, "End node is None"
-
-        # Convert start and end to the expected type
-        start = (start[0], start[1], start[2])
-        end = (end[0], end[1], end[2])
-
-        return G, start, end
+@cached_parse(version=2)
+def parse(file_path: str) -> tuple[Grid, int, int]:
+    """
+    Read the maze and return it with the start and end states.
+    A state is defined by a cell id and a direction: `cell * 4 + direction`.
+    """
+    grid = Grid.from_file(file_path, border=WALL)
 
+    # The reindeer starts facing east, the end is also reached facing east
+    start = grid.find("S")[0] * N_DIRECTIONS + 3
+    end = grid.find("E")[0] * N_DIRECTIONS + 3
 
-def part_1(file_path: str) -> int:
+    return grid, start, end
+
+
+def get_edges(grid: Grid) -> Callable[[int], list[tuple[int, int]]]:
     """
-    Read the input file and return the solution.
+    Return the function listing the weighted edges leaving a state: moving forward
+    costs 1 and turning to any direction costs 1000.
     """
+    data = grid.data
+    # cell id offset of a step in each direction
+    offsets = [grid.cell(dx, dy) - grid.cell(0, 0) for dx, dy in DIRECTIONS]
 
-    network, start, end = read_input(file_path)
+    def edges(state: int) -> list[tuple[int, int]]:
+        cell, direction = divmod(state, N_DIRECTIONS)
+        moves = [(cell * N_DIRECTIONS + i, 1000) for i in range(N_DIRECTIONS)]
+        next_cell = cell + offsets[direction]
+        if data[next_cell] != WALL:
+            moves.append((next_cell * N_DIRECTIONS + direction, 1))
+        return moves
 
-    p1 = nx.shortest_path_length(network, start, end, weight="weight")
+    return edges
+
+
+def solve_part_1(maze: tuple[Grid, int, int]) -> int:
+    """
+    Return the lowest score of a path from the start to the end.
+    """
+
+    grid, start, end = maze
+
+    distances, _ = dijkstra(
+        len(grid.data) * N_DIRECTIONS, [start], get_edges(grid), end
+    )
+    p1 = distances[end]
 
     return p1
 
@@ -195,15 +196,30 @@ def part_1(file_path: str) -> int:
 # --- Part Two ---
 
 
-def part_2(file_path: str) -> int:
+def solve_part_2(maze: tuple[Grid, int, int]) -> int:
     """
-    Read the input file and return the solution.
+    Return the number of tiles on any of the paths with the lowest score.
     """
 
-    network, start, end = read_input(file_path)
+    grid, start, end = maze
+
+    _, predecessors = dijkstra_all_predecessors(
+        len(grid.data) * N_DIRECTIONS, [start], get_edges(grid), end
+    )
 
-    seats = set()
-    for path in nx.all_shortest_paths(network, start, end, weight="weight"):
-        for n in path:
-            seats.add((n[0], n[1]))
+    seats = {state // N_DIRECTIONS for state in optimal_states(predecessors, [end])}
     return len(seats)
+
+
+def part_1(file_path: str) -> int:
+    """
+    Read the input file and return the solution.
+    """
+    return solve_part_1(parse(file_path))
+
+
+def part_2(file_path: str) -> int:
+    """
+    Read the input file and return the solution.
+    """
+    return solve_part_2(parse(file_path))
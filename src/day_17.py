@@ -83,6 +83,8 @@ from abc import abstractmethod
 from loguru import logger
 from tqdm import tqdm
 
+from instrument import TRACE, count, phase
+
 
 def oct_to_dec(oct: str) -> int:
     return int(oct, 8)
@@ -167,9 +169,10 @@ class ADV(Instruction):
         combo_value = Combo(combo).get_value(registers)
 
         registers["A"].value = int(a_value // (2**combo_value))
-        logger.debug(
-            f"ADV: {a_value} // (2**{combo_value}) = {registers['A'].value} -> A"
-        )
+        if TRACE:
+            logger.debug(
+                f"ADV: {a_value} // (2**{combo_value}) = {registers['A'].value} -> A"
+            )
         return 2, output
 
 
@@ -181,7 +184,8 @@ class BXL(Instruction):
     ) -> tuple[int, list[str]]:
         b_value = registers["B"].value
         registers["B"].value = b_value ^ combo
-        logger.debug(f"BXL: {b_value} ^ {combo} = {registers['B'].value} -> B")
+        if TRACE:
+            logger.debug(f"BXL: {b_value} ^ {combo} = {registers['B'].value} -> B")
         return 2, output
 
 
@@ -194,7 +198,8 @@ class BST(Instruction):
         start_value = Combo(combo).get_value(registers)
         new_value = Combo(combo).get_value(registers) % 8
         registers["B"].value = new_value
-        logger.debug(f"BST: {start_value} % 8 =  {new_value} -> B")
+        if TRACE:
+            logger.debug(f"BST: {start_value} % 8 =  {new_value} -> B")
         return 2, output
 
 
@@ -204,7 +209,8 @@ class JNZ(Instruction):
     def compute(
         self, registers: dict[str, Register], combo: int, output: list[str]
     ) -> tuple[int, list[str]]:
-        logger.debug(f"JNZ: {registers['A'].value}")
+        if TRACE:
+            logger.debug(f"JNZ: {registers['A'].value}")
         if registers["A"].value != 0:
             return combo, output
         return 2, output
@@ -219,7 +225,8 @@ class BXC(Instruction):
         b_value = registers["B"].value
         c_value = registers["C"].value
         registers["B"].value = b_value ^ c_value
-        logger.debug(f"BXC: {b_value} ^ {c_value} = {registers['B'].value} -> B")
+        if TRACE:
+            logger.debug(f"BXC: {b_value} ^ {c_value} = {registers['B'].value} -> B")
         return 2, output
 
 
@@ -232,7 +239,8 @@ class OUT(Instruction):
         start_value = Combo(combo).get_value(registers)
         new_value = start_value % 8
         output.append(str(new_value))
-        logger.debug(f"OUT: {start_value} % 8 = {new_value}")
+        if TRACE:
+            logger.debug(f"OUT: {start_value} % 8 = {new_value}")
         return 2, output
 
 
@@ -245,9 +253,10 @@ class BDV(Instruction):
         a_value = registers["A"].value
         combo_value = Combo(combo).get_value(registers)
         registers["B"].value = int(a_value // (2**combo_value))
-        logger.debug(
-            f"BDV: {a_value} // (2**{combo_value}) = {registers['B'].value} -> B"
-        )
+        if TRACE:
+            logger.debug(
+                f"BDV: {a_value} // (2**{combo_value}) = {registers['B'].value} -> B"
+            )
         return 2, output
 
 
@@ -260,12 +269,14 @@ class CDV(Instruction):
         a_value = registers["A"].value
         combo_value = Combo(combo).get_value(registers)
         registers["C"].value = int(a_value // (2**combo_value))
-        logger.debug(
-            f"CDV: {a_value} // (2**{combo_value}) = {registers['C'].value} -> C"
-        )
+        if TRACE:
+            logger.debug(
+                f"CDV: {a_value} // (2**{combo_value}) = {registers['C'].value} -> C"
+            )
         return 2, output
 
 
+@phase("parse")
 def read_input(file_path: str) -> tuple[dict[str, Register], Program]:
     with open(file_path, "r") as file:
         lines = file.readlines()
@@ -294,20 +305,25 @@ def run_instructions(registers: dict[str, Register], program: Program) -> list[s
         7: CDV(),
     }
 
-    instruction_pointer = 0
+    instruction_pointer, executed = 0, 0
     while instruction_pointer < len(program.instructions):
         opcode = program.instructions[instruction_pointer]
         combo = program.instructions[instruction_pointer + 1]
         instruction = instructions[opcode]
-        logger.debug(f"Instruction: {instruction.name} {combo}")
+        if TRACE:
+            logger.debug(f"Instruction: {instruction.name} {combo}")
         jump, output = instruction.compute(registers, combo, output)
-        logger.debug(f"\tRegisters: {registers}")
-        logger.debug(f"\tJump: {jump}")
+        if TRACE:
+            logger.debug(f"\tRegisters: {registers}")
+            logger.debug(f"\tJump: {jump}")
 
         if jump == 2:
             instruction_pointer += 2
         else:
             instruction_pointer = jump
+        executed += 1
+
+    count("instructions executed", executed)
 
     return output
 
@@ -69,6 +69,11 @@ import os
 from loguru import logger
 from tqdm import tqdm
 
+from grid import Grid
+from instrument import TRACE, phase
+from parsing import read_records
+from search import UNREACHED, bfs as bfs_kernel, reconstruct_path
+
 
 class Memory:
     size: int
@@ -79,22 +84,31 @@ class Memory:
         self.corrupted = corrupted
 
     @classmethod
+    @phase("parse")
     def from_file(cls, file_path: str):
-        corrupted = []
-        with open(file_path, "r") as file:
-            for line in file:
-                x, y = line.strip().split(",")
-                corrupted.append((int(x), int(y)))
+        corrupted = [(x, y) for x, y in read_records(file_path, 2).tolist()]
 
         max_corrupted = max([max(x, y) for x, y in corrupted])
 
+        # the example space is 7 x 7, and the puzzle space 71 x 71 unless a byte
+        # falls further, as in the larger synthetic inputs
         if max_corrupted == 6:
             size = 7
         else:
-            size = 71
+            size = max(71, max_corrupted + 1)
 
         return cls(size, corrupted)
 
+    def to_grid(self) -> Grid:
+        """
+        Return the memory space as a grid.Grid with the corrupted bytes and the
+        border set to "#".
+        """
+        grid = Grid.from_lines(["." * self.size] * self.size, border=ord("#"))
+        for x, y in self.corrupted:
+            grid.data[grid.cell(y, x)] = ord("#")
+        return grid
+
     def is_corrupted(self, x: int, y: int) -> bool:
         return (x, y) in self.corrupted
 
@@ -126,78 +140,55 @@ class Memory:
         return self.__str__()
 
 
-def bfs(memory: Memory, start: tuple[int, int], end: tuple[int, int]) -> int:
-    queue = [(start, 0)]
-    visited = set([start])
-
-    logger.debug(f"Start: {start}")
-    logger.debug(f"End: {end}")
-
-    while queue:
-        current, steps = queue.pop(0)
-        logger.debug(f"Current: {current}")
+def search_path(
+    memory: Memory, start: tuple[int, int], end: tuple[int, int]
+) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Breadth-first search of the shortest path from start to end over the cells of
+    the memory space, stopping as soon as the end is reached.
+    Returns the number of steps and the path without the start, or -1 and an empty
+    path if the end cannot be reached.
+    """
 
-        if current == end:
-            return steps
+    grid = memory.to_grid()
+    data, offsets = grid.data, grid.offsets
+    wall = ord("#")
 
-        x, y = current
+    def neighbours(cell: int) -> list[int]:
+        return [cell + offset for offset in offsets if data[cell + offset] != wall]
 
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_x, new_y = x + dx, y + dy
+    start_cell, end_cell = grid.cell(start[1], start[0]), grid.cell(end[1], end[0])
+    distances, predecessors = bfs_kernel(
+        len(data), [start_cell], neighbours, target=end_cell
+    )
+    logger.debug(f"Start: {start}")
+    logger.debug(f"End: {end}")
 
-            if new_x < 0 or new_x >= memory.size or new_y < 0 or new_y >= memory.size:
-                logger.debug(f"Out of bounds: {new_x}, {new_y}")
-                continue
+    if distances[end_cell] == UNREACHED:
+        return -1, []
 
-            if (new_x, new_y) in visited:
-                logger.debug(f"Visited: {new_x}, {new_y}")
-                continue
+    path = []
+    for cell in reconstruct_path(predecessors, end_cell)[1:]:
+        y, x = grid.coords(cell)
+        path.append((x, y))
 
-            if memory.is_corrupted(new_x, new_y):
-                logger.debug(f"Corrupted: {new_x}, {new_y}")
-                continue
+    return distances[end_cell], path
 
-            visited.add((new_x, new_y))
-            queue.append(((new_x, new_y), steps + 1))
 
-    return -1
+def bfs(memory: Memory, start: tuple[int, int], end: tuple[int, int]) -> int:
+    steps, _ = search_path(memory, start, end)
+    return steps
 
 
 def djikstra_search(
     memory: Memory, start: tuple[int, int], end: tuple[int, int]
 ) -> tuple[int, list[tuple[int, int]]]:
     """
-    Djikstra search algorithm to find the shortest path from start to end.
+    Shortest path from start to end. All the steps cost 1, so this is a
+    breadth-first search.
     Returns the number of steps and the path.
     """
-
-    queue: list[tuple[tuple[int, int], int, list]] = [(start, 0, [])]
-    visited = set([start])
-
-    while queue:
-        current, steps, path = queue.pop(0)
-
-        if current == end:
-            return steps, path
-
-        x, y = current
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_x, new_y = x + dx, y + dy
-
-            if new_x < 0 or new_x >= memory.size or new_y < 0 or new_y >= memory.size:
-                continue
-
-            if (new_x, new_y) in visited:
-                continue
-
-            if memory.is_corrupted(new_x, new_y):
-                continue
-
-            visited.add((new_x, new_y))
-            queue.append(((new_x, new_y), steps + 1, path + [(new_x, new_y)]))
-
-    return -1, []
+    return search_path(memory, start, end)
 
 
 def part_1(file_path: str) -> int:
@@ -233,21 +224,19 @@ def part_2(file_path: str) -> int:
     _, starting_path = djikstra_search(
         memory, (0, 0), (memory.size - 1, memory.size - 1)
     )
-    logger.debug(f"Starting path: {starting_path}")
-    logger.debug(f"Found corrupted byte count: {full_corrupted}")
-
-    if os.environ.get("LOGURU_LEVEL") == "DEBUG":
+    if TRACE:
+        logger.debug(f"Starting path: {starting_path}")
+        logger.debug(f"Found corrupted byte count: {full_corrupted}")
         print(memory.plot_path(starting_path))
 
     for i in tqdm(range(0, len(full_corrupted))):
         # if the corrupted byte falls on the path, we need to find a new path
         if full_corrupted[i] in starting_path:
-            logger.debug(f"Corrupted byte found on path: {full_corrupted[i]}")
-
             # add the byte from 0 to i-th corrupted byte
             memory.corrupted = full_corrupted[: i + 1]
 
-            if os.environ.get("LOGURU_LEVEL") == "DEBUG":
+            if TRACE:
+                logger.debug(f"Corrupted byte found on path: {full_corrupted[i]}")
                 print(memory.plot_path(starting_path))
 
             step, starting_path = djikstra_search(
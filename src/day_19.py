@@ -79,9 +79,11 @@ They'll let you into the onsen as soon as you have the list. What do you get if
 # Path: src/day_19.py
 # --- Part One ---
 
-from functools import cache
 from typing import List
 
+from instrument import phase
+from memo import memo
+
 
 class Towel:
     stripes: str
@@ -97,7 +99,7 @@ class Pattern:
         self.stripes = stripes
 
 
-@cache
+@memo()
 def ways(s: str, towels: tuple[Towel, ...]) -> int:
     """
     Check if the pattern can be made with the given towels.
@@ -109,6 +111,7 @@ def ways(s: str, towels: tuple[Towel, ...]) -> int:
     )
 
 
+@phase("parse")
 def read_input(file_path: str) -> tuple[list[Towel], list[Pattern]]:
     """
     Read the input file and return the list of Towel and Patter objects.
@@ -144,7 +147,11 @@ def part_1(file_path: str) -> int:
 
     towels, patterns = read_input(file_path)
 
-    possible_towels = list(ways(pattern.stripes, tuple(towels)) for pattern in patterns)
+    try:
+        possible_towels = [ways(pattern.stripes, tuple(towels)) for pattern in patterns]
+    finally:
+        # the keys hold the towels of this input
+        ways.clear()
 
     return sum(n > 0 for n in possible_towels)
 
@@ -159,6 +166,10 @@ def part_2(file_path: str) -> int:
 
     towels, patterns = read_input(file_path)
 
-    possible_towels = list(ways(pattern.stripes, tuple(towels)) for pattern in patterns)
+    try:
+        possible_towels = [ways(pattern.stripes, tuple(towels)) for pattern in patterns]
+    finally:
+        # the keys hold the towels of this input
+        ways.clear()
 
     return sum(n for n in possible_towels)
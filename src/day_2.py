@@ -53,18 +53,37 @@ Update your analysis by handling situations where the Problem Dampener can remov
 
 """
 
-from loguru import logger
+import numpy as np
 
+from instrument import phase
+from parsing import read_ragged
 
-def read_input(file_path: str) -> list[list[int]]:
+
+@phase("parse")
+def read_levels(file_path: str) -> tuple[np.ndarray, np.ndarray]:
     """
-    Read the input file and return the list of reports.
-    Each report is a list of integers.
+    Read the levels of every report into one flat array, along with the offsets of
+    the reports: the levels of report `i` are `levels[offsets[i] : offsets[i + 1]]`.
     """
-    with open(file_path, "r") as file:
-        reports = file.readlines()
+    return read_ragged(file_path)
+
 
-    return [list(map(int, report.strip().split())) for report in reports]
+def first_unsafe_step(report: list[int], direction: int, skip: int = -1) -> int:
+    """
+    Return the index of the level starting the first step of the report that does
+    not move in the given direction, 1 or -1, by one to three, or -1 when every
+    step does. The level at index `skip` is left out of the report.
+    """
+
+    previous = -1
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if previous >= 0 and not 1 <= (level - report[previous]) * direction <= 3:
+            return previous
+        previous = i
+
+    return -1
 
 
 def is_safe(report: list[int]) -> bool:
@@ -77,64 +96,151 @@ def is_safe(report: list[int]) -> bool:
     if len(report) < 2:
         return True
 
-    increasing = all(report[i] <= report[i + 1] for i in range(len(report) - 1))
-    decreasing = all(report[i] >= report[i + 1] for i in range(len(report) - 1))
+    # the first step gives the only direction the report can be safe in
+    direction = 1 if report[1] > report[0] else -1
+    return first_unsafe_step(report, direction) == -1
+
+
+def is_safe_with_dampener(report: list[int]) -> bool:
+    """
+    A report is safe if:
+    - The levels are either all increasing or all decreasing.
+    - Any two adjacent levels differ by at least one and at most three.
+
+    If the report is not safe, check if removing a single level makes it safe.
+
+    In each direction, the two levels of the first unsafe step stay next to each
+    other unless one of them is removed, so only these two are tried. This takes
+    at most six passes over the report, without copying it.
+    """
 
-    if increasing or decreasing:
-        return all(
-            [
-                abs(report[i] - report[i + 1]) in (1, 2, 3)
-                for i in range(len(report) - 1)
-            ]
-        )
+    if len(report) < 3:
+        return True
+
+    for direction in (1, -1):
+        step = first_unsafe_step(report, direction)
+        if step == -1:
+            return True
+        for skip in (step, step + 1):
+            if first_unsafe_step(report, direction, skip) == -1:
+                return True
 
     return False
 
 
-def part_1(file_path: str) -> int:
+def _step_flags(
+    levels: np.ndarray, offsets: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Count the number of safe reports.
-    A report is safe if the levels are either all increasing or all decreasing
-    and any two adjacent levels differ by at least one and at most three.
+    Return whether each step between two adjacent levels of the flat array
+    increases, and whether it decreases, by one to three. The steps between the last
+    level of a report and the first level of the next one are flagged as both, so
+    that they never make a report unsafe.
     """
-    reports = read_input(file_path)
-    safe_reports = 0
-    for report in reports:
-        if is_safe(report):
-            safe_reports += 1
 
-    return safe_reports
+    steps = np.diff(levels)
+    increasing = ((steps >= 1) & (steps <= 3)).astype(bool)
+    decreasing = ((steps <= -1) & (steps >= -3)).astype(bool)
 
+    boundaries = offsets[1:-1]
+    boundaries = boundaries[(boundaries > 0) & (boundaries < len(levels))] - 1
+    increasing[boundaries] = True
+    decreasing[boundaries] = True
 
-def is_safe_with_dampener(report: list[int]) -> bool:
+    return increasing, decreasing
+
+
+def _reduce_reports(
+    increasing: np.ndarray, decreasing: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """
+    Return whether all the steps of each report increase, or all of them decrease.
+    The steps of the reports are reduced at once with `logical_and.reduceat`,
+    starting at the first level of every report of at least two levels: the segment
+    of a report then also covers the steps up to the next one, which are all
+    flagged as safe by `_step_flags`.
     """
-    A report is safe if:
-    - The levels are either all increasing or all decreasing.
-    - Any two adjacent levels differ by at least one and at most three.
 
-    If the report is not safe, check if removing a single level makes it safe.
+    safe = np.ones(len(offsets) - 1, dtype=bool)
+    reports = np.flatnonzero(np.diff(offsets) >= 2)
+    if len(reports) == 0:
+        return safe
+
+    starts = offsets[reports]
+    safe[reports] = np.logical_and.reduceat(
+        increasing, starts
+    ) | np.logical_and.reduceat(decreasing, starts)
+
+    return safe
+
+
+def safe_reports(levels: np.ndarray, offsets: np.ndarray) -> np.ndarray:
     """
+    Return whether each report of the flat array of levels is safe, without a
+    Python loop over the reports.
+    """
+    return _reduce_reports(*_step_flags(levels, offsets), offsets)
 
-    if len(report) < 2:
-        return True
 
-    if is_safe(report):
-        return True
+def safe_reports_with_dampener(levels: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Return whether each report of the flat array of levels is safe once the Problem
+    Dampener removes at most one of its levels, without a Python loop over the
+    reports.
+
+    In each direction, removing level `j` makes a report safe when every unsafe
+    step is one of the two steps around `j`, and the new step from level `j - 1`
+    to level `j + 1` is safe. As in `is_safe_with_dampener`, only the two levels of
+    the first unsafe step are candidates, so each report checks four removals.
+    """
 
-    dampened_report: list[int] = []
-    for i in range(len(report)):
-        if i == 0:
-            dampened_report = report[i + 1 :]
-        if i == len(report) - 1:
-            dampened_report = report[:i]
-        if i > 0 and i < len(report) - 1:
-            dampened_report = report[:i] + report[i + 1 :]
+    n_reports = len(offsets) - 1
+    flags = _step_flags(levels, offsets)
+    starts, ends = offsets[:-1], offsets[1:]
+    # the reports of up to two levels are always safe once a level is removed
+    safe = _reduce_reports(*flags, offsets) | (ends - starts < 3)
+    if safe.all():
+        return safe
+
+    report_of_level = np.repeat(np.arange(n_reports), ends - starts)
+    last_level = len(levels) - 1
+    dampened = np.zeros(n_reports, dtype=bool)
+
+    for steps_safe, direction in zip(flags, (1, -1)):
+        # the unsafe steps by the index of the level starting them, grouped by report
+        # as they are sorted, keeping the first and last ones of each report
+        unsafe_steps = np.flatnonzero(~steps_safe)
+        reports = report_of_level[unsafe_steps]
+        is_first = np.ones(len(reports), dtype=bool)
+        is_first[1:] = reports[1:] != reports[:-1]
+        first_index = np.flatnonzero(is_first)
+        last_index = np.append(first_index[1:] - 1, len(reports) - 1)
+
+        reports = reports[first_index]
+        pending = ~safe[reports]
+        reports = reports[pending]
+        first = unsafe_steps[first_index[pending]]
+        last = unsafe_steps[last_index[pending]]
+
+        for removed in (first, first + 1):
+            previous = np.maximum(removed - 1, 0)
+            following = np.minimum(removed + 1, last_level)
+            bridge = (levels[following] - levels[previous]) * direction
+            # without a level on both sides, removing the level leaves no new step
+            inner = (removed > starts[reports]) & (removed < ends[reports] - 1)
+            bridge_safe = ~inner | ((bridge >= 1) & (bridge <= 3)).astype(bool)
+            dampened[reports[(last <= removed) & bridge_safe]] = True
+
+    return safe | dampened
 
-        if is_safe(dampened_report):
-            return True
 
-    logger.warning(f"Report {report} is not safe.")
-    return False
+def part_1(file_path: str) -> int:
+    """
+    Count the number of safe reports.
+    A report is safe if the levels are either all increasing or all decreasing
+    and any two adjacent levels differ by at least one and at most three.
+    """
+    return int(safe_reports(*read_levels(file_path)).sum())
 
 
 def part_2(file_path: str) -> int:
@@ -143,10 +249,4 @@ def part_2(file_path: str) -> int:
     A report is safe if the levels are either all increasing or all decreasing
     and any two adjacent levels differ by at least one and at most three.
     """
-    reports = read_input(file_path)
-    safe_reports = 0
-    for report in reports:
-        if is_safe_with_dampener(report):
-            safe_reports += 1
-
-    return safe_reports
+    return int(safe_reports_with_dampener(*read_levels(file_path)).sum())
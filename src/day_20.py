@@ -174,11 +174,12 @@ There are 3 cheats that save 76 picoseconds.
 Find the best cheats using the updated cheating rules. How many cheats would save you at least 100 picoseconds?
 """
 
-import os
 from typing import Optional
 from loguru import logger
-import networkx as nx
-from tqdm import tqdm
+
+from cache import cached_parse
+from grid import Grid as BaseGrid
+from search import bfs, reconstruct_path
 
 DIRECTIONS = [(-1, 0), (0, -1), (1, 0), (0, 1)]
 
@@ -210,7 +211,7 @@ class Style:
 
 
 class Grid:
-    graph: nx.DiGraph
+    track: BaseGrid
     start: tuple[int, int]
     end: tuple[int, int]
     width: int
@@ -219,14 +220,14 @@ class Grid:
 
     def __init__(
         self,
-        graph: nx.DiGraph,
+        track: BaseGrid,
         start: tuple[int, int],
         end: tuple[int, int],
         width: int,
         height: int,
         possible_cheats: list[list[tuple[int, int]]],
     ) -> None:
-        self.graph = graph
+        self.track = track
         self.start = start
         self.end = end
         self.width = width
@@ -234,10 +235,10 @@ class Grid:
         self.possible_cheats = possible_cheats
 
     @classmethod
+    @cached_parse(version=2)
     def from_file(cls, file_path: str) -> "Grid":
         with open(file_path, "r") as f:
             data = f.read().splitlines()
-            G = nx.DiGraph()
 
             start = None
             end = None
@@ -258,14 +259,7 @@ class Grid:
                     for dx1, dy1 in DIRECTIONS:
                         x1, y1 = i + dx1, j + dy1
 
-                        if (
-                            0 <= x1 < len(data)
-                            and 0 <= y1 < len(row)
-                            and data[x1][y1] != "#"
-                        ):
-                            G.add_edge((i, j), (x1, y1), weight=1)
-
-                        elif data[x1][y1] == "#":
+                        if data[x1][y1] == "#":
                             x2, y2 = x1 + dx1, y1 + dy1
 
                             if (
@@ -292,13 +286,31 @@ class Grid:
 
             assert start is not None
             assert end is not None
-            return cls(G, start, end, width, height, possible_cheats)
+            # the track is padded with walls, see grid.Grid
+            track = BaseGrid.from_lines(data, border=ord("#"))
+            return cls(track, start, end, width, height, possible_cheats)
+
+    def _search(self) -> tuple[list[int], list[int]]:
+        data, offsets, wall = self.track.data, self.track.offsets, ord("#")
+
+        def neighbours(cell: int) -> list[int]:
+            return [cell + offset for offset in offsets if data[cell + offset] != wall]
+
+        return bfs(
+            len(data),
+            [self.track.cell(*self.start)],
+            neighbours,
+            target=self.track.cell(*self.end),
+        )
 
-    def shortest_path(self) -> list | dict:
-        return nx.shortest_path(self.graph, self.start, self.end)
+    def shortest_path(self) -> list[tuple[int, int]]:
+        _, predecessors = self._search()
+        path = reconstruct_path(predecessors, self.track.cell(*self.end))
+        return [self.track.coords(cell) for cell in path]
 
     def shortest_path_length(self) -> int:
-        return nx.shortest_path_length(self.graph, self.start, self.end)
+        distances, _ = self._search()
+        return distances[self.track.cell(*self.end)]
 
     def plot(
         self,
@@ -317,7 +329,7 @@ class Grid:
                 elif (i, j) == self.end:
                     color = Style.get_style("E")
                     print(color + "E" + Style.RESET, end="")
-                elif (i, j) in self.graph.nodes:
+                elif self.track.data[self.track.cell(i, j)] != ord("#"):
                     color = Style.get_style(".")
                     print(color + "." + Style.RESET, end="")
                 elif cheat and (i, j) in cheat:
@@ -330,8 +342,13 @@ class Grid:
             print()
         print()
 
-    def solve_with_cheats(self, allowed_cheat_duration: int) -> int:
-        shortest_path = self.shortest_path()
+    def solve_with_cheats(
+        self,
+        allowed_cheat_duration: int,
+        shortest_path: Optional[list[tuple[int, int]]] = None,
+    ) -> int:
+        if shortest_path is None:
+            shortest_path = self.shortest_path()
         path = {loc: dist for dist, loc in enumerate(shortest_path)}
 
         save_over_100 = 0
@@ -349,28 +366,42 @@ class Grid:
         return save_over_100
 
 
+def parse(file_path: str) -> tuple[Grid, list[tuple[int, int]]]:
+    """
+    Read the racetrack and find its shortest path, which both parts search for cheats.
+    """
+    grid = Grid.from_file(file_path)
+    return grid, grid.shortest_path()
+
+
 # Path: src/day_20.py
 # --- Part One ---
 
 
+def solve_part_1(race: tuple[Grid, list[tuple[int, int]]]) -> int:
+    grid, shortest_path = race
+    return grid.solve_with_cheats(allowed_cheat_duration=2, shortest_path=shortest_path)
+
+
 def part_1(file_path: str) -> int:
     """
     Read the input file and return the solution.
     """
+    return solve_part_1(parse(file_path))
 
-    grid = Grid.from_file(file_path)
 
-    return grid.solve_with_cheats(allowed_cheat_duration=2)
+# --- Part Two ---
 
 
-# --- Part Two ---
+def solve_part_2(race: tuple[Grid, list[tuple[int, int]]]) -> int:
+    grid, shortest_path = race
+    return grid.solve_with_cheats(
+        allowed_cheat_duration=20, shortest_path=shortest_path
+    )
 
 
 def part_2(file_path: str) -> int:
     """
     Read the input file and return the solution.
     """
-
-    grid = Grid.from_file(file_path)
-
-    return grid.solve_with_cheats(allowed_cheat_duration=20)
+    return solve_part_2(parse(file_path))
@@ -106,9 +106,11 @@ Find the fewest number of button presses you'll need to perform in order to caus
 import pathlib
 import sys
 
-from functools import cache
 from itertools import product
 
+from instrument import phase
+from memo import memo
+
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[3] / "lib" / "python"))
 
 
@@ -116,7 +118,7 @@ NUMERIC = "789456123 0A"
 DIRECTIONAL = " ^A<v>"
 
 
-@cache
+@memo(maxsize=8)
 def paths(keymap: str) -> dict[tuple[str, str], list[str]]:
     """
     Generate all possible paths between two keys on a keypad.
@@ -173,7 +175,7 @@ def paths(keymap: str) -> dict[tuple[str, str], list[str]]:
     return pathmap
 
 
-@cache
+@memo(maxsize=4096)
 def presses(code: str, depth: int, keypad: str = NUMERIC) -> int:
     # base case
     if depth == 1:
@@ -200,7 +202,7 @@ def part_1(file_path: str) -> int:
     Read the input file and return the solution.
     """
 
-    with open(file_path, "r") as file:
+    with phase("parse"), open(file_path, "r") as file:
         codes = [line.strip() for line in file]
 
     n_robots = 2
@@ -219,7 +221,7 @@ def part_2(file_path: str) -> int:
     Read the input file and return the solution.
     """
 
-    with open(file_path, "r") as file:
+    with phase("parse"), open(file_path, "r") as file:
         codes = [line.strip() for line in file]
 
     n_robots = 25
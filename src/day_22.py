@@ -116,11 +116,13 @@ Figure out the best sequence to tell the monkey so that by looking for that same
 # Path: src/day_22.py
 # --- Part One ---
 
-from functools import cache
 from typing import Optional
 
 from tqdm import tqdm
 
+from instrument import phase
+from parsing import read_integers
+
 
 def _mix(value: int, secret: int) -> int:
     """
@@ -138,7 +140,6 @@ def _prune(secret: int) -> int:
     return secret % 16777216
 
 
-@cache
 def simulate_one(secret: int) -> int:
     """
     Simulate the creation of a new secret number.
@@ -206,13 +207,13 @@ class Sequence:
         return None
 
 
+@phase("parse")
 def read_code(file_path: str) -> list[int]:
     """
     Read the input file and return the list of secret numbers.
     """
 
-    with open(file_path) as file:
-        return [int(line.strip()) for line in file]
+    return read_integers(file_path).tolist()
 
 
 def part_1(file_path: str) -> int:
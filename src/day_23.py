@@ -87,13 +87,14 @@ import itertools
 import os
 from loguru import logger
 import networkx as nx
-import matplotlib.pyplot as plt
 
+from instrument import phase
 
 # Path: src/day_23.py
 # --- Part One ---
 
 
+@phase("parse")
 def read_file(file_path: str) -> nx.Graph:
     """
     Read the input file and return the graph.
@@ -142,6 +143,8 @@ def part_1(file_path: str) -> int:
     graph = read_file(file_path)
 
     if os.environ.get("LOGURU_LEVEL") == "DEBUG":
+        import matplotlib.pyplot as plt
+
         nx.draw(graph, with_labels=True)
         plt.show()
 
@@ -192,7 +192,8 @@ Your system of gates and wires has four pairs of gates which need their output w
 from typing import Optional
 from loguru import logger
 from networkx import DiGraph
-from networkx import draw
+
+from instrument import TRACE, phase
 
 OPERATORS = ["AND", "OR", "XOR", "SELF"]
 
@@ -213,20 +214,24 @@ class OperatorGraph(DiGraph):
         """
 
         if self.nodes[node]["value"] is not None:
-            logger.debug(f"Node {node} already computed.")
+            if TRACE:
+                logger.debug(f"Node {node} already computed.")
             return
 
         predecessors = list(self.predecessors(node))
 
-        logger.debug(
-            f"Computing node: {node}, with {predecessors} using {self.nodes[node]['operator']} operator."
-        )
+        if TRACE:
+            logger.debug(
+                f"Computing node: {node}, with {predecessors} using {self.nodes[node]['operator']} operator."
+            )
 
         if self.nodes[list(self.predecessors(node))[0]]["value"] is None:
-            logger.debug(f"   Predecessor {predecessors[0]} not computed.")
+            if TRACE:
+                logger.debug(f"   Predecessor {predecessors[0]} not computed.")
             return
         if self.nodes[list(self.predecessors(node))[1]]["value"] is None:
-            logger.debug(f"   Predecessor {predecessors[1]} not computed.")
+            if TRACE:
+                logger.debug(f"   Predecessor {predecessors[1]} not computed.")
             return
 
         operator = self.nodes[node]["operator"]
@@ -278,11 +283,13 @@ class OperatorGraph(DiGraph):
         """
 
         import matplotlib.pyplot as plt
+        from networkx import draw
 
         draw(self, with_labels=True)
         plt.show()
 
 
+@phase("parse")
 def read_file(file_path: str) -> tuple[OperatorGraph, list[str]]:
     """
     Read the input file and return the graph.
@@ -118,6 +118,8 @@ You nod, and The Historians quickly work to collect their notes into the final s
 
 from loguru import logger
 
+from instrument import TRACE, count, phase
+
 
 class Lock:
     pins: list[int]
@@ -132,16 +134,18 @@ class Lock:
     def from_data(cls, data: list[str]):
         pins: list[int] = []
 
-        for i in range(len(data)):
-            logger.debug(f"Data: {data[i]}")
+        if TRACE:
+            for i in range(len(data)):
+                logger.debug(f"Data: {data[i]}")
 
         for i in range(len(data[0])):
             for n in range(len(data)):
                 if data[n][i] == ".":
                     pins.append(n - 1)
                     break
-        logger.debug(f"Pins: {pins}")
-        logger.debug("-------")
+        if TRACE:
+            logger.debug(f"Pins: {pins}")
+            logger.debug("-------")
         return cls(pins)
 
 
@@ -163,28 +167,33 @@ class Key:
     def from_data(cls, data: list[str]):
         teeth: list[int] = []
 
-        for i in range(len(data)):
-            logger.debug(f"Data: {data[i]}")
+        if TRACE:
+            for i in range(len(data)):
+                logger.debug(f"Data: {data[i]}")
 
         for i in range(len(data[0])):
             for n in range(len(data)):
                 if data[n][i] == "#":
                     teeth.append(6 - n)
                     break
-        logger.debug(f"Teeth: {teeth}")
-        logger.debug("-------")
+        if TRACE:
+            logger.debug(f"Teeth: {teeth}")
+            logger.debug("-------")
         return cls(teeth)
 
 
 def fit_key_in_lock(key: Key, lock: Lock):
-    logger.debug(f"K: {key}")
-    logger.debug(f"L: {lock}")
+    if TRACE:
+        logger.debug(f"K: {key}")
+        logger.debug(f"L: {lock}")
 
     for i in range(len(key.teeth)):
         if key.teeth[i] + lock.pins[i] > 5:
-            logger.debug(f"Lock {lock} and key {key}: overlap on column {i+1}.")
+            if TRACE:
+                logger.debug(f"Lock {lock} and key {key}: overlap on column {i+1}.")
             return False
-    logger.debug(f"Lock {lock} and key {key}: all columns fit!")
+    if TRACE:
+        logger.debug(f"Lock {lock} and key {key}: all columns fit!")
     return True
 
 
@@ -192,6 +201,7 @@ def _is_lock(data: list[str]) -> bool:
     return all([c == "#" for c in data[0]])
 
 
+@phase("parse")
 def read_file(file_path: str) -> tuple[list[Key], list[Lock]]:
     data: list[str] = []
     keys: list[Key] = []
@@ -225,6 +235,7 @@ def part_1(file_path: str) -> int:
     keys, locks = read_file(file_path)
 
     fits: int = 0
+    count("key and lock pairs tried", len(locks) * len(keys))
 
     for l in locks:
         for k in keys:
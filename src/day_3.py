@@ -37,6 +37,8 @@ This time, the sum of the results is 48 (2*4 + 8*5).
 
 import re
 
+from instrument import phase
+
 VALID_REGEX = r"mul\((\d{1,3}),(\d{1,3})\)"
 DO_REGEX = r"do\(\)"
 DONT_REGEX = r"don't\(\)"
@@ -44,14 +46,14 @@ FULL_REGEX = r"mul\((\d{1,3}),(\d{1,3})\)|(do)\(\)|(don't)\(\)"
 
 
 def part_1(file_path: str) -> int:
-    with open(file_path, "r") as file:
+    with phase("parse"), open(file_path, "r") as file:
         data = file.read()
-        matches = re.findall(VALID_REGEX, data)
-        return sum([int(x) * int(y) for x, y in matches])
+    matches = re.findall(VALID_REGEX, data)
+    return sum([int(x) * int(y) for x, y in matches])
 
 
 def part_2(file_path: str) -> int:
-    with open(file_path, "r") as file:
+    with phase("parse"), open(file_path, "r") as file:
         data = file.read()
     matches = re.findall(FULL_REGEX, data)
 
@@ -65,6 +65,8 @@ In this example, an X-MAS appears 9 times.
 Flip the word search from the instructions back over to the word search side and try again. How many times does an X-MAS appear?
 """
 
+from instrument import phase
+
 
 class LetterGrid:
     grid: list[list[str]]
@@ -117,6 +119,7 @@ class LetterGrid:
         return cls([list(row.strip()) for row in s.strip().split("\n")])
 
 
+@phase("parse")
 def read_input(file_path: str) -> LetterGrid:
     with open(file_path, "r") as file:
         return LetterGrid([line.strip().split() for line in file.readlines()])
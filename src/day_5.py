@@ -89,6 +89,8 @@ Find the updates which are not in the correct order. What do you get if you add
 
 from loguru import logger
 
+from instrument import phase
+
 
 class Rule:
     first: int
@@ -172,6 +174,7 @@ class Update:
         return ordered_update
 
 
+@phase("parse")
 def read_input(file_path: str) -> tuple[list[Rule], list[Update]]:
     """
     Reads the input file and returns the rules and updates.
@@ -179,6 +179,9 @@ You need to get the guard stuck in a loop by adding a single new obstruction. Ho
 
 from loguru import logger
 
+import render
+from instrument import phase
+
 
 class Direction:
     UP = "^"
@@ -504,6 +507,9 @@ class Grid:
         return cls(str_grid, guard, obstacles, visited_positions={guard.position})
 
     def plot_map(self, with_added_obstacle: bool = False):
+        if not render.enabled():
+            return
+
         updated_grid = [["." for _ in range(self.n_cols)] for _ in range(self.n_rows)]
 
         # Add visited positions
@@ -522,9 +528,7 @@ class Grid:
         if with_added_obstacle:
             updated_grid[self.obstacles[-1].row][self.obstacles[-1].col] = "O"
 
-        for line in updated_grid:
-            print("".join(line))
-        print()
+        render.snapshot("day_6", ["".join(line) for line in updated_grid])
 
     def move_guard(self, verbose: bool = False, with_added_obstacle: bool = False):
         row, col = self.guard.position.row, self.guard.position.col
@@ -559,26 +563,30 @@ def read_map(file_path: str) -> list[list[str]]:
         return [[c for c in line.strip()] for line in file]
 
 
-def part_1(file_path: str):
+@phase("parse")
+def parse(file_path: str) -> Grid:
+    """
+    Read the map shared by both parts.
+    """
+    return Grid.from_str(read_map(file_path))
+
+
+def solve_part_1(grid: Grid):
     """
     We need to predict the path of the guard and determine how many distinct positions
     the guard will visit before leaving the mapped area.
     """
 
-    grid = Grid.from_str(read_map(file_path))
     grid.plot_map()
-    grid.move_guard(verbose=True)
+    grid.move_guard(verbose=render.enabled())
 
 
-def part_2(file_path: str):
+def solve_part_2(grid: Grid):
     """
     We need to find all the possible positions where we can place an obstacle
     such that the guard gets stuck in a loop.
     """
 
-    # Load the grid
-    grid = Grid.from_str(read_map(file_path))
-
     # We need to keep track of the guard's starting position and direction
     guard_start = grid.guard.position
     guard_start_direction = grid.guard.direction
@@ -623,3 +631,11 @@ def part_2(file_path: str):
         logger.info(f"Done with position {i+1}/{len(possible_positions)}.")
 
     print(f"Found {looping_obstacles} looping obstacles.")
+
+
+def part_1(file_path: str):
+    return solve_part_1(parse(file_path))
+
+
+def part_2(file_path: str):
+    return solve_part_2(parse(file_path))
@@ -47,17 +47,22 @@ Using your new knowledge of elephant hiding spots, determine which equations cou
 
 import argparse
 
+from instrument import phase
+from parsing import read_ragged, split_lines
 
-def part_1(file_path: str) -> int:
-    with open(file_path, "r") as file:
-        lines = file.readlines()
 
-    total = 0
-    for line in lines:
-        line_content = line.strip().split(":")
-        test_value = int(line_content[0])
-        numbers = list(map(int, line_content[1].split()))
+@phase("parse")
+def read_input(file_path: str) -> list[list[int]]:
+    """
+    Read the input file and return the equations.
+    Each equation is a list of integers starting with the test value.
+    """
+    return [equation for equation in split_lines(*read_ragged(file_path)) if equation]
 
+
+def part_1(file_path: str) -> int:
+    total = 0
+    for test_value, *numbers in read_input(file_path):
         n_operators = len(numbers) - 1
 
         for i in range(2**n_operators):
@@ -84,15 +89,8 @@ def part_1(file_path: str) -> int:
 
 
 def part_2(file_path: str) -> int:
-    with open(file_path, "r") as file:
-        lines = file.readlines()
-
     total = 0
-    for line in lines:
-        line_content = line.strip().split(":")
-        test_value = int(line_content[0])
-        numbers = list(map(int, line_content[1].split()))
-
+    for test_value, *numbers in read_input(file_path):
         n_operators = len(numbers) - 1
 
         for i in range(3**n_operators):
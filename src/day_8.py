@@ -115,133 +115,98 @@ Calculate the impact of the signal using this updated model. How many unique loc
 # Path: src/day_8.py
 # --- Part One ---
 
-
-class Position:
-    x: int
-    y: int
-
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
+import render
+from grid import Grid as BaseGrid
 
 
 class Antenna:
     frequency: str
-    position: Position
+    row: int
+    col: int
 
-    def __init__(self, frequency: str, position: Position):
+    def __init__(self, frequency: str, row: int, col: int):
         self.frequency = frequency
-        self.position = position
+        self.row = row
+        self.col = col
+
 
-    def is_out_of_bounds(
-        self, dx: int, dy: int, grid: list[list[str]], factor: int = 1
-    ) -> bool:
-        return (
-            self.position.x + dx * factor < 0
-            or self.position.x + dx * factor >= len(grid[0])
-            or self.position.y + dy * factor < 0
-            or self.position.y + dy * factor >= len(grid)
-        )
+class Grid(BaseGrid):
+    """
+    Map of the antennas stored in a padded bytearray, see `grid.Grid`.
+    The antinodes are stored as cell ids.
+    """
 
+    def get_antennas(self) -> dict[str, list[Antenna]]:
+        """
+        Group the antennas by frequency, only antennas of the same frequency create
+        antinodes.
+        """
+        antennas: dict[str, list[Antenna]] = {}
+        for cell in self.cells():
+            if self.data[cell] != ord("."):
+                row, col = self.coords(cell)
+                frequency = self.char(cell)
+                antennas.setdefault(frequency, []).append(Antenna(frequency, row, col))
 
-class Grid:
-    antennas: list[Antenna]
-    grid: list[list[str]]
+        return antennas
 
-    def __init__(self, antennas: list[Antenna], grid: list[list[str]]):
-        self.antennas = antennas
-        self.grid = grid
+    def __plot(self, antinodes: set[int]):
+        if not render.enabled():
+            return
 
-    def __plot(self, antinodes: set[Position]):
-        plot_grid = [list(row) for row in self.grid]
+        plot_grid = self.copy()
 
         for antinode in antinodes:
-            plot_grid[antinode.y][antinode.x] = "#"
-
-        for antenna in self.antennas:
-            plot_grid[antenna.position.y][antenna.position.x] = antenna.frequency
+            if plot_grid.data[antinode] == ord("."):
+                plot_grid.data[antinode] = ord("#")
 
-        for row in plot_grid:
-            print("".join(row))
+        render.snapshot("day_8", str(plot_grid).splitlines())
 
-    def get_antinodes(self) -> set[Position]:
+    def get_antinodes(self) -> set[int]:
         antinodes = set()
 
-        for i in range(len(self.antennas)):
-            for j in range(i + 1, len(self.antennas)):
-                antinodes.update(
-                    self.get_antinodes_between(self.antennas[i], self.antennas[j])
-                )
+        for antennas in self.get_antennas().values():
+            for i in range(len(antennas)):
+                for j in range(i + 1, len(antennas)):
+                    antinodes.update(
+                        self.get_antinodes_between(antennas[i], antennas[j])
+                    )
 
         self.__plot(antinodes)
         return antinodes
 
-    def get_antinodes_with_resonant_harmonics(self) -> set[Position]:
+    def get_antinodes_with_resonant_harmonics(self) -> set[int]:
         antinodes = set()
 
-        for i in range(len(self.antennas)):
-            for j in range(i + 1, len(self.antennas)):
-                antinodes.update(
-                    self.get_antinodes_between_with_resonant_harmonics(
-                        self.antennas[i], self.antennas[j]
+        for antennas in self.get_antennas().values():
+            for i in range(len(antennas)):
+                for j in range(i + 1, len(antennas)):
+                    antinodes.update(
+                        self.get_antinodes_between_with_resonant_harmonics(
+                            antennas[i], antennas[j]
+                        )
                     )
-                )
 
         self.__plot(antinodes)
         return antinodes
 
     def get_antinodes_between_with_resonant_harmonics(
         self, antenna_1: Antenna, antenna_2: Antenna
-    ) -> set[Position]:
-        antinodes: set[Position] = set()
-
-        if antenna_1.frequency == antenna_2.frequency:
-            x1 = antenna_1.position.x
-            y1 = antenna_1.position.y
-            x2 = antenna_2.position.x
-            y2 = antenna_2.position.y
-
-            antinodes.add(antenna_1.position)
-            antinodes.add(antenna_2.position)
-
-            # compute the difference between the x and y coordinates
-            # the diff is the delta from antenna_1 to antenna_2
-            x_diff = x2 - x1
-            y_diff = y2 - y1
-
-            # for each antenna decide if the delta needs to be added or subtracted
-            factor: int = 1
-            stop: bool = False
-
-            while not stop:
-                stop_1 = antenna_1.is_out_of_bounds(
-                    x_diff, y_diff, self.grid, factor=factor
-                )
-                stop_2 = antenna_1.is_out_of_bounds(
-                    x_diff, y_diff, self.grid, factor=-factor
-                )
-
-                if stop_1 and stop_2:
-                    stop = True
-                    break
-
-                # check if the new position is within the grid
-                if not antenna_1.is_out_of_bounds(
-                    x_diff, y_diff, self.grid, factor=factor
-                ):
-                    antinodes.add(Position(x1 + x_diff * factor, y1 + y_diff * factor))
-                if not antenna_1.is_out_of_bounds(
-                    x_diff, y_diff, self.grid, factor=-factor
-                ):
-                    antinodes.add(Position(x1 - x_diff * factor, y1 - y_diff * factor))
-
-                factor += 1
+    ) -> set[int]:
+        antinodes: set[int] = set()
+
+        # compute the difference between the row and col coordinates
+        # the diff is the delta from antenna_1 to antenna_2
+        row_diff = antenna_2.row - antenna_1.row
+        col_diff = antenna_2.col - antenna_1.col
+
+        # walk from antenna_1 in both directions until leaving the grid
+        for sign in [1, -1]:
+            row, col = antenna_1.row, antenna_1.col
+            while self.contains(row, col):
+                antinodes.add(self.cell(row, col))
+                row += sign * row_diff
+                col += sign * col_diff
 
         return antinodes
 
@@ -249,40 +214,22 @@ class Grid:
         self,
         antenna_1: Antenna,
         antenna_2: Antenna,
-    ) -> set[Position]:
-        antinodes: set[Position] = set()
-
-        if antenna_1.frequency == antenna_2.frequency:
-            x1 = antenna_1.position.x
-            y1 = antenna_1.position.y
-            x2 = antenna_2.position.x
-            y2 = antenna_2.position.y
-
-            # compute the difference between the x and y coordinates
-            # the diff is the delta from antenna_1 to antenna_2
-            x_diff = x2 - x1
-            y_diff = y2 - y1
-
-            # for each antenna decide if the delta needs to be added or subtracted
-            for i in [-1, 2]:
-                # check if the new position is within the grid
-                if not antenna_1.is_out_of_bounds(x_diff, y_diff, self.grid, factor=i):
-                    antinodes.add(Position(x1 + x_diff * i, y1 + y_diff * i))
+    ) -> set[int]:
+        antinodes: set[int] = set()
 
-        return antinodes
+        # compute the difference between the row and col coordinates
+        # the diff is the delta from antenna_1 to antenna_2
+        row_diff = antenna_2.row - antenna_1.row
+        col_diff = antenna_2.col - antenna_1.col
+
+        # for each antenna decide if the delta needs to be added or subtracted
+        for i in [-1, 2]:
+            row, col = antenna_1.row + row_diff * i, antenna_1.col + col_diff * i
+            # check if the new position is within the grid
+            if self.contains(row, col):
+                antinodes.add(self.cell(row, col))
 
-    @classmethod
-    def from_file(cls, file_path: str):
-        antennas = []
-        with open(file_path, "r") as file:
-            grid = [[char for char in line.strip()] for line in file]
-            for y in range(len(grid)):
-                for x in range(len(grid[y])):
-                    char = grid[y][x]
-                    if char != ".":
-                        antennas.append(Antenna(char, Position(x, y)))
-
-        return cls(antennas, grid)
+        return antinodes
 
 
 def part_1(file_path: str) -> int:
@@ -50,7 +50,10 @@ Compact the amphipod's hard drive using the process he requested. What is the re
 # Path: src/day_9.py
 # --- Part One ---
 
+from instrument import phase
 
+
+@phase("parse")
 def load_disk_map(document_path: str) -> str:
     """
     Read the document and return the content as a string.
@@ -95,7 +98,7 @@ class FreeSpaceQueue:
 
 
 def parse_disk(disk_map: str) -> tuple[list[int], FreeSpaceQueue, list[str]]:
-    free_space_locs, free_space_queue, file = [], FreeSpaceQueue(), []  # type:ignore
+    free_space_locs, free_space_queue, file = [], FreeSpaceQueue(), []  # type: ignore
     for k, char in enumerate(disk_map):
         start_ix = len(file)
         if k % 2 == 0:
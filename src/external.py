@@ -0,0 +1,133 @@
+"""
+External-memory helpers for the solvers of inputs larger than the memory.
+
+The memory budget is read from the `AOC_MAX_MEMORY` environment variable, set by
+`python src/aoc.py --max-memory 512M`. A solver supporting it reads its input in
+chunks that fit the budget, writes each chunk sorted to a temporary int64 run file,
+then streams the values back in order with a k-way merge of the memory-mapped runs:
+
+    with tempfile.TemporaryDirectory() as directory:
+        runs = write_sorted_runs(iter_records(file_path, 2, budget), 2, directory)
+        for value in merge_runs(runs[0], budget):
+            ...
+"""
+
+import heapq
+import os
+import re
+from typing import Iterator, Optional
+
+import numpy as np
+
+from parsing import integers
+
+MAX_MEMORY_ENV = "AOC_MAX_MEMORY"
+
+# bytes of memory used by the tokenizer for each byte of a chunk, see parsing.py
+CHUNK_MEMORY_FACTOR = 8
+
+# bytes of memory held by a value buffered by the merge, as a Python integer
+MERGE_VALUE_MEMORY = 64
+
+SIZE_PATTERN = re.compile(r"(\d+)\s*([KMGT]?)(i?B)?", re.IGNORECASE)
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a memory size such as "512M", "2G" or "1048576" into bytes.
+
+    >>> parse_size("512M")
+    536870912
+    """
+    match = SIZE_PATTERN.fullmatch(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid memory size: {value}")
+    return int(match[1]) * SIZE_UNITS[match[2].upper()]
+
+
+def max_memory() -> Optional[int]:
+    """
+    Return the memory budget of the solvers in bytes, or None without a budget.
+    """
+    value = os.environ.get(MAX_MEMORY_ENV)
+    return parse_size(value) if value else None
+
+
+def exceeds_memory(file_path: str) -> bool:
+    """
+    Check if parsing the whole file at once would not fit the memory budget.
+    """
+    budget = max_memory()
+    return (
+        budget is not None and os.path.getsize(file_path) * CHUNK_MEMORY_FACTOR > budget
+    )
+
+
+def iter_records(file_path: str, width: int, budget: int) -> Iterator[np.ndarray]:
+    """
+    Read the integers of the file in chunks of whole lines that fit the budget and
+    yield them as int64 arrays of shape (n_records, width).
+    """
+
+    chunk_size = max(budget // CHUNK_MEMORY_FACTOR, 1024)
+    with open(file_path, "rb") as file:
+        remainder = b""
+        while data := file.read(chunk_size):
+            # keep the last partial line for the next chunk
+            data = remainder + data
+            end = data.rfind(b"\n") + 1
+            data, remainder = data[:end], data[end:]
+            if data:
+                yield _records(data, width)
+
+        if remainder.strip():
+            yield _records(remainder, width)
+
+
+def _records(data: bytes, width: int) -> np.ndarray:
+    values = integers(data)
+    if values.dtype == object:
+        raise ValueError("The external-memory mode only supports 64-bit integers.")
+    if len(values) % width:
+        raise ValueError(
+            f"Found {len(values)} integers in a chunk, "
+            f"which is not a multiple of {width}."
+        )
+    return values.reshape(-1, width)
+
+
+def write_sorted_runs(
+    chunks: Iterator[np.ndarray], width: int, directory: str
+) -> list[list[str]]:
+    """
+    Sort each column of each chunk and write it to an int64 run file in the
+    directory. Returns the paths of the runs of each column.
+    """
+
+    runs: list[list[str]] = [[] for _ in range(width)]
+    for index, chunk in enumerate(chunks):
+        for column, column_runs in enumerate(runs):
+            path = os.path.join(directory, f"run_{column}_{index}.npy")
+            np.save(path, np.sort(chunk[:, column]))
+            column_runs.append(path)
+
+    return runs
+
+
+def _iter_run(path: str, block: int) -> Iterator[int]:
+    """
+    Yield the values of a memory-mapped run file, reading `block` values at once.
+    """
+    run = np.load(path, mmap_mode="r")
+    for start in range(0, len(run), block):
+        yield from run[start : start + block].tolist()
+
+
+def merge_runs(paths: list[str], budget: int) -> Iterator[int]:
+    """
+    Yield the values of the sorted run files in order, with a k-way merge buffering
+    at most the budget across the runs.
+    """
+    block = max(budget // (MERGE_VALUE_MEMORY * max(len(paths), 1)), 1)
+    return heapq.merge(*(_iter_run(path, block) for path in paths))
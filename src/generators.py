@@ -0,0 +1,669 @@
+"""
+Synthetic input generators.
+
+Each `generate_day_N(scale, seed)` function returns the content of a valid input
+file for day N. The meaning of `scale` depends on the day (number of lines, side of
+a grid, number of nodes...) and is given in the docstring of each generator. The
+same seed always produces the same input.
+
+    python src/generators.py --day 6 --scale 10000 --seed 0
+"""
+
+import argparse
+import math
+import os
+import random
+from typing import Callable
+
+SYNTHETIC_DIR = "inputs/synthetic"
+
+
+def _grid_from_bytes(
+    rng: random.Random, width: int, height: int, alphabet: bytes
+) -> list[bytearray]:
+    """
+    Draw a grid of characters uniformly picked in the alphabet.
+    Rows are built with bytes.translate to stay fast on very large grids.
+    """
+    table = bytes(alphabet[i % len(alphabet)] for i in range(256))
+    return [bytearray(rng.randbytes(width).translate(table)) for _ in range(height)]
+
+
+def _join_rows(rows: list[bytearray]) -> str:
+    return "\n".join(row.decode() for row in rows) + "\n"
+
+
+def generate_day_1(scale: int, seed: int = 0) -> str:
+    """
+    `scale` pairs of 5-digit location IDs.
+    """
+    rng = random.Random(seed)
+    # draw the IDs from a pool so that the right list contains repeated values
+    pool = [rng.randint(10000, 99999) for _ in range(max(1, scale // 2))]
+    lines = [f"{rng.choice(pool)}   {rng.choice(pool)}" for _ in range(scale)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_2(scale: int, seed: int = 0) -> str:
+    """
+    `scale` reports of 5 to 8 levels, about half of them safe.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(scale):
+        direction = rng.choice([-1, 1])
+        level = rng.randint(20, 80)
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            level += direction * rng.randint(1, 3)
+            report.append(level)
+        # break some of the reports
+        if rng.random() < 0.5:
+            report[rng.randrange(len(report))] += rng.choice([-4, -1, 0, 1, 4])
+        lines.append(" ".join(map(str, report)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_3(scale: int, seed: int = 0) -> str:
+    """
+    A corrupted memory made of `scale` instructions, valid or not.
+    """
+    rng = random.Random(seed)
+    junk = "!@#$%^&*()[]{}<>?+-_ ,;:'what"
+    chunks = []
+    for _ in range(scale):
+        kind = rng.random()
+        x, y = rng.randint(1, 999), rng.randint(1, 999)
+        if kind < 0.6:
+            chunks.append(f"mul({x},{y})")
+        elif kind < 0.7:
+            chunks.append("do()")
+        elif kind < 0.8:
+            chunks.append("don't()")
+        else:
+            chunks.append(rng.choice([f"mul[{x},{y}]", f"mul({x},{y}", f"mul ( {x} )"]))
+        chunks.append("".join(rng.choices(junk, k=rng.randint(0, 6))))
+    return "".join(chunks) + "\n"
+
+
+def generate_day_4(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` word search made of the letters X, M, A and S.
+    """
+    rng = random.Random(seed)
+    return _join_rows(_grid_from_bytes(rng, scale, scale, b"XMAS"))
+
+
+def generate_day_5(scale: int, seed: int = 0) -> str:
+    """
+    The ordering rules of 49 pages followed by `scale` updates.
+    """
+    rng = random.Random(seed)
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        f"{pages[i]}|{pages[j]}"
+        for i in range(len(pages))
+        for j in range(i + 1, len(pages))
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(scale):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def generate_day_6(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` lab with about 2% of obstructions and the guard facing up,
+    with an obstruction above the guard so that it turns at least once.
+    """
+    rng = random.Random(seed)
+    rows = _grid_from_bytes(rng, scale, scale, b"." * 49 + b"#")
+    row, col = rng.randrange(scale // 2, scale), rng.randrange(scale)
+    rows[row][col] = ord("^")
+    rows[rng.randrange(row)][col] = ord("#")
+    return _join_rows(rows)
+
+
+def generate_day_7(scale: int, seed: int = 0) -> str:
+    """
+    `scale` calibration equations of 2 to 12 numbers, about half of them valid.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(scale):
+        numbers = [rng.randint(1, 99) for _ in range(rng.randint(2, 12))]
+        result = numbers[0]
+        for number in numbers[1:]:
+            operator = rng.randrange(3)
+            if operator == 0:
+                result += number
+            elif operator == 1:
+                result *= number
+            else:
+                result = int(f"{result}{number}")
+        if rng.random() < 0.5:
+            result += rng.randint(1, 9)
+        lines.append(f"{result}: {' '.join(map(str, numbers))}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_8(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` city with about four antennas per frequency.
+    """
+    rng = random.Random(seed)
+    frequencies = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    rows = [bytearray(b"." * scale) for _ in range(scale)]
+    n_antennas = max(2, scale * scale // 40)
+    for i in range(n_antennas):
+        frequency = frequencies[(i // 4) % len(frequencies)]
+        rows[rng.randrange(scale)][rng.randrange(scale)] = ord(frequency)
+    return _join_rows(rows)
+
+
+def generate_day_9(scale: int, seed: int = 0) -> str:
+    """
+    A disk map of `scale` digits. Files are 1 to 9 blocks long.
+    """
+    rng = random.Random(seed)
+    disk_map = bytearray(_grid_from_bytes(rng, scale, 1, b"0123456789")[0])
+    files = _grid_from_bytes(rng, (scale + 1) // 2, 1, b"123456789")[0]
+    disk_map[0::2] = files
+    return disk_map.decode() + "\n"
+
+
+def generate_day_10(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` topographic map with many gradual slopes.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for row in range(scale):
+        heights = bytearray()
+        for col in range(scale):
+            if rng.random() < 0.2:
+                heights.append(ord("0") + rng.randrange(10))
+            else:
+                heights.append(ord("0") + (row + col) % 10)
+        rows.append(heights)
+    return _join_rows(rows)
+
+
+def generate_day_11(scale: int, seed: int = 0) -> str:
+    """
+    `scale` engraved stones.
+    """
+    rng = random.Random(seed)
+    return " ".join(str(rng.randint(0, 10**6)) for _ in range(scale)) + "\n"
+
+
+def generate_day_12(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` garden made of small patches of plants.
+    """
+    rng = random.Random(seed)
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    n_patches = scale // 4 + 1
+    patches = [
+        [rng.choice(letters) for _ in range(n_patches)] for _ in range(n_patches)
+    ]
+    rows = []
+    for row in range(scale):
+        plants = []
+        for col in range(scale):
+            if rng.random() < 0.1:
+                plants.append(rng.choice(letters))
+            else:
+                plants.append(patches[row // 4][col // 4])
+        rows.append("".join(plants))
+    return "\n".join(rows) + "\n"
+
+
+def generate_day_13(scale: int, seed: int = 0) -> str:
+    """
+    `scale` claw machines, about half of them winnable.
+    """
+    rng = random.Random(seed)
+    machines = []
+    for _ in range(scale):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        px, py = a * ax + b * bx, a * ay + b * by
+        if rng.random() < 0.5:
+            px += rng.randint(1, 9)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}"
+        )
+    return "\n\n".join(machines) + "\n"
+
+
+def generate_day_14(scale: int, seed: int = 0) -> str:
+    """
+    `scale` robots moving in the 101 x 103 restroom area.
+    """
+    rng = random.Random(seed)
+    lines = [
+        f"p={rng.randrange(101)},{rng.randrange(103)} "
+        f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        for _ in range(scale)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_15(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` warehouse followed by 8 * `scale`² robot moves.
+    """
+    rng = random.Random(seed)
+    scale = max(scale, 4)
+    rows = [bytearray(b"#" * scale)]
+    for _ in range(scale - 2):
+        inner = _grid_from_bytes(rng, scale - 2, 1, b"." * 5 + b"O" * 2 + b"#")[0]
+        rows.append(bytearray(b"#") + inner + bytearray(b"#"))
+    rows.append(bytearray(b"#" * scale))
+    rows[scale // 2][scale // 2] = ord("@")
+
+    n_moves = 8 * scale * scale
+    moves = "".join(rng.choices("<>^v", k=n_moves))
+    lines = [moves[i : i + 1000] for i in range(0, n_moves, 1000)]
+    return _join_rows(rows) + "\n" + "\n".join(lines) + "\n"
+
+
+def _carve_maze(rng: random.Random, size: int) -> list[bytearray]:
+    """
+    Carve a perfect maze of odd side `size` with a randomised depth-first search.
+    """
+    rows = [bytearray(b"#" * size) for _ in range(size)]
+    stack = [(size - 2, 1)]
+    rows[size - 2][1] = ord(".")
+    while stack:
+        row, col = stack[-1]
+        neighbours = [
+            (row + dr, col + dc)
+            for dr, dc in [(-2, 0), (2, 0), (0, -2), (0, 2)]
+            if 0 < row + dr < size - 1
+            and 0 < col + dc < size - 1
+            and rows[row + dr][col + dc] == ord("#")
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        next_row, next_col = rng.choice(neighbours)
+        rows[(row + next_row) // 2][(col + next_col) // 2] = ord(".")
+        rows[next_row][next_col] = ord(".")
+        stack.append((next_row, next_col))
+    return rows
+
+
+def generate_day_16(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` reindeer maze with loops, S in the bottom left corner and E
+    in the top right corner.
+    """
+    rng = random.Random(seed)
+    size = max(5, scale | 1)
+    rows = _carve_maze(rng, size)
+
+    # open some walls to create several best paths
+    for _ in range(size * size // 20):
+        row, col = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        if (row + col) % 2 == 1:
+            rows[row][col] = ord(".")
+
+    rows[size - 2][1] = ord("S")
+    rows[1][size - 2] = ord("E")
+    return _join_rows(rows)
+
+
+def _combo_operand(operand: int, a: int, b: int, c: int) -> int:
+    if operand == 7:
+        raise ValueError("The combo operand 7 is reserved.")
+    return (0, 1, 2, 3, a, b, c)[operand]
+
+
+def _run_day_17_program(program: list[int], a: int) -> list[int]:
+    b, c, pointer = 0, 0, 0
+    output: list[int] = []
+    while pointer < len(program):
+        opcode, operand = program[pointer], program[pointer + 1]
+        pointer += 2
+        if opcode == 1:
+            b ^= operand
+        elif opcode == 3:
+            if a != 0:
+                pointer = operand
+        elif opcode == 4:
+            b ^= c
+        else:
+            combo = _combo_operand(operand, a, b, c)
+            if opcode == 0:
+                a = a >> combo
+            elif opcode == 2:
+                b = combo % 8
+            elif opcode == 5:
+                output.append(combo % 8)
+            elif opcode == 6:
+                b = a >> combo
+            elif opcode == 7:
+                c = a >> combo
+    return output
+
+
+def _has_quine(program: list[int], max_steps: int = 4096) -> bool:
+    """
+    Check that the greedy search of day 17, which keeps the first value of A
+    matching each suffix of the program, finds a quine within `max_steps` runs.
+    """
+    lower_bound, steps = 0, 0
+    for i in range(len(program) - 1, -1, -1):
+        for a in range(lower_bound, lower_bound + 8 ** (len(program) - i)):
+            steps += 1
+            if steps > max_steps:
+                return False
+            if _run_day_17_program(program, a) == program[i:]:
+                lower_bound = 8 * a
+                break
+    return lower_bound > 0
+
+
+def generate_day_17(scale: int, seed: int = 0) -> str:
+    """
+    A program that can output a copy of itself and a register A of `scale` octal
+    digits.
+    """
+    rng = random.Random(seed)
+    while True:
+        x, y = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, x, 7, 5, 1, y, 4, rng.randrange(8), 0, 3, 5, 5, 3, 0]
+        if _has_quine(program):
+            break
+    a = rng.randrange(8 ** max(0, scale - 1), 8 ** max(1, scale))
+    return (
+        f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+        f"Program: {','.join(map(str, program))}\n"
+    )
+
+
+# bytes simulated by part 1 of day 18, which must leave the exit reachable
+DAY_18_FIRST_BYTES = 1024
+
+
+def _monotone_path(rng: random.Random, size: int) -> set[tuple[int, int]]:
+    """
+    Draw a random path of right and down moves from (0, 0) to the opposite corner.
+    """
+    moves = [(1, 0)] * (size - 1) + [(0, 1)] * (size - 1)
+    rng.shuffle(moves)
+    x, y = 0, 0
+    path = {(x, y)}
+    for dx, dy in moves:
+        x, y = x + dx, y + dy
+        path.add((x, y))
+    return path
+
+
+def generate_day_18(scale: int, seed: int = 0, size: int = 0) -> str:
+    """
+    `scale` falling bytes in a `size` x `size` memory space, by default the 71 x 71
+    space of the puzzle grown to hold about 1.5 times `scale` cells. A random path
+    from the start to the exit is kept free of the first 1024 bytes, so that part 1
+    always finds the exit; the later bytes may fall anywhere and block it.
+    """
+    rng = random.Random(seed)
+    size = size or max(71, math.isqrt(3 * scale // 2) + 1)
+    path = _monotone_path(rng, size)
+    if scale > size * size - 2:
+        raise ValueError(f"{scale} bytes do not fit in a {size} x {size} space.")
+    if min(scale, DAY_18_FIRST_BYTES) > size * size - len(path):
+        raise ValueError(f"{size} x {size} is too small to keep a path free.")
+
+    cells = [(x, y) for x in range(size) for y in range(size)]
+    rng.shuffle(cells)
+    first = [cell for cell in cells if cell not in path][:DAY_18_FIRST_BYTES]
+    chosen = set(first)
+    rest = [
+        cell
+        for cell in cells
+        if cell not in chosen and cell not in [(0, 0), (size - 1, size - 1)]
+    ]
+    corrupted = (first + rest)[:scale]
+
+    # the solver derives the size of the space from the largest coordinate
+    if corrupted and max(max(x, y) for x, y in corrupted) < size - 1:
+        corrupted[min(scale, len(first)) - 1] = next(
+            cell for cell in cells if size - 1 in cell and cell not in path
+        )
+    return "\n".join(f"{x},{y}" for x, y in corrupted) + "\n"
+
+
+def generate_day_19(scale: int, seed: int = 0) -> str:
+    """
+    About 400 towel patterns followed by `scale` designs.
+    """
+    rng = random.Random(seed)
+    towels = sorted(
+        {"".join(rng.choices("wubrg", k=rng.randint(1, 8))) for _ in range(400)}
+    )
+    designs = []
+    for _ in range(scale):
+        if rng.random() < 0.7:
+            design = "".join(rng.choices(towels, k=rng.randint(4, 12)))
+        else:
+            design = "".join(rng.choices("wubrg", k=rng.randint(20, 60)))
+        designs.append(design[:60])
+    return ", ".join(towels) + "\n\n" + "\n".join(designs) + "\n"
+
+
+def generate_day_20(scale: int, seed: int = 0) -> str:
+    """
+    A `scale` x `scale` racetrack made of a single winding path.
+    """
+    rng = random.Random(seed)
+    size = max(5, scale | 1)
+    maze = _carve_maze(rng, size)
+
+    # keep only the path between the two corners of the maze
+    start, end = (size - 2, 1), (1, size - 2)
+    parents = {start: start}
+    stack = [start]
+    while stack:
+        row, col = stack.pop()
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            cell = (row + dr, col + dc)
+            if maze[cell[0]][cell[1]] == ord(".") and cell not in parents:
+                parents[cell] = (row, col)
+                stack.append(cell)
+
+    rows = [bytearray(b"#" * size) for _ in range(size)]
+    cell = end
+    while cell != start:
+        rows[cell[0]][cell[1]] = ord(".")
+        cell = parents[cell]
+    rows[start[0]][start[1]] = ord("S")
+    rows[end[0]][end[1]] = ord("E")
+    return _join_rows(rows)
+
+
+def generate_day_21(scale: int, seed: int = 0) -> str:
+    """
+    `scale` door codes.
+    """
+    rng = random.Random(seed)
+    return "\n".join(f"{rng.randint(1, 999):03d}A" for _ in range(scale)) + "\n"
+
+
+def generate_day_22(scale: int, seed: int = 0) -> str:
+    """
+    The initial secret numbers of `scale` buyers.
+    """
+    rng = random.Random(seed)
+    return "\n".join(str(rng.randint(1, 16777215)) for _ in range(scale)) + "\n"
+
+
+def _node_name(index: int) -> str:
+    name = ""
+    while True:
+        index, remainder = divmod(index, 26)
+        name = chr(ord("a") + remainder) + name
+        if index == 0:
+            break
+    return name.rjust(2, "a")
+
+
+def generate_day_23(scale: int, seed: int = 0) -> str:
+    """
+    A LAN of `scale` computers with 13 connections each on average and a hidden
+    party of 13 computers.
+    """
+    rng = random.Random(seed)
+    scale = max(scale, 14)
+    names = [_node_name(i) for i in rng.sample(range(26 * max(26, scale)), scale)]
+    edges = set()
+    for i in range(scale):
+        for j in rng.sample(range(scale), 7):
+            if i != j:
+                edges.add((min(i, j), max(i, j)))
+
+    party = rng.sample(range(scale), 13)
+    for i in party:
+        for j in party:
+            if i < j:
+                edges.add((i, j))
+
+    lines = [f"{names[i]}-{names[j]}" for i, j in edges]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_24(scale: int, seed: int = 0) -> str:
+    """
+    A ripple-carry adder of `scale` bits with four pairs of swapped outputs.
+    """
+    rng = random.Random(seed)
+    scale = max(scale, 4)
+    used: set[str] = set()
+
+    def wire() -> str:
+        while True:
+            name = "".join(rng.choices("abcdefghijklmnopqrstuvw", k=3))
+            if name not in used:
+                used.add(name)
+                return name
+
+    # each gate is [input 1, operator, input 2, output]
+    gates: list[list[str]] = []
+    carry = ""
+    for bit in range(scale):
+        x, y, z = f"x{bit:02d}", f"y{bit:02d}", f"z{bit:02d}"
+        if bit == 0:
+            carry = wire()
+            gates += [[x, "XOR", y, z], [x, "AND", y, carry]]
+            continue
+        partial, direct, indirect = wire(), wire(), wire()
+        next_carry = f"z{scale:02d}" if bit == scale - 1 else wire()
+        gates += [
+            [x, "XOR", y, partial],
+            [partial, "XOR", carry, z],
+            [x, "AND", y, direct],
+            [partial, "AND", carry, indirect],
+            [direct, "OR", indirect, next_carry],
+        ]
+        carry = next_carry
+
+    # swap the outputs of two gates of the same bit, as long as it creates no loop
+    swapped_bits = rng.sample(range(1, scale - 1), min(4, scale - 2))
+    for bit in swapped_bits:
+        while True:
+            first, second = rng.sample(range(5 * bit - 3, 5 * bit + 2), 2)
+            gates[first][3], gates[second][3] = gates[second][3], gates[first][3]
+            if not _has_loop(gates):
+                break
+            gates[first][3], gates[second][3] = gates[second][3], gates[first][3]
+
+    values = [f"x{bit:02d}: {rng.randint(0, 1)}" for bit in range(scale)]
+    values += [f"y{bit:02d}: {rng.randint(0, 1)}" for bit in range(scale)]
+    rng.shuffle(gates)
+    lines = [f"{a} {operator} {b} -> {output}" for a, operator, b, output in gates]
+    return "\n".join(values) + "\n\n" + "\n".join(lines) + "\n"
+
+
+def _has_loop(gates: list[list[str]]) -> bool:
+    producers = {output: (a, b) for a, _, b, output in gates}
+    state: dict[str, int] = {}
+
+    def visit(node: str) -> bool:
+        if state.get(node) == 1:
+            return True
+        if state.get(node) == 2 or node not in producers:
+            return False
+        state[node] = 1
+        if any(visit(parent) for parent in producers[node]):
+            return True
+        state[node] = 2
+        return False
+
+    return any(visit(output) for output in producers)
+
+
+def generate_day_25(scale: int, seed: int = 0) -> str:
+    """
+    `scale` lock and key schematics.
+    """
+    rng = random.Random(seed)
+    schematics = []
+    for _ in range(scale):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows = []
+        for level in range(7):
+            if is_lock:
+                rows.append("".join("#" if level <= h else "." for h in heights))
+            else:
+                rows.append("".join("#" if 6 - level <= h else "." for h in heights))
+        schematics.append("\n".join(rows))
+    return "\n\n".join(schematics) + "\n"
+
+
+GENERATORS: dict[int, Callable[[int, int], str]] = {
+    day: globals()[f"generate_day_{day}"] for day in range(1, 26)
+}
+
+
+def generate(day: int, scale: int, seed: int = 0) -> str:
+    """
+    Return the content of a synthetic input for the given day.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}.")
+    return GENERATORS[day](scale, seed)
+
+
+def synthetic_input_path(day: int, scale: int, seed: int = 0) -> str:
+    """
+    Return the path of a synthetic input, generating the file on first use.
+    """
+    file_path = f"{SYNTHETIC_DIR}/day_{day}_input_{scale}_{seed}.txt"
+    if not os.path.exists(file_path):
+        os.makedirs(SYNTHETIC_DIR, exist_ok=True)
+        with open(file_path, "w") as file:
+            file.write(generate(day, scale, seed))
+    return file_path
+
+
+if __name__ == "__main__":
+    argsparse = argparse.ArgumentParser()
+    argsparse.add_argument(
+        "--day", type=int, help="The day of the input to generate.", required=True
+    )
+    argsparse.add_argument(
+        "--scale", type=int, help="The size of the input.", required=True
+    )
+    argsparse.add_argument("--seed", type=int, default=0, help="The random seed.")
+    args = argsparse.parse_args()
+    print(synthetic_input_path(args.day, args.scale, args.seed))
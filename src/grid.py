@@ -0,0 +1,128 @@
+"""
+Array-backed grid shared by the grid-based days.
+
+The cells are stored row-major in a flat bytearray surrounded by a one-cell border
+of `BORDER` bytes. A cell is identified by an integer id, and the neighbours of
+any cell of the grid are found by adding the precomputed offsets to its id, without
+bounds checks: a neighbour outside of the grid holds the border byte.
+
+    >>> grid = Grid.from_str("ab\\ncd")
+    >>> cell = grid.cell(0, 1)
+    >>> grid.char(cell), grid.coords(cell)
+    ('b', (0, 1))
+    >>> [grid.char(cell + offset) for offset in grid.offsets]
+    ['\\x00', '\\x00', 'd', 'a']
+"""
+
+from typing import Iterator, TypeVar
+
+from instrument import phase
+
+BORDER = 0
+
+# the grid subclasses of the days get instances of their own class
+G = TypeVar("G", bound="Grid")
+
+
+class Grid:
+    data: bytearray
+    width: int
+    height: int
+    border: int
+    stride: int
+    offsets: tuple[int, int, int, int]
+    diagonal_offsets: tuple[int, int, int, int]
+
+    def __init__(
+        self, data: bytearray, width: int, height: int, border: int = BORDER
+    ) -> None:
+        self.data = data
+        self.width = width
+        self.height = height
+        self.border = border
+        self.stride = width + 2
+        # up, right, down, left
+        self.offsets = (-self.stride, 1, self.stride, -1)
+        # up-right, down-right, down-left, up-left
+        self.diagonal_offsets = (
+            1 - self.stride,
+            1 + self.stride,
+            self.stride - 1,
+            -1 - self.stride,
+        )
+
+    @classmethod
+    def from_lines(cls: type[G], lines: list[str], border: int = BORDER) -> G:
+        width, height = len(lines[0]), len(lines)
+        padding = bytes([border])
+
+        data = bytearray(padding * (width + 2))
+        for line in lines:
+            if len(line) != width:
+                raise ValueError("All the rows of the grid must have the same length.")
+            data += padding + line.encode() + padding
+        data += padding * (width + 2)
+
+        return cls(data, width, height, border)
+
+    @classmethod
+    def from_str(cls: type[G], text: str, border: int = BORDER) -> G:
+        return cls.from_lines(text.strip().splitlines(), border)
+
+    @classmethod
+    @phase("parse")
+    def from_file(cls: type[G], file_path: str, border: int = BORDER) -> G:
+        with open(file_path, "r") as file:
+            return cls.from_str(file.read(), border)
+
+    def __str__(self) -> str:
+        return "\n".join(self.row(row) for row in range(self.height))
+
+    def copy(self: G) -> G:
+        return type(self)(bytearray(self.data), self.width, self.height, self.border)
+
+    def cell(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def coords(self, cell: int) -> tuple[int, int]:
+        row, col = divmod(cell, self.stride)
+        return row - 1, col - 1
+
+    def contains(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def char(self, cell: int) -> str:
+        return chr(self.data[cell])
+
+    def row(self, row: int) -> str:
+        start = self.cell(row, 0)
+        return self.data[start : start + self.width].decode()
+
+    def cells(self) -> Iterator[int]:
+        """
+        Iterate over the ids of the cells of the grid, skipping the border.
+        """
+        for row in range(self.height):
+            start = self.cell(row, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, char: str) -> list[int]:
+        """
+        Return the ids of all the cells holding the given character.
+        """
+        value, cells = ord(char), []
+        cell = self.data.find(value)
+        while cell != -1:
+            cells.append(cell)
+            cell = self.data.find(value, cell + 1)
+        return cells
+
+    def neighbours(self, cell: int) -> list[int]:
+        """
+        Return the ids of the orthogonal neighbours of a cell that do not hold the
+        border byte.
+        """
+        data, border = self.data, self.border
+        return [
+            cell + offset for offset in self.offsets if data[cell + offset] != border
+        ]
@@ -0,0 +1,110 @@
+"""
+Debug tracing switch and hot-path counters.
+
+`TRACE` is read once at import time from the `LOGURU_LEVEL` environment variable.
+Guard the debug logging of hot loops with it so that the messages are not even
+formatted when tracing is off:
+
+    if TRACE:
+        logger.debug(f"Moving box {box} to {new_x}, {new_y}")
+
+Counters and timers are named and accumulate over a run. Hot loops should tally a
+local integer and call `count` once per call rather than once per iteration. The
+runner prints them with `--stats`, along with the counters of the caches of
+`memo.py`.
+
+Phases split the runtime of a solver for `--report`. The runner times the import
+and render phases itself, the solvers mark their parsing, either around a block or
+as a decorator of their input readers:
+
+    @phase("parse")
+    def read_input(file_path: str) -> list[list[int]]:
+        ...
+
+The time of the solver outside of its parse phase is its solve phase.
+"""
+
+import contextlib
+import os
+import time
+from collections import Counter, defaultdict
+from typing import Iterator
+
+import memo
+
+TRACE = os.environ.get("LOGURU_LEVEL") == "DEBUG"
+
+COUNTERS: Counter[str] = Counter()
+TIMERS: defaultdict[str, float] = defaultdict(float)
+PHASES: defaultdict[str, float] = defaultdict(float)
+
+# nesting depth of each phase, so that a reader calling another reader is only
+# timed once
+_PHASE_DEPTHS: Counter[str] = Counter()
+
+
+def count(name: str, value: int = 1) -> None:
+    COUNTERS[name] += value
+
+
+@contextlib.contextmanager
+def timer(name: str) -> Iterator[None]:
+    """
+    Add the wall time spent in the block to the timer of the given name.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TIMERS[name] += time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Add the wall time spent in the block to the given phase, unless the block is
+    nested in the same phase. Also usable as a decorator.
+    """
+    _PHASE_DEPTHS[name] += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _PHASE_DEPTHS[name] -= 1
+        if not _PHASE_DEPTHS[name]:
+            PHASES[name] += time.perf_counter() - start
+
+
+def get_phases() -> dict[str, float]:
+    return dict(PHASES)
+
+
+def reset() -> None:
+    COUNTERS.clear()
+    TIMERS.clear()
+    PHASES.clear()
+    memo.reset_stats()
+
+
+def get_stats() -> dict[str, dict]:
+    """
+    Return a copy of the counters, timers and memoization counters.
+    """
+    return {
+        "counters": dict(COUNTERS),
+        "timers": dict(TIMERS),
+        "memos": memo.get_stats(),
+    }
+
+
+def format_stats(stats: dict[str, dict]) -> str:
+    lines = [f"{name}: {value:,}" for name, value in sorted(stats["counters"].items())]
+    lines += [
+        f"{name}: {value:.3f}s" for name, value in sorted(stats["timers"].items())
+    ]
+    lines += [
+        f"{name}: {cache['hits']:,} hits, {cache['misses']:,} misses, "
+        f"{cache['evictions']:,} evictions, {cache['size']:,}/{cache['maxsize']:,} entries"
+        for name, cache in sorted(stats.get("memos", {}).items())
+    ]
+    return "\n".join(lines)
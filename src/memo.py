@@ -0,0 +1,130 @@
+"""
+Bounded memoization with LRU eviction and hit, miss and eviction counters.
+
+    @memo(maxsize=4096)
+    def presses(code: str, depth: int) -> int:
+        ...
+
+    presses.clear()
+
+The cache is `functools.lru_cache`, so a call costs the same as with `@cache`, but
+the number of entries is bounded and the least recently used one is evicted first.
+Every memoized function is registered in `MEMOS` under its qualified name, and the
+runner prints their counters with `--stats`. The entries are kept across inputs,
+so a function whose keys depend on the input calls `clear()` once it is done with
+it, while the others share their entries between the runs of a process.
+"""
+
+import functools
+from typing import Any, Callable, ParamSpec, Protocol, TypeVar, cast
+
+DEFAULT_MAXSIZE = 2**16
+
+P = ParamSpec("P")
+R = TypeVar("R", covariant=True)
+
+
+class Memoized(Protocol[P, R]):
+    """
+    Type of a memoized function: the function itself with a `clear()` method.
+    """
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R: ...
+
+    def clear(self) -> None: ...
+
+
+class Memo:
+    """
+    Counters of a memoized function. `lru_cache` resets its own statistics when it
+    is cleared, so the counters of the previous clears are carried here.
+    """
+
+    name: str
+    function: "functools._lru_cache_wrapper[Any]"
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(
+        self, name: str, function: "functools._lru_cache_wrapper[Any]", maxsize: int
+    ) -> None:
+        self.name = name
+        self.function = function
+        self.maxsize = maxsize
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+    def clear(self) -> None:
+        info = self.function.cache_info()
+        self.hits += info.hits
+        self.misses += info.misses
+        # every miss adds an entry, so the entries that are gone were evicted
+        self.evictions += info.misses - info.currsize
+        self.function.cache_clear()
+
+    def reset_stats(self) -> None:
+        """
+        Start counting from zero while keeping the entries.
+        """
+        info = self.function.cache_info()
+        self.hits, self.misses = -info.hits, -info.misses
+        self.evictions = -(info.misses - info.currsize)
+
+    def get_stats(self) -> dict[str, int]:
+        info = self.function.cache_info()
+        return {
+            "hits": self.hits + info.hits,
+            "misses": self.misses + info.misses,
+            "evictions": self.evictions + info.misses - info.currsize,
+            "size": info.currsize,
+            "maxsize": self.maxsize,
+        }
+
+
+MEMOS: dict[str, Memo] = {}
+
+
+def memo(
+    maxsize: int = DEFAULT_MAXSIZE,
+) -> Callable[[Callable[P, R]], Memoized[P, R]]:
+    """
+    Memoize a function with hashable arguments in a cache of at most `maxsize`
+    entries. The decorated function gets a `clear()` method.
+    """
+
+    def decorator(function: Callable[P, R]) -> Memoized[P, R]:
+        cached = functools.lru_cache(maxsize=maxsize)(function)
+        entry = Memo(f"{function.__module__}.{function.__qualname__}", cached, maxsize)
+        MEMOS[entry.name] = entry
+        # the lru_cache wrapper itself is returned, so that a call costs no more
+        setattr(cached, "clear", entry.clear)
+        return cast(Memoized[P, R], cached)
+
+    return decorator
+
+
+def clear_all() -> None:
+    """
+    Drop the entries of every memoized function.
+    """
+    for entry in MEMOS.values():
+        entry.clear()
+
+
+def reset_stats() -> None:
+    for entry in MEMOS.values():
+        entry.reset_stats()
+
+
+def get_stats() -> dict[str, dict[str, int]]:
+    """
+    Return the counters of the memoized functions that were called since the last
+    reset.
+    """
+    stats = {}
+    for name, entry in MEMOS.items():
+        entry_stats = entry.get_stats()
+        if entry_stats["hits"] or entry_stats["misses"]:
+            stats[name] = entry_stats
+    return stats
@@ -0,0 +1,167 @@
+"""
+Bulk integer tokenizer shared by the numeric parsers.
+
+The input file is read as bytes, through `mmap` for large files, and every integer
+it holds is extracted at once with numpy instead of splitting and converting each
+line in Python:
+
+    >>> integers(b"p=0,4 v=3,-3\\np=6,3 v=-1,-3\\n")
+    array([ 0,  4,  3, -3,  6,  3, -1, -3])
+    >>> integers(b"Button A: X+94, Y-34", signed=False)
+    array([94, 34])
+
+`read_records` reshapes the integers into fixed-width records, for example four per
+robot line, and `read_ragged` keeps the integers of each line together for inputs
+whose lines have different lengths.
+"""
+
+import mmap
+import os
+from typing import Optional
+
+import numpy as np
+
+# files at least this large are mapped in memory rather than read
+MMAP_THRESHOLD = 64 * 1024**2
+
+# the largest number of digits that always fits in a signed 64-bit integer, longer
+# integers are returned as Python integers in an object array
+MAX_DIGITS = 18
+
+ZERO, MINUS, NEWLINE = ord("0"), ord("-"), ord("\n")
+
+
+def _tokenize(
+    data: np.ndarray, signed: bool, with_lines: bool
+) -> tuple[np.ndarray, Optional[np.ndarray], int]:
+    """
+    Return the integers of the bytes, and with `with_lines` the line index of each
+    integer along with the number of lines.
+    """
+
+    is_digit = (data >= ZERO) & (data <= ZERO + 9)
+    follows_digit = np.zeros_like(is_digit)
+    follows_digit[1:] = is_digit[:-1]
+    precedes_digit = np.zeros_like(is_digit)
+    precedes_digit[:-1] = is_digit[1:]
+
+    starts = np.flatnonzero(is_digit & ~follows_digit)
+    lengths = np.flatnonzero(is_digit & ~precedes_digit) + 1 - starts
+    del is_digit, follows_digit, precedes_digit
+
+    max_length = int(lengths.max()) if len(starts) else 0
+    if max_length > MAX_DIGITS:
+        # too large for int64, fall back to Python integers
+        values = np.array(
+            [
+                int(data[start : start + length].tobytes())
+                for start, length in zip(starts.tolist(), lengths.tolist())
+            ],
+            dtype=object,
+        )
+    else:
+        # Horner's scheme over the digit positions, the integers that are shorter
+        # than the current position are left untouched
+        values = np.zeros(len(starts), dtype=np.int64)
+        min_length = int(lengths.min()) if len(starts) else 0
+        for position in range(max_length):
+            if position < min_length:
+                values *= 10
+                values += data[starts + position]
+                values -= ZERO
+                continue
+            longer = np.flatnonzero(lengths > position)
+            digits = data[starts[longer] + position].astype(np.int64) - ZERO
+            values[longer] = values[longer] * 10 + digits
+
+    if signed:
+        negative = starts[starts > 0]
+        negative = negative[data[negative - 1] == MINUS]
+        values[np.searchsorted(starts, negative)] *= -1
+
+    if not with_lines:
+        return values, None, 0
+
+    newlines = np.flatnonzero(data == NEWLINE)
+    n_lines = len(newlines) + (1 if len(data) and data[-1] != NEWLINE else 0)
+    return values, np.searchsorted(newlines, starts), n_lines
+
+
+def _scan(
+    file_path: str, signed: bool, with_lines: bool, use_mmap: Optional[bool]
+) -> tuple[np.ndarray, Optional[np.ndarray], int]:
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if use_mmap is None:
+            use_mmap = size >= MMAP_THRESHOLD
+
+        # an empty file cannot be mapped
+        if not use_mmap or size == 0:
+            data = np.frombuffer(file.read(), dtype=np.uint8)
+            return _tokenize(data, signed, with_lines)
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            data = np.frombuffer(buffer, dtype=np.uint8)
+            try:
+                return _tokenize(data, signed, with_lines)
+            finally:
+                # the map cannot be closed while an array still points into it
+                del data
+
+
+def integers(data: bytes, signed: bool = True) -> np.ndarray:
+    """
+    Return every integer of the bytes as an int64 array. With `signed`, a minus sign
+    right before the digits makes the integer negative.
+    """
+    values, _, _ = _tokenize(np.frombuffer(data, dtype=np.uint8), signed, False)
+    return values
+
+
+def read_integers(
+    file_path: str, signed: bool = True, use_mmap: Optional[bool] = None
+) -> np.ndarray:
+    """
+    Return every integer of the file as an int64 array.
+    """
+    values, _, _ = _scan(file_path, signed, False, use_mmap)
+    return values
+
+
+def read_records(
+    file_path: str, width: int, signed: bool = True, use_mmap: Optional[bool] = None
+) -> np.ndarray:
+    """
+    Return the integers of the file as an array of shape (n_records, width), for
+    inputs made of records holding a fixed number of integers.
+    """
+    values = read_integers(file_path, signed, use_mmap)
+    if len(values) % width:
+        raise ValueError(
+            f"Found {len(values)} integers in {file_path}, "
+            f"which is not a multiple of {width}."
+        )
+    return values.reshape(-1, width)
+
+
+def read_ragged(
+    file_path: str, signed: bool = True, use_mmap: Optional[bool] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the integers of the file and the offsets of each line: the integers of
+    line `i` are `values[offsets[i] : offsets[i + 1]]`. Lines without integers
+    are kept as empty rows.
+    """
+    values, lines, n_lines = _scan(file_path, signed, True, use_mmap)
+    assert lines is not None
+    offsets = np.zeros(n_lines + 1, dtype=np.int64)
+    np.cumsum(np.bincount(lines, minlength=n_lines), out=offsets[1:])
+    return values, offsets
+
+
+def split_lines(values: np.ndarray, offsets: np.ndarray) -> list[list[int]]:
+    """
+    Convert the integers and line offsets of `read_ragged` to a list of lists.
+    """
+    rows, bounds = values.tolist(), offsets.tolist()
+    return [rows[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
@@ -0,0 +1,161 @@
+"""
+Profiling hooks for the daily solvers.
+
+    python src/aoc.py --day 6 --part 2 --profile cpu --top 20
+    python src/aoc.py --day 6 --part 2 --profile cpu --profile-output day_6.prof
+    python src/aoc.py --day 17 --part 2 --profile mem
+
+The `.prof` files written in cpu mode can be opened with snakeviz, and the
+snapshots written in mem mode can be loaded with `tracemalloc.Snapshot.load`.
+
+In mem mode, a background thread samples the traced memory while the solver runs
+and takes a snapshot each time it grows past the last one, so that the allocation
+sites are reported at the largest working set rather than after the solver freed it.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+PROFILE_MODES = ["cpu", "mem"]
+
+# how often the traced memory is sampled in mem mode, in seconds
+MEM_SAMPLE_INTERVAL = 0.01
+
+# growth of the traced memory over the last snapshot that triggers a new one, which
+# bounds the number of snapshots of a steadily growing working set
+MEM_SNAPSHOT_GROWTH = 1.1
+
+
+def profile_cpu(
+    solver: Callable,
+    file_path: str,
+    top: int = 20,
+    output: Optional[str] = None,
+) -> tuple[Any, str]:
+    """
+    Run the solver under cProfile.
+    Returns the answer and the report of the `top` functions by cumulative time.
+    """
+
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(solver, file_path)
+
+    if output:
+        profiler.dump_stats(output)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    return answer, stream.getvalue().rstrip()
+
+
+class _PeakSampler(threading.Thread):
+    """
+    Sample the traced memory every `interval` seconds and take a snapshot each time
+    it grows `growth` times over the last snapshot.
+    """
+
+    def __init__(self, interval: float, growth: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.stopped = threading.Event()
+        self.start_time = time.perf_counter()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.size = 0
+        self.elapsed = 0.0
+
+    def sample(self, growth: float) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.size * growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+            self.elapsed = time.perf_counter() - self.start_time
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.sample(self.growth)
+
+
+def profile_mem(
+    solver: Callable,
+    file_path: str,
+    top: int = 20,
+    output: Optional[str] = None,
+) -> tuple[Any, str]:
+    """
+    Run the solver under tracemalloc.
+    Returns the answer and the report of the `top` allocation sites of the largest
+    working set sampled during the run, along with the peak traced memory.
+    """
+
+    tracemalloc.start()
+    sampler = _PeakSampler(MEM_SAMPLE_INTERVAL, MEM_SNAPSHOT_GROWTH)
+    try:
+        sampler.start()
+        try:
+            answer = solver(file_path)
+        finally:
+            sampler.stopped.set()
+            sampler.join()
+        # a solver faster than the sampling interval is only seen at its end
+        sampler.sample(1.0)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    snapshot = sampler.snapshot
+    assert snapshot is not None
+    if output:
+        snapshot.dump(output)
+
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+
+    lines = [
+        f"Peak traced memory: {peak / 1024**2:.1f} MB",
+        f"Traced memory at the snapshot: {sampler.size / 1024**2:.1f} MB "
+        f"after {sampler.elapsed:.3f}s",
+        f"Traced memory still allocated at the end: {current / 1024**2:.1f} MB",
+        "",
+        f"Top {top} allocation sites at the snapshot:",
+    ]
+    for index, statistic in enumerate(snapshot.statistics("lineno")[:top], 1):
+        frame = statistic.traceback[0]
+        lines.append(
+            f"{index:>3}. {frame.filename}:{frame.lineno}: "
+            f"{statistic.size / 1024:.1f} KB in {statistic.count} blocks"
+        )
+
+    return answer, "\n".join(lines)
+
+
+def profile(
+    mode: str,
+    solver: Callable,
+    file_path: str,
+    top: int = 20,
+    output: Optional[str] = None,
+) -> tuple[Any, str]:
+    """
+    Run the solver under the profiler of the given mode: cpu or mem.
+    """
+
+    if mode == "cpu":
+        return profile_cpu(solver, file_path, top, output)
+    elif mode == "mem":
+        return profile_mem(solver, file_path, top, output)
+    else:
+        raise ValueError(f"Invalid profile mode: {mode}")
@@ -0,0 +1,195 @@
+"""
+Opt-in rendering of the grids and series of the solvers.
+
+Rendering is off by default. Enable it with `--render ansi` to draw the snapshots on
+the terminal, or with `--render png` to write them as images to `renders/`. The mode
+is also read from the `AOC_RENDER` environment variable, which the worker processes
+of `--all` inherit. Solvers guard their snapshots with `enabled()` so that nothing
+is built when rendering is off:
+
+    if render.enabled():
+        render.snapshot("day_10", str(grid).splitlines())
+
+The mode and output directory are defined in `render_config.py`, which the CLI uses
+to configure rendering without importing this module.
+
+The snapshots are copied on the calling thread and drawn by a background thread, so
+the time spent writing to the terminal or encoding images is not charged to the
+solver. Call `flush` to wait for the pending snapshots.
+"""
+
+import atexit
+import os
+import queue
+import sys
+import threading
+from collections import Counter
+from typing import Callable, Optional
+
+import render_config
+from render_config import RENDER_DIR, RENDER_DIR_ENV, RENDER_ENV
+
+PALETTE = [
+    "\033[31m",  # Red
+    "\033[32m",  # Green
+    "\033[33m",  # Yellow
+    "\033[34m",  # Blue
+    "\033[35m",  # Purple
+    "\033[36m",  # Cyan
+    "\033[37m",  # White
+]
+RESET = "\033[0m"
+
+SPARKS = " ▁▂▃▄▅▆▇█"
+
+MODE: Optional[str] = os.environ.get(RENDER_ENV) or None
+OUTPUT_DIR: str = os.environ.get(RENDER_DIR_ENV, RENDER_DIR)
+
+_queue: queue.Queue = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_indices: Counter[str] = Counter()
+
+
+def configure(mode: Optional[str], output_dir: str = RENDER_DIR) -> None:
+    """
+    Set the render mode, or turn rendering off with None. The environment is updated
+    as well so that the worker processes started afterwards use the same mode.
+    """
+    global MODE, OUTPUT_DIR
+
+    render_config.configure(mode, output_dir)
+    MODE, OUTPUT_DIR = mode, output_dir
+
+
+def enabled() -> bool:
+    return MODE is not None
+
+
+def snapshot(
+    name: str, rows: list[str], labels: Optional[list[list[int]]] = None
+) -> None:
+    """
+    Render a grid given as a list of rows. The optional labels give a colour index
+    per character, for example the region of each plot, and -1 for no colour.
+    """
+    if MODE is None:
+        return
+
+    labels = [list(row) for row in labels] if labels is not None else None
+    _submit(_draw_grid, name, list(rows), labels)
+
+
+def series(name: str, values: list[float]) -> None:
+    """
+    Render a series of values, as a sparkline in ansi mode or a line plot in png mode.
+    """
+    if MODE is None:
+        return
+
+    _submit(_draw_series, name, list(values))
+
+
+def flush() -> None:
+    """
+    Wait until every pending snapshot has been drawn.
+    """
+    if _worker is not None:
+        _queue.join()
+
+
+def _submit(draw: Callable, name: str, *args) -> None:
+    global _worker
+
+    if _worker is None:
+        _worker = threading.Thread(target=_work, name="render", daemon=True)
+        _worker.start()
+        atexit.register(flush)
+
+    _indices[name] += 1
+    _queue.put((draw, MODE, name, _indices[name], args))
+
+
+def _work() -> None:
+    while True:
+        draw, mode, name, index, args = _queue.get()
+        try:
+            draw(mode, name, index, *args)
+        except Exception as exception:
+            # loguru is only imported on failure, the solvers that draw do not need it
+            from loguru import logger
+
+            logger.warning(f"Could not render {name} #{index}: {exception}")
+        finally:
+            _queue.task_done()
+
+
+def _output_path(name: str, index: int) -> str:
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    return os.path.join(OUTPUT_DIR, f"{name}_{index:04d}.png")
+
+
+def _write(text: str) -> None:
+    # write to the real terminal, the runner redirects the output of the solvers
+    stream = sys.__stdout__
+    if stream is not None:
+        stream.write(text)
+        stream.flush()
+
+
+def _draw_grid(
+    mode: str,
+    name: str,
+    index: int,
+    rows: list[str],
+    labels: Optional[list[list[int]]],
+) -> None:
+    if mode == "ansi":
+        if labels is not None:
+            rows = [
+                "".join(
+                    PALETTE[label % len(PALETTE)] + char + RESET if label >= 0 else char
+                    for char, label in zip(row, row_labels)
+                )
+                for row, row_labels in zip(rows, labels)
+            ]
+        _write(f"{name} #{index}\n" + "\n".join(rows) + "\n\n")
+
+    elif mode == "png":
+        import numpy as np
+        from matplotlib.image import imsave
+
+        width = max((len(row) for row in rows), default=0)
+        if labels is not None:
+            image = np.full((len(rows), width), -1, dtype=np.int32)
+            for y, row_labels in enumerate(labels):
+                image[y, : len(row_labels)] = row_labels
+            imsave(_output_path(name, index), image, cmap="tab20")
+        else:
+            image = np.full((len(rows), width), ord(" "), dtype=np.uint8)
+            for y, row in enumerate(rows):
+                image[y, : len(row)] = np.frombuffer(row.encode(), dtype=np.uint8)
+            imsave(_output_path(name, index), image, cmap="gray")
+
+
+def _draw_series(mode: str, name: str, index: int, values: list[float]) -> None:
+    if mode == "ansi":
+        if not values:
+            return
+
+        # one character per bucket of values, at most 80 characters wide
+        step = max(1, -(-len(values) // 80))
+        buckets = [min(values[i : i + step]) for i in range(0, len(values), step)]
+        low, high = min(buckets), max(buckets)
+        scale = (len(SPARKS) - 1) / (high - low) if high > low else 0
+        line = "".join(SPARKS[round((value - low) * scale)] for value in buckets)
+        _write(f"{name} #{index} [{low:.2f}, {high:.2f}]\n{line}\n\n")
+
+    elif mode == "png":
+        from matplotlib.figure import Figure
+
+        figure = Figure()
+        ax = figure.subplots()
+        ax.set_xlim(0, len(values) * 1.05)
+        ax.set_ylim(0, max(values, default=0) * 1.05 or 1)
+        ax.plot(values)
+        figure.savefig(_output_path(name, index))
@@ -0,0 +1,28 @@
+"""
+Render modes and their environment variables, shared by the CLI and `render.py`.
+
+This module only depends on the standard library so that `src/aoc.py` can define and
+configure `--render` without importing `render`, which the solvers import themselves
+when they draw.
+"""
+
+import os
+from typing import Optional
+
+RENDER_MODES = ["ansi", "png"]
+RENDER_DIR = "renders"
+
+RENDER_ENV = "AOC_RENDER"
+RENDER_DIR_ENV = "AOC_RENDER_DIR"
+
+
+def configure(mode: Optional[str], output_dir: str = RENDER_DIR) -> None:
+    """
+    Set the render mode in the environment, or turn rendering off with None, so that
+    the `render` module and the worker processes started afterwards use it.
+    """
+    if mode is not None and mode not in RENDER_MODES:
+        raise ValueError(f"Invalid render mode: {mode}")
+
+    os.environ[RENDER_ENV] = mode or ""
+    os.environ[RENDER_DIR_ENV] = output_dir
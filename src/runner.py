@@ -0,0 +1,651 @@
+"""
+Helpers to run several solvers in parallel and summarise their results.
+"""
+
+import contextlib
+import csv
+import functools
+import io
+import json
+import math
+import multiprocessing
+import os
+import re
+import resource
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Iterator, Optional
+
+import instrument
+from store import CACHED, AnswerStore
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+TIMEOUT, OOM = "TIMEOUT", "OOM"
+
+PHASES = ("import", "parse", "solve", "render")
+REPORT_FORMATS = ("json", "csv")
+
+# how often the watchdog checks the time and memory of a limited solver, in seconds
+WATCHDOG_INTERVAL = 0.05
+
+# address space allowed to a limited solver on top of its memory limit, as imports
+# such as numpy reserve much more virtual memory than they use
+ADDRESS_SPACE_HEADROOM = 1024**3
+
+# time given to a limited solver to exit after SIGTERM before it is killed, in seconds
+TERMINATE_GRACE = 1.0
+
+# the `parse` function of a day and the solvers of both parts taking its result
+ParsedSolvers = tuple[Callable[[str], Any], Callable[[Any], Any], Callable[[Any], Any]]
+
+# input parsed by `run_both`, inherited by its forked workers instead of pickled
+_PARSED: Any = None
+
+
+class RunResult:
+    day: int
+    part: int
+    answer: Any
+    wall_time: float
+    cpu_time: float
+    error: Optional[str]
+    stats: Optional[dict[str, dict]]
+    file_path: Optional[str]
+    status: Optional[str]
+    phases: Optional[dict[str, float]]
+
+    def __init__(
+        self,
+        day: int,
+        part: int,
+        answer: Any,
+        wall_time: float,
+        cpu_time: float,
+        error: Optional[str] = None,
+        stats: Optional[dict[str, dict]] = None,
+        file_path: Optional[str] = None,
+        status: Optional[str] = None,
+        phases: Optional[dict[str, float]] = None,
+    ):
+        self.day = day
+        self.part = part
+        self.answer = answer
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.error = error
+        self.stats = stats
+        self.file_path = file_path
+        self.status = status
+        self.phases = phases
+
+    def __repr__(self) -> str:
+        return f"RunResult(day={self.day}, part={self.part}, answer={self.answer})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the result as a JSON-serialisable dictionary, with the answer as text.
+        """
+        return {
+            "day": self.day,
+            "part": self.part,
+            "input": self.file_path,
+            "answer": None if self.answer is None else str(self.answer),
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "error": self.error,
+            "status": self.status,
+            "phases": self.phases,
+        }
+
+
+def get_solver(day: int, part: int) -> Callable:
+    """
+    Import the module of the given day and return the solver of the given part.
+    """
+
+    if not os.path.exists(os.path.join(SRC_DIR, f"day_{day}.py")):
+        raise ValueError(f"Day {day} module not found.")
+
+    module = __import__(f"day_{day}")
+    if part == 1:
+        return module.part_1
+    elif part == 2:
+        return module.part_2
+    else:
+        raise ValueError("Invalid part selected.")
+
+
+def get_parsed_solvers(day: int) -> Optional[ParsedSolvers]:
+    """
+    Return the `parse` function of the given day and the solvers of both parts
+    taking its result, or None when the day does not split its parsing out.
+    """
+
+    get_solver(day, 1)
+    module = sys.modules[f"day_{day}"]
+    if not hasattr(module, "parse"):
+        return None
+    return module.parse, module.solve_part_1, module.solve_part_2
+
+
+def input_path(day: int, test: bool = False) -> str:
+    """
+    Return the path of the input file of the given day.
+    """
+    return f"inputs/day_{day}_input" + ("_test" if test else "") + ".txt"
+
+
+def parse_range(value: str) -> list[int]:
+    """
+    Parse a list of integers such as "1-25" or "1,3,5-7".
+
+    >>> parse_range("1,3,5-7")
+    [1, 3, 5, 6, 7]
+    """
+    numbers: list[int] = []
+    for chunk in value.split(","):
+        if "-" in chunk:
+            start, end = chunk.split("-")
+            numbers.extend(range(int(start), int(end) + 1))
+        elif chunk.strip():
+            numbers.append(int(chunk))
+    return numbers
+
+
+def _measure(
+    day: int, part: int, file_path: str, solve: Callable[[], Any]
+) -> RunResult:
+    """
+    Call the solver and measure its wall and CPU time, along with the counters,
+    timers and phases of the instrumentation.
+
+    The output printed by the solver is discarded so that parallel runs do not
+    interleave on the terminal.
+    """
+
+    instrument.reset()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    answer, error = None, None
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            answer = solve()
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+
+    # draw the pending snapshots outside of the measured time, render is imported
+    # here as the thin client and the days that do not draw do not need it
+    import render
+
+    with instrument.phase("render"):
+        render.flush()
+
+    phases = instrument.get_phases()
+    # the time of the solver that is not spent importing or parsing is solving
+    solve_time = wall_time - phases.get("import", 0.0) - phases.get("parse", 0.0)
+    phases = {name: phases.get(name, 0.0) for name in PHASES} | {"solve": solve_time}
+
+    return RunResult(
+        day,
+        part,
+        answer,
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        error=error,
+        stats=instrument.get_stats(),
+        file_path=file_path,
+        phases=phases,
+    )
+
+
+def run_part(day: int, part: int, file_path: str) -> RunResult:
+    """
+    Run a single solver on its input file, see `_measure`.
+    """
+
+    def solve() -> Any:
+        with instrument.phase("import"):
+            solver = get_solver(day, part)
+        return solver(file_path)
+
+    return _measure(day, part, file_path, solve)
+
+
+def _run_parsed(day: int, part: int, file_path: str, data: Any = None) -> RunResult:
+    """
+    Run the solver of a part on the parsed input, which is the one inherited from
+    `run_both` when it is not given.
+    """
+    if data is None:
+        data = _PARSED
+    solvers = get_parsed_solvers(day)
+    if solvers is None:
+        raise ValueError(f"Day {day} has no parse function.")
+    solver = solvers[part]
+    return _measure(day, part, file_path, lambda: solver(data))
+
+
+def run_both(day: int, file_path: str) -> tuple[Optional[float], list[RunResult]]:
+    """
+    Parse the input once with the `parse` function of the day and run both parts
+    on it at the same time, in two worker processes. With fork, the workers inherit
+    the parsed input copy-on-write rather than receiving a pickled copy.
+
+    Days without `parse` run both parts at the same time, each reading the input.
+    Returns the parse time, None without `parse`, and the results of both parts.
+    """
+
+    global _PARSED
+
+    tasks = [(day, 1, file_path), (day, 2, file_path)]
+    solvers = get_parsed_solvers(day)
+    if solvers is None:
+        return None, run_many(tasks, jobs=2)
+
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = solvers[0](file_path)
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+        results = [
+            RunResult(day, part, None, 0.0, 0.0, error=error, file_path=file_path)
+            for _, part, _ in tasks
+        ]
+        return time.perf_counter() - start, results
+    parse_time = time.perf_counter() - start
+
+    # the workers are forked when the tasks are submitted, after the input is set
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if fork else None)
+    _PARSED = data
+    try:
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            futures = [
+                executor.submit(_run_parsed, *task, *([] if fork else [data]))
+                for task in tasks
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        _PARSED = None
+
+    for result in results:
+        # the parts share the parse of the parent
+        result.phases = (result.phases or {}) | {"parse": parse_time}
+    return parse_time, results
+
+
+def _memory_usage(pid: int) -> tuple[Optional[int], Optional[int]]:
+    """
+    Return the virtual memory size and the resident set size of a process in
+    bytes, or None when they cannot be read, as on other systems than Linux.
+    """
+    try:
+        with open(f"/proc/{pid}/statm", "r") as file:
+            size, resident = file.read().split()[:2]
+    except (OSError, ValueError):
+        return None, None
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    return int(size) * page_size, int(resident) * page_size
+
+
+def _exit_on_terminate(signum: int, frame: Any) -> None:
+    sys.exit(128 + signum)
+
+
+def _run_limited_child(
+    connection: Connection,
+    day: int,
+    part: int,
+    file_path: str,
+    timeout: Optional[float],
+    max_rss: Optional[int],
+) -> None:
+    """
+    Run a solver under resource limits and send its result to the parent.
+    The CPU time limit backs up the watchdog of the parent, and the address space
+    limit makes runaway allocations fail with a MemoryError before the watchdog
+    catches them.
+
+    SIGTERM exits the child through its exit handlers, which release the
+    multiprocessing resources of the solver, such as the semaphore of tqdm's lock,
+    rather than leaving them to the resource tracker.
+    """
+
+    signal.signal(signal.SIGTERM, _exit_on_terminate)
+
+    if timeout is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (math.ceil(timeout) + 1, hard))
+
+    if max_rss is not None:
+        size, _ = _memory_usage(os.getpid())
+        if size is not None:
+            _, hard = resource.getrlimit(resource.RLIMIT_AS)
+            limit = size + max_rss + ADDRESS_SPACE_HEADROOM
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+    connection.send(run_part(day, part, file_path))
+    connection.close()
+
+
+def run_limited(
+    day: int,
+    part: int,
+    file_path: str,
+    timeout: Optional[float] = None,
+    max_rss: Optional[int] = None,
+) -> RunResult:
+    """
+    Run a single solver in a child process under a wall time limit in seconds and
+    a memory limit in bytes. A watchdog kills the child as soon as it exceeds one of
+    them and the result gets the TIMEOUT or OOM status instead of an answer.
+    """
+
+    # forkserver rather than fork, as the limited runs are started from threads
+    context = multiprocessing.get_context("forkserver")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_run_limited_child,
+        args=(sender, day, part, file_path, timeout, max_rss),
+        daemon=True,
+    )
+
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+    pid = process.pid
+    assert pid is not None
+
+    result, status = None, None
+    while result is None and status is None:
+        if receiver.poll(WATCHDOG_INTERVAL):
+            try:
+                result = receiver.recv()
+            except EOFError:
+                # the child died without sending its result
+                break
+        elif not process.is_alive():
+            break
+        elif timeout is not None and time.perf_counter() - start > timeout:
+            status = TIMEOUT
+        elif max_rss is not None and (_memory_usage(pid)[1] or 0) > max_rss:
+            status = OOM
+
+    if process.is_alive():
+        process.terminate()
+        process.join(TERMINATE_GRACE)
+        if process.is_alive():
+            process.kill()
+    process.join()
+    exitcode = process.exitcode
+    process.close()
+    receiver.close()
+    wall_time = time.perf_counter() - start
+
+    if result is not None:
+        if result.error and result.error.startswith("MemoryError"):
+            result.status = OOM
+        return result
+
+    # without a result, the child was killed by the CPU time limit, or by the kernel
+    # when the system ran out of memory
+    if status is None and exitcode == -signal.SIGXCPU:
+        status = TIMEOUT
+    elif status is None and exitcode == -signal.SIGKILL:
+        status = OOM
+
+    if status == TIMEOUT:
+        error = f"Timed out after {timeout:.1f}s"
+    elif status == OOM:
+        error = f"Exceeded {max_rss / 1024**2:.0f} MB" if max_rss else "Out of memory"
+    else:
+        error = f"Exited with code {exitcode}"
+
+    return RunResult(
+        day,
+        part,
+        None,
+        wall_time=wall_time,
+        cpu_time=0.0,
+        error=error,
+        file_path=file_path,
+        status=status,
+    )
+
+
+def iter_many(
+    tasks: list[tuple[int, int, str]],
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_rss: Optional[int] = None,
+) -> Iterator[RunResult]:
+    """
+    Run the (day, part, file_path) tasks over a pool of processes.
+    The results are yielded as soon as they finish. Each worker imports the modules
+    once and keeps their caches across the tasks it runs.
+
+    With a timeout or a memory limit, each task runs in its own child process
+    under these limits instead, see `run_limited`.
+    """
+
+    executor: Executor
+    run: Callable[[int, int, str], RunResult]
+    if timeout is None and max_rss is None:
+        executor = ProcessPoolExecutor(max_workers=jobs or os.cpu_count())
+        run = run_part
+    else:
+        executor = ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+        run = functools.partial(run_limited, timeout=timeout, max_rss=max_rss)
+
+    with executor:
+        futures = [
+            executor.submit(run, day, part, file_path) for day, part, file_path in tasks
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_many(
+    tasks: list[tuple[int, int, str]],
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_rss: Optional[int] = None,
+) -> list[RunResult]:
+    """
+    Run the (day, part, file_path) tasks over a pool of processes.
+    The results are returned sorted by day and part.
+    """
+
+    results = iter_many(tasks, jobs, timeout, max_rss)
+    return sorted(results, key=lambda result: (result.day, result.part))
+
+
+def split_stored(
+    tasks: list[tuple[int, int, str]], store: AnswerStore
+) -> tuple[list[RunResult], list[tuple[int, int, str]]]:
+    """
+    Split the tasks between the results found in the answer store for the current
+    version of their solver and the tasks left to run.
+    """
+
+    cached, pending = [], []
+    for day, part, file_path in tasks:
+        stored = store.get(day, part, file_path)
+        if stored is None:
+            pending.append((day, part, file_path))
+            continue
+
+        answer, _ = stored
+        cached.append(
+            RunResult(
+                day,
+                part,
+                answer,
+                wall_time=0.0,
+                cpu_time=0.0,
+                file_path=file_path,
+                status=CACHED,
+            )
+        )
+
+    return cached, pending
+
+
+def store_results(
+    results: list[RunResult], store: AnswerStore, verify: bool = False
+) -> None:
+    """
+    Record the answers of the results that were computed. With `verify`, the
+    status of each result is set to OK, CHANGED or NEW against the store.
+    """
+
+    for result in results:
+        if result.status == CACHED or result.error or result.answer is None:
+            continue
+        assert result.file_path is not None
+
+        status = store.put(
+            result.day,
+            result.part,
+            result.file_path,
+            str(result.answer),
+            result.wall_time,
+        )
+        if verify:
+            result.status = status
+
+
+def format_table(results: list[RunResult]) -> str:
+    """
+    Format the results as a table with one row per day and part.
+    The status column is only shown when a result has a status.
+    """
+
+    header: tuple[str, ...] = ("Day", "Part", "Answer", "Wall (s)", "CPU (s)")
+    rows: list[tuple[str, ...]] = [
+        (
+            str(result.day),
+            str(result.part),
+            result.error if result.error else str(result.answer),
+            f"{result.wall_time:.3f}",
+            f"{result.cpu_time:.3f}",
+        )
+        for result in results
+    ]
+    if any(result.status for result in results):
+        header += ("Status",)
+        rows = [row + (result.status or "",) for row, result in zip(rows, results)]
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = [" | ".join(cell.ljust(width) for cell, width in zip(header, widths))]
+    lines.append("-+-".join("-" * width for width in widths))
+    for row in rows:
+        lines.append(" | ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+    return "\n".join(lines)
+
+
+def format_report(results: list[RunResult], report_format: str) -> str:
+    """
+    Format the results as JSON or CSV, one record per day and part with the time
+    of each phase of the solver, see `instrument.phase`.
+    """
+
+    records = []
+    for result in results:
+        record = result.to_dict()
+        phases = record.pop("phases") or {}
+        record.update({f"{name}_time": phases.get(name) for name in PHASES})
+        records.append(record)
+
+    if report_format == "json":
+        return json.dumps(records, indent=2)
+    if report_format != "csv":
+        raise ValueError(f"Unknown report format: {report_format}")
+
+    output = io.StringIO()
+    fields = list(records[0]) if records else []
+    writer = csv.DictWriter(output, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(records)
+    return output.getvalue().rstrip("\n")
+
+
+def format_stats_report(results: list[RunResult]) -> str:
+    """
+    Format the counters and timers of each day and part that recorded any.
+    """
+
+    sections = []
+    for result in results:
+        if result.stats and any(result.stats.values()):
+            stats = instrument.format_stats(result.stats)
+            sections.append(f"Day {result.day} part {result.part}:\n{stats}")
+
+    return "\n\n".join(sections)
+
+
+def profile_imports(day: int) -> tuple[float, list[tuple[str, float]]]:
+    """
+    Import the module of the given day in a fresh interpreter with `-X importtime`.
+    Returns the total import time and the time of each module it imports directly,
+    in seconds, heaviest first.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import day_{day}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # importtime prints a module after all of its dependencies, indented by two
+    # spaces per nesting level, so the direct imports of the day are the
+    # entries of depth 1 listed since the previous top-level import
+    children: list[tuple[str, float]] = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+
+        cumulative, depth, name = int(match[2]) / 1e6, len(match[3]) // 2, match[4]
+        if depth == 1:
+            children.append((name, cumulative))
+        elif depth == 0 and name == f"day_{day}":
+            return cumulative, sorted(children, key=lambda child: -child[1])
+        elif depth == 0:
+            children = []
+
+    raise ValueError(f"Day {day} module not found.")
+
+
+def format_import_profile(profiles: dict[int, tuple[float, list]], top: int = 3) -> str:
+    """
+    Format the import profiles as a table with one row per day.
+    """
+
+    lines = [f"{'Day':>3} | {'Import (s)':>10} | Heaviest direct imports"]
+    lines.append(f"{'-' * 3}-+-{'-' * 10}-+-{'-' * 23}")
+    for day, (total, children) in sorted(profiles.items()):
+        heaviest = ", ".join(f"{name} {time:.3f}s" for name, time in children[:top])
+        lines.append(f"{day:>3} | {total:>10.3f} | {heaviest}".rstrip())
+
+    return "\n".join(lines)
@@ -0,0 +1,267 @@
+"""
+Graph search kernels over integer states.
+
+The states are integers in `range(n_states)`, for example the cell ids of a
+`grid.Grid` or `cell * 4 + direction`. The graph is given by a function returning
+the neighbours of a state, or its `(neighbour, weight)` edges for the weighted
+searches. Every search returns a distance list and a predecessor list indexed by
+state, where `UNREACHED` marks the states that were not reached, instead of
+copying paths along the way. Use `reconstruct_path` to read a path back.
+
+    >>> neighbours = lambda state: [state + 1] if state < 4 else []
+    >>> distances, predecessors = bfs(5, [0], neighbours)
+    >>> distances[4], reconstruct_path(predecessors, 4)
+    (4, [0, 1, 2, 3, 4])
+"""
+
+import heapq
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+from instrument import count
+
+UNREACHED = -1
+
+Neighbours = Callable[[int], Iterable[int]]
+Edges = Callable[[int], Iterable[tuple[int, int]]]
+
+# (distance, state) entries of the heaps of Dijkstra's algorithm, and
+# (estimate, distance, state) entries of A*
+HeapEntry = tuple[int, int]
+AStarEntry = tuple[int, int, int]
+
+
+def bfs(
+    n_states: int,
+    sources: Iterable[int],
+    neighbours: Neighbours,
+    target: Optional[int] = None,
+) -> tuple[list[int], list[int]]:
+    """
+    Breadth-first search from one or several sources on an unweighted graph.
+    The search stops as soon as the target, if any, is reached.
+    """
+
+    distances = [UNREACHED] * n_states
+    predecessors = [UNREACHED] * n_states
+    queue: deque[int] = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+
+    if target is not None and distances[target] == 0:
+        return distances, predecessors
+
+    expanded = 0
+    while queue:
+        state = queue.popleft()
+        expanded += 1
+        distance = distances[state] + 1
+        for neighbour in neighbours(state):
+            if distances[neighbour] == UNREACHED:
+                distances[neighbour] = distance
+                predecessors[neighbour] = state
+                if neighbour == target:
+                    queue.clear()
+                    break
+                queue.append(neighbour)
+
+    count("nodes expanded", expanded)
+    return distances, predecessors
+
+
+def bfs_01(
+    n_states: int,
+    sources: Iterable[int],
+    edges: Edges,
+    target: Optional[int] = None,
+) -> tuple[list[int], list[int]]:
+    """
+    Shortest paths on a graph whose weights are 0 or 1, with a double-ended queue.
+    The search stops as soon as the target, if any, is settled.
+    """
+
+    distances = [UNREACHED] * n_states
+    predecessors = [UNREACHED] * n_states
+    settled = bytearray(n_states)
+    queue: deque[int] = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+
+    expanded = 0
+    while queue:
+        state = queue.popleft()
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if state == target:
+            break
+        expanded += 1
+
+        distance = distances[state]
+        for neighbour, weight in edges(state):
+            new_distance = distance + weight
+            old_distance = distances[neighbour]
+            if old_distance == UNREACHED or new_distance < old_distance:
+                distances[neighbour] = new_distance
+                predecessors[neighbour] = state
+                if weight == 0:
+                    queue.appendleft(neighbour)
+                else:
+                    queue.append(neighbour)
+
+    count("nodes expanded", expanded)
+    return distances, predecessors
+
+
+def dijkstra(
+    n_states: int,
+    sources: Iterable[int],
+    edges: Edges,
+    target: Optional[int] = None,
+) -> tuple[list[int], list[int]]:
+    """
+    Dijkstra's algorithm from one or several sources with non-negative weights.
+    The search stops as soon as the target, if any, is settled.
+    """
+
+    distances = [UNREACHED] * n_states
+    predecessors = [UNREACHED] * n_states
+    heap: list[HeapEntry] = []
+    for source in sources:
+        distances[source] = 0
+        heap.append((0, source))
+    heapq.heapify(heap)
+
+    expanded = 0
+    while heap:
+        distance, state = heapq.heappop(heap)
+        if distance > distances[state]:
+            # stale entry, the state was already settled with a shorter distance
+            continue
+        if state == target:
+            break
+        expanded += 1
+
+        for neighbour, weight in edges(state):
+            new_distance = distance + weight
+            old_distance = distances[neighbour]
+            if old_distance == UNREACHED or new_distance < old_distance:
+                distances[neighbour] = new_distance
+                predecessors[neighbour] = state
+                heapq.heappush(heap, (new_distance, neighbour))
+
+    count("nodes expanded", expanded)
+    return distances, predecessors
+
+
+def dijkstra_all_predecessors(
+    n_states: int,
+    sources: Iterable[int],
+    edges: Edges,
+    target: Optional[int] = None,
+) -> tuple[list[int], list[list[int]]]:
+    """
+    Dijkstra's algorithm keeping every predecessor that lies on a shortest path.
+    The search stops once every state as close as the target, if any, is settled.
+    """
+
+    distances = [UNREACHED] * n_states
+    predecessors: list[list[int]] = [[] for _ in range(n_states)]
+    heap: list[HeapEntry] = []
+    for source in sources:
+        distances[source] = 0
+        heap.append((0, source))
+    heapq.heapify(heap)
+
+    expanded = 0
+    while heap:
+        distance, state = heapq.heappop(heap)
+        if distance > distances[state]:
+            continue
+        if target is not None and UNREACHED < distances[target] < distance:
+            break
+        expanded += 1
+
+        for neighbour, weight in edges(state):
+            new_distance = distance + weight
+            old_distance = distances[neighbour]
+            if old_distance == UNREACHED or new_distance < old_distance:
+                distances[neighbour] = new_distance
+                predecessors[neighbour] = [state]
+                heapq.heappush(heap, (new_distance, neighbour))
+            elif new_distance == old_distance and state not in predecessors[neighbour]:
+                predecessors[neighbour].append(state)
+
+    count("nodes expanded", expanded)
+    return distances, predecessors
+
+
+def astar(
+    n_states: int,
+    source: int,
+    target: int,
+    edges: Edges,
+    heuristic: Callable[[int], int],
+) -> tuple[list[int], list[int]]:
+    """
+    A* search from the source to the target.
+    The heuristic must never overestimate the distance to the target.
+    """
+
+    distances = [UNREACHED] * n_states
+    predecessors = [UNREACHED] * n_states
+    distances[source] = 0
+    heap: list[AStarEntry] = [(heuristic(source), 0, source)]
+
+    expanded = 0
+    while heap:
+        _, distance, state = heapq.heappop(heap)
+        if distance > distances[state]:
+            continue
+        if state == target:
+            break
+        expanded += 1
+
+        for neighbour, weight in edges(state):
+            new_distance = distance + weight
+            old_distance = distances[neighbour]
+            if old_distance == UNREACHED or new_distance < old_distance:
+                distances[neighbour] = new_distance
+                predecessors[neighbour] = state
+                heapq.heappush(
+                    heap, (new_distance + heuristic(neighbour), new_distance, neighbour)
+                )
+
+    count("nodes expanded", expanded)
+    return distances, predecessors
+
+
+def reconstruct_path(predecessors: list[int], target: int) -> list[int]:
+    """
+    Return the states from the source to the target following the predecessors.
+    The path only holds the target when it is a source or was not reached.
+    """
+
+    path = [target]
+    while predecessors[path[-1]] != UNREACHED:
+        path.append(predecessors[path[-1]])
+    path.reverse()
+    return path
+
+
+def optimal_states(predecessors: list[list[int]], targets: Iterable[int]) -> set[int]:
+    """
+    Return the states lying on at least one shortest path to the targets, given the
+    predecessors of `dijkstra_all_predecessors`.
+    """
+
+    states = set(targets)
+    stack = list(states)
+    while stack:
+        for predecessor in predecessors[stack.pop()]:
+            if predecessor not in states:
+                states.add(predecessor)
+                stack.append(predecessor)
+    return states
@@ -0,0 +1,195 @@
+"""
+Warm solver daemon serving solve requests over a Unix socket.
+
+    python src/aoc.py --serve --jobs 4
+    python src/client.py --day 6 --part 2
+    python src/client.py --stop
+
+The daemon imports every day module once in each of its worker processes, so the
+requests do not pay for the interpreter start, the imports or the in-memory caches
+of the solvers again. The protocol is one JSON object per line in both directions:
+
+    {"id": 0, "day": 6, "part": 2, "input_path": "/abs/inputs/day_6_input.txt"}
+    {"id": 0, "day": 6, "part": 2, "answer": "1686", "wall_time": ..., ...}
+
+The requests of a connection are solved concurrently and each response is written
+as soon as it is ready, so the responses may come back in any order. Send
+`{"command": "shutdown"}` to stop the daemon.
+
+This module only imports the standard library at the top so that the client stays
+cheap to start.
+"""
+
+import functools
+import json
+import os
+import socket
+import socketserver
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Iterable, Optional
+
+SOCKET_PATH = os.environ.get("AOC_SOCKET", ".aoc_cache/aoc.sock")
+
+
+def _warm_up() -> None:
+    """
+    Import the module of every day in the worker process.
+    """
+    from runner import get_solver
+
+    for day in range(1, 26):
+        try:
+            get_solver(day, 1)
+        except ValueError:
+            continue
+
+
+def _solve(day: int, part: int, input_path: str) -> dict[str, Any]:
+    from runner import run_part
+
+    result = run_part(day, part, input_path)
+    return {**result.to_dict(), "stats": result.stats}
+
+
+class SolverHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server = self.server
+        assert isinstance(server, SolverServer)
+        write_lock = threading.Lock()
+        written: list[threading.Event] = []
+
+        def respond(response: dict[str, Any]) -> None:
+            with write_lock:
+                self.wfile.write((json.dumps(response) + "\n").encode())
+                self.wfile.flush()
+
+        def on_done(request_id: Any, event: threading.Event, future: Future) -> None:
+            try:
+                response = future.result()
+            except Exception as exception:
+                response = {"error": f"{type(exception).__name__}: {exception}"}
+            try:
+                respond({"id": request_id, **response})
+            finally:
+                event.set()
+
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request.get("command") == "shutdown":
+                    respond({"id": request.get("id"), "status": "shutting down"})
+                    # shutdown blocks until serve_forever returns, so call it from
+                    # another thread than the one serving the request
+                    threading.Thread(target=server.shutdown).start()
+                    break
+
+                future = server.executor.submit(
+                    _solve,
+                    int(request["day"]),
+                    int(request["part"]),
+                    request["input_path"],
+                )
+            except (ValueError, KeyError, TypeError) as exception:
+                respond({"error": f"Invalid request: {exception}"})
+                continue
+
+            event = threading.Event()
+            future.add_done_callback(
+                functools.partial(on_done, request.get("id"), event)
+            )
+            written.append(event)
+
+        # keep the connection open until every response has been written, the
+        # callbacks may still be running when the futures are done
+        for event in written:
+            event.wait()
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    jobs: int
+
+    def __init__(self, socket_path: str, jobs: Optional[int] = None) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.jobs = jobs or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.jobs, initializer=_warm_up)
+        super().__init__(socket_path, SolverHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+def is_running(socket_path: str = SOCKET_PATH) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def serve(socket_path: str = SOCKET_PATH, jobs: Optional[int] = None) -> None:
+    """
+    Serve the solve requests until a shutdown request is received.
+    """
+
+    if is_running(socket_path):
+        raise ValueError(f"A server is already listening on {socket_path}")
+    if os.path.exists(socket_path):
+        # left behind by a server that did not shut down cleanly
+        os.unlink(socket_path)
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+
+    with SolverServer(socket_path, jobs) as server:
+        # start the workers now rather than on the first request
+        wait([server.executor.submit(_warm_up) for _ in range(server.jobs)])
+        print(f"Serving on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def request(
+    tasks: Iterable[tuple[int, int, str]], socket_path: str = SOCKET_PATH
+) -> list[dict[str, Any]]:
+    """
+    Send the (day, part, input_path) tasks to the server over a single connection.
+    The responses are returned in the order of the tasks, with an error response for
+    the tasks the server did not answer.
+    """
+
+    tasks = list(tasks)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile("rwb") as stream:
+            for index, (day, part, input_path) in enumerate(tasks):
+                message = {
+                    "id": index,
+                    "day": day,
+                    "part": part,
+                    "input_path": os.path.abspath(input_path),
+                }
+                stream.write((json.dumps(message) + "\n").encode())
+            stream.flush()
+            client.shutdown(socket.SHUT_WR)
+
+            responses = [json.loads(line) for line in stream]
+
+    # the server cannot tell which task an invalid request was, so its error goes to
+    # the tasks left without a response
+    by_id = {response.get("id"): response for response in responses}
+    unanswered = by_id.pop(None, {"error": "No response from the server"})
+    return [by_id.get(index, unanswered) for index in range(len(tasks))]
+
+
+def shutdown(socket_path: str = SOCKET_PATH) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(b'{"command": "shutdown"}\n')
+        client.recv(1024)
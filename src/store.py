@@ -0,0 +1,160 @@
+"""
+Store of the answers of the solvers, keyed by their input and their version.
+
+The answers are kept in a SQLite database in `.aoc_cache/answers.sqlite`, with one
+row per day, part, SHA-256 of the input and version of the solver. The version of a
+solver is the hash of the source of its day module and of the modules of `src/` it
+imports, so that any change to the code a solver runs gives it a new version.
+
+    python src/aoc.py --all --use-cache    # answer from the store when possible
+    python src/aoc.py --all --verify       # recompute and compare with the store
+
+A verified answer is OK when it matches the last answer stored for the same input,
+CHANGED when it does not, and NEW when the input was never solved before.
+"""
+
+import ast
+import functools
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Optional
+
+from cache import file_digest
+
+STORE_PATH = ".aoc_cache/answers.sqlite"
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CACHED, OK, CHANGED, NEW = "CACHED", "OK", "CHANGED", "NEW"
+
+
+def _local_imports(module: str) -> set[str]:
+    """
+    Return the module and the modules of `src/` it imports, recursively.
+    """
+
+    modules, stack = set(), [module]
+    while stack:
+        name = stack.pop()
+        path = os.path.join(SRC_DIR, f"{name}.py")
+        if name in modules or not os.path.exists(path):
+            continue
+        modules.add(name)
+
+        with open(path, "r") as file:
+            tree = ast.parse(file.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                stack.extend(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                stack.append(node.module.split(".")[0])
+
+    return modules
+
+
+@functools.cache
+def solver_version(day: int) -> str:
+    """
+    Return the hash of the source of the module of the given day and of the local
+    modules it imports.
+    """
+
+    digest = hashlib.sha256()
+    for module in sorted(_local_imports(f"day_{day}")):
+        with open(os.path.join(SRC_DIR, f"{module}.py"), "rb") as file:
+            digest.update(module.encode() + b"\0" + file.read())
+    return digest.hexdigest()[:16]
+
+
+class AnswerStore:
+    path: str
+    connection: sqlite3.Connection
+
+    def __init__(self, path: str = STORE_PATH) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        with self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    day INTEGER NOT NULL,
+                    part INTEGER NOT NULL,
+                    input_digest TEXT NOT NULL,
+                    solver_version TEXT NOT NULL,
+                    answer TEXT NOT NULL,
+                    runtime REAL NOT NULL,
+                    recorded_at REAL NOT NULL,
+                    PRIMARY KEY (day, part, input_digest, solver_version)
+                )
+                """)
+
+    def __enter__(self) -> "AnswerStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def lookup(
+        self, day: int, part: int, input_digest: str, version: str
+    ) -> Optional[tuple[str, float]]:
+        """
+        Return the answer and runtime stored for this version of the solver.
+        """
+        return self.connection.execute(
+            "SELECT answer, runtime FROM answers WHERE day = ? AND part = ? "
+            "AND input_digest = ? AND solver_version = ?",
+            (day, part, input_digest, version),
+        ).fetchone()
+
+    def latest(self, day: int, part: int, input_digest: str) -> Optional[str]:
+        """
+        Return the answer stored last for this input, by any version of the solver.
+        """
+        row = self.connection.execute(
+            "SELECT answer FROM answers WHERE day = ? AND part = ? "
+            "AND input_digest = ? ORDER BY recorded_at DESC LIMIT 1",
+            (day, part, input_digest),
+        ).fetchone()
+        return row[0] if row else None
+
+    def record(
+        self,
+        day: int,
+        part: int,
+        input_digest: str,
+        version: str,
+        answer: str,
+        runtime: float,
+    ) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (day, part, input_digest, version, answer, runtime, time.time()),
+            )
+
+    def get(self, day: int, part: int, file_path: str) -> Optional[tuple[str, float]]:
+        """
+        Return the answer and runtime stored for the current version of the solver
+        on the given input.
+        """
+        return self.lookup(day, part, file_digest(file_path), solver_version(day))
+
+    def put(
+        self, day: int, part: int, file_path: str, answer: str, runtime: float
+    ) -> str:
+        """
+        Record the answer of the current version of the solver on the given input.
+        Returns OK, CHANGED or NEW against the answer stored last for this input.
+        """
+
+        input_digest = file_digest(file_path)
+        previous = self.latest(day, part, input_digest)
+        self.record(day, part, input_digest, solver_version(day), answer, runtime)
+
+        if previous is None:
+            return NEW
+        return OK if previous == answer else CHANGED
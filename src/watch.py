@@ -0,0 +1,104 @@
+"""
+Re-solve a day each time its input file changes.
+
+    python src/aoc.py --day 6 --part 2 --watch
+    python src/aoc.py --day 6 --scale 5000 --watch
+
+The day module stays imported between the runs, so the re-runs keep its memoized
+functions and the parse cache warm and only pay for the solvers. The input is polled
+for a new modification time or size, and the solvers only run again when the SHA-256
+of its content changed. The answers of an input already seen during the session,
+for example after undoing an edit, are printed again without re-running the solvers.
+"""
+
+import os
+import time
+from typing import Optional
+
+from cache import file_digest
+from runner import RunResult, format_stats_report, format_table, run_part
+from store import CACHED
+
+# how often the input file is checked for changes, in seconds
+POLL_INTERVAL = 0.2
+
+
+def _file_state(file_path: str) -> Optional[tuple[int, int]]:
+    """
+    Return the modification time and size of the file, or None while it is missing,
+    for example when an editor replaces it.
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def solve_parts(
+    day: int,
+    parts: list[int],
+    file_path: str,
+    digest: str,
+    seen: dict[tuple[str, int], RunResult],
+) -> list[RunResult]:
+    """
+    Run the parts on the input of the given digest, reusing the results of the
+    contents that were already solved.
+    """
+
+    results = []
+    for part in parts:
+        if (digest, part) in seen:
+            previous = seen[digest, part]
+            result = RunResult(
+                day,
+                part,
+                previous.answer,
+                wall_time=0.0,
+                cpu_time=0.0,
+                error=previous.error,
+                file_path=file_path,
+                status=CACHED,
+            )
+        else:
+            result = run_part(day, part, file_path)
+            seen[digest, part] = result
+        results.append(result)
+
+    return results
+
+
+def watch(
+    day: int,
+    parts: list[int],
+    file_path: str,
+    stats: bool = False,
+    interval: float = POLL_INTERVAL,
+) -> None:
+    """
+    Solve the parts of the day now and after every change of the input, until
+    interrupted.
+    """
+
+    seen: dict[tuple[str, int], RunResult] = {}
+    last_state, last_digest = None, None
+    print(f"Watching {file_path}, press Ctrl+C to stop.", flush=True)
+
+    try:
+        while True:
+            state = _file_state(file_path)
+            if state is not None and state != last_state:
+                last_state = state
+                digest = file_digest(file_path)
+                # a touch or a save without edits does not change the answers
+                if digest != last_digest:
+                    last_digest = digest
+                    results = solve_parts(day, parts, file_path, digest, seen)
+                    print(f"\n[{time.strftime('%H:%M:%S')}] {digest[:12]}")
+                    print(format_table(results), flush=True)
+                    if stats:
+                        print(f"\n{format_stats_report(results)}", flush=True)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
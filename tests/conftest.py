@@ -0,0 +1,23 @@
+import os
+import sys
+from typing import Iterator
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+# the day modules are imported as top-level modules, as when running src/aoc.py
+sys.path.insert(0, SRC_DIR)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def workdir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[str]:
+    """
+    Run the solvers in a temporary directory with the parse cache disabled, so that
+    the tests neither read nor leave behind `.aoc_cache` entries.
+    """
+    path = tmp_path_factory.mktemp("aoc")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(path)
+        monkeypatch.setenv("AOC_PARSE_CACHE", "0")
+        yield str(path)
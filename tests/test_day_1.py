@@ -0,0 +1,70 @@
+"""
+Day 1 answers of the external-memory mode and of the SimilarityIndex against the
+in-memory solvers.
+"""
+
+import pathlib
+import random
+
+import numpy as np
+import pytest
+
+import day_1
+from external import MAX_MEMORY_ENV, exceeds_memory
+from generators import generate
+
+
+@pytest.fixture(scope="module")
+def input_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    path = tmp_path_factory.mktemp("day_1") / "input.txt"
+    path.write_text(generate(1, 5000, seed=0))
+    return str(path)
+
+
+@pytest.mark.parametrize("budget", ["8K", "64K"])
+def test_external_memory(
+    monkeypatch: pytest.MonkeyPatch, input_path: str, budget: str
+) -> None:
+    expected = day_1.part_1(input_path), day_1.part_2(input_path)
+
+    monkeypatch.setenv(MAX_MEMORY_ENV, budget)
+    assert exceeds_memory(input_path)
+    assert (day_1.part_1(input_path), day_1.part_2(input_path)) == expected
+
+
+def test_external_memory_without_final_newline(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    path = tmp_path / "input.txt"
+    path.write_text(generate(1, 2000, seed=1).rstrip("\n"))
+    expected = day_1.part_1(str(path)), day_1.part_2(str(path))
+
+    monkeypatch.setenv(MAX_MEMORY_ENV, "8K")
+    assert (day_1.part_1(str(path)), day_1.part_2(str(path))) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_similarity_index(tmp_path: pathlib.Path, seed: int) -> None:
+    rng = random.Random(seed)
+    path = tmp_path / "input.txt"
+    path.write_text(generate(1, 200, seed=seed))
+
+    index = day_1.SimilarityIndex.from_file(str(path))
+    left_list, right_list = day_1.read_input(str(path))
+    left, right = left_list.tolist(), right_list.tolist()
+    assert (index.similarity, index.distance) == (
+        day_1.compute_similarity(left_list, right_list),
+        day_1.compute_distance(left_list, right_list),
+    )
+
+    # new pairs reuse the numbers of the lists, to match the existing occurrences
+    for _ in range(50):
+        pair = rng.choice(left + right), rng.choice(left + right + [rng.randint(1, 9)])
+        index.append(*pair)
+        left.append(pair[0])
+        right.append(pair[1])
+
+        left_list, right_list = np.sort(left), np.sort(right)
+        assert len(index) == len(left)
+        assert index.similarity == day_1.compute_similarity(left_list, right_list)
+        assert index.distance == day_1.compute_distance(left_list, right_list)
@@ -0,0 +1,69 @@
+"""
+Day 2 safety checks over the flat array of levels against the checks of one report.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+import day_2
+
+# reports of zero to two levels, steps on both sides of the bounds of one to three,
+# and reports whose boundary step with their neighbours would be unsafe
+EDGE_CASES = [
+    [],
+    [5],
+    [1, 2],
+    [2, 2],
+    [1, 5],
+    [4, 1],
+    [1, 4, 7],
+    [7, 4, 1],
+    [1, 5, 9],
+    [1, 1, 1],
+    [9, 10],
+    [],
+    [1, 2, 3, 10],
+    [10, 1, 2, 3],
+    [1, 2, 1, 2],
+    [],
+]
+
+
+def flatten(reports: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the levels and offsets of the reports, as returned by `read_levels`.
+    """
+    levels = np.array([level for report in reports for level in report], np.int64)
+    offsets = np.cumsum([0] + [len(report) for report in reports], dtype=np.int64)
+    return levels, offsets
+
+
+def random_reports(rng: random.Random, n_reports: int) -> list[list[int]]:
+    reports = []
+    for _ in range(n_reports):
+        report = [rng.randint(1, 20)]
+        for _ in range(rng.randint(0, 7)):
+            report.append(report[-1] + rng.randint(-4, 4))
+        reports.append(report[: rng.choice([0, 1, 2, len(report)])])
+    return reports
+
+
+def check(reports: list[list[int]]) -> None:
+    levels, offsets = flatten(reports)
+    assert day_2.safe_reports(levels, offsets).tolist() == [
+        day_2.is_safe(report) for report in reports
+    ]
+    assert day_2.safe_reports_with_dampener(levels, offsets).tolist() == [
+        day_2.is_safe_with_dampener(report) for report in reports
+    ]
+
+
+def test_edge_cases() -> None:
+    check(EDGE_CASES)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_reports(seed: int) -> None:
+    check(random_reports(random.Random(seed), 200))
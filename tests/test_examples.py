@@ -0,0 +1,91 @@
+"""
+Answers of every day on the example input given in the docstring of its module.
+"""
+
+import os
+
+import pytest
+
+from runner import get_solver
+
+INPUTS_DIR = os.path.join(os.path.dirname(__file__), "inputs")
+
+# answers given by the docstrings, compared as text like in the answer store, the
+# parts whose example uses another input than the one of part 1 are left out
+EXAMPLES = {
+    (1, 1): 11,
+    (1, 2): 31,
+    (2, 1): 2,
+    (2, 2): 4,
+    (3, 1): 161,
+    (3, 2): 48,
+    (4, 1): 18,
+    (4, 2): 9,
+    (5, 1): 143,
+    (5, 2): 123,
+    (6, 1): 41,
+    (6, 2): 6,
+    (7, 1): 3749,
+    (7, 2): 11387,
+    (8, 1): 14,
+    (8, 2): 34,
+    (9, 1): 1928,
+    (10, 1): 36,
+    (10, 2): 81,
+    (11, 1): 55312,
+    (12, 1): 1930,
+    (12, 2): 1206,
+    (13, 1): 480,
+    (14, 1): 12,
+    (15, 1): 10092,
+    (15, 2): 9021,
+    (16, 1): 7036,
+    (16, 2): 45,
+    # the solver joins the output of the program without commas
+    (17, 1): 4635635210,
+    (18, 1): 22,
+    # the solver returns the coordinates of the byte as a tuple
+    (18, 2): (6, 1),
+    (19, 1): 6,
+    (19, 2): 16,
+    (21, 1): 126384,
+    (22, 1): 37327623,
+    (23, 1): 7,
+    (23, 2): "co,de,ka,ta",
+    (24, 1): 2024,
+    (25, 1): 3,
+}
+
+# known wrong answers, strict so that a fix has to remove them from here
+KNOWN_FAILURES = {
+    (4, 1): "finds 22 matches instead of 18",
+    (4, 2): "finds no X-MAS",
+    (6, 1): "Guard.rotate_right looks up the directions by name and raises",
+    (6, 2): "Guard.rotate_right looks up the directions by name and raises",
+    (13, 1): "returns a numpy array instead of an integer",
+    (16, 1): "scores 8036 instead of 7036",
+    (18, 1): "simulates the 1024 bytes of the puzzle instead of the 12 of the example",
+}
+
+
+def example_cases() -> list:
+    return [
+        pytest.param(
+            day,
+            part,
+            answer,
+            id=f"day_{day}-part_{part}",
+            marks=(
+                [pytest.mark.xfail(reason=KNOWN_FAILURES[day, part], strict=True)]
+                if (day, part) in KNOWN_FAILURES
+                else []
+            ),
+        )
+        for (day, part), answer in EXAMPLES.items()
+    ]
+
+
+@pytest.mark.parametrize("day, part, expected", example_cases())
+def test_example(day: int, part: int, expected: object) -> None:
+    answer = get_solver(day, part)(os.path.join(INPUTS_DIR, f"day_{day}.txt"))
+    assert str(answer) == str(expected)
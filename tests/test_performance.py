@@ -0,0 +1,97 @@
+"""
+Wall-clock budgets of the solvers on fixed synthetic inputs.
+
+    python -m pytest -m perf
+
+The inputs are sized for the current solvers to take about a third of their budgets,
+so that the budgets fail on a change in complexity or a new cost in a hot loop, but
+not on a slower machine.
+"""
+
+import pytest
+
+from generators import generate
+from runner import run_part
+
+from .test_examples import KNOWN_FAILURES as WRONG_ANSWERS
+
+# day: (scale of the synthetic input, budget of part 1, budget of part 2) in seconds,
+# a budget of None skips the part
+BUDGETS = {
+    1: (1_000_000, 0.5, 0.5),
+    2: (250_000, 0.5, 0.5),
+    3: (250_000, 0.5, 0.5),
+    4: (2400, 0.5, 0.5),
+    5: (100, 0.5, 0.5),
+    6: (30, 0.5, 0.5),
+    7: (50, 0.5, 10.0),
+    8: (360, 0.5, 0.5),
+    9: (16_000, 0.5, 0.5),
+    10: (360, 0.5, 0.5),
+    11: (51_200, 0.5, 1.0),
+    12: (400, 0.5, 0.5),
+    13: (1200, 0.5, 0.5),
+    # part 2 looks for a picture that a random input does not draw
+    14: (10_000, 0.5, None),
+    15: (50, 0.5, 0.5),
+    16: (187, 0.5, 0.5),
+    # part 2 does not finish on inputs other than the example
+    17: (8, 0.5, None),
+    18: (2000, 0.5, 0.5),
+    19: (100, 0.5, 0.5),
+    20: (81, 0.5, 0.5),
+    21: (320_000, 0.5, 0.5),
+    22: (200, 0.5, 2.0),
+    23: (3200, 0.5, 0.5),
+    24: (200, 0.5, 0.5),
+    25: (1200, 0.5, 0.5),
+}
+
+# the known failures of the examples that raise, the others give a wrong answer in
+# their budget, which these tests do not check
+KNOWN_FAILURES = {key: WRONG_ANSWERS[key] for key in [(6, 1), (6, 2)]}
+
+
+def budget_cases() -> list:
+    cases = []
+    for day, (scale, *budgets) in BUDGETS.items():
+        for part, budget in enumerate(budgets, start=1):
+            if budget is None:
+                continue
+            marks = [pytest.mark.perf]
+            if (day, part) in KNOWN_FAILURES:
+                marks.append(
+                    pytest.mark.xfail(reason=KNOWN_FAILURES[day, part], strict=True)
+                )
+            cases.append(
+                pytest.param(
+                    day, part, scale, budget, id=f"day_{day}-part_{part}", marks=marks
+                )
+            )
+    return cases
+
+
+@pytest.fixture(scope="module")
+def synthetic_inputs(tmp_path_factory: pytest.TempPathFactory) -> dict[int, str]:
+    """
+    Write the synthetic input of every day, outside of the measured time.
+    """
+    directory = tmp_path_factory.mktemp("synthetic")
+    paths = {}
+    for day, (scale, *_) in BUDGETS.items():
+        paths[day] = str(directory / f"day_{day}_input_{scale}_0.txt")
+        with open(paths[day], "w") as file:
+            file.write(generate(day, scale, seed=0))
+    return paths
+
+
+@pytest.mark.parametrize("day, part, scale, budget", budget_cases())
+def test_budget(
+    synthetic_inputs: dict[int, str], day: int, part: int, scale: int, budget: float
+) -> None:
+    result = run_part(day, part, synthetic_inputs[day])
+    assert result.error is None, result.error
+    assert result.wall_time <= budget, (
+        f"Day {day} part {part} took {result.wall_time:.3f}s on a scale {scale} "
+        f"input, over its budget of {budget:.1f}s"
+    )